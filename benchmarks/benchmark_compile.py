@@ -0,0 +1,45 @@
+"""Compares interpreted Rules.evaluate against the compiled predicate from Rules.compile().
+
+Usage: python benchmarks/benchmark_compile.py [--iterations 100000]
+"""
+
+import argparse
+import timeit
+
+from ruleenginex.rules import Rules
+
+RULES = [
+    {"target": "method", "prop": "", "op": "EQUALS", "value": "POST"},
+    {"target": "path", "prop": "", "op": "REGEX", "value": r"^/api/v1/orders/\d+$"},
+    {"target": "headers", "prop": "Authorization", "op": "REGEX_CASE_INSENSITIVE", "value": "^bearer "},
+    {"target": "body", "prop": "order.status", "op": "EQUALS", "value": "open"},
+    {"target": "body", "prop": "order.coupon", "op": "NULL", "value": None, "invert": True},
+    {"target": "body", "prop": "order.lines", "op": "EMPTY_ARRAY", "value": None, "invert": True},
+]
+
+REQUEST = {
+    "method": "POST",
+    "path": "/api/v1/orders/1234",
+    "headers": {"Authorization": "Bearer token"},
+    "body": {"order": {"status": "open", "coupon": "SPRING", "lines": [{"sku": "A"}]}},
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rules = Rules(RULES)
+    predicate = rules.compile()
+    assert predicate(REQUEST) == rules.evaluate(REQUEST)
+
+    interpreted = timeit.timeit(lambda: rules.evaluate(REQUEST), number=args.iterations)
+    compiled = timeit.timeit(lambda: predicate(REQUEST), number=args.iterations)
+    for name, elapsed in (("interpreted", interpreted), ("compiled", compiled)):
+        print(f"{name:<12} {elapsed / args.iterations * 1e6:8.2f} us/eval")
+    print(f"speedup      {interpreted / compiled:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
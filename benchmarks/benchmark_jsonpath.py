@@ -0,0 +1,73 @@
+"""Compares materialized jsonpath_ng matching with the lazy extraction engine on a 100k-user body.
+
+Usage: python benchmarks/benchmark_jsonpath.py [--users 100000] [--repeat 5]
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from ruleenginex.pathx import compile_jsonpath
+from ruleenginex.rule import Rule
+
+
+def make_body(users: int) -> dict:
+    return {"users": [{"id": i, "name": f"user-{i}", "tags": ["a", "b"] if i % 2 else []} for i in range(users)]}
+
+
+def materialized(rule: Rule) -> Callable[[dict], bool]:
+    """The previous engine: every match wrapped in a DatumInContext and collected before the operator runs."""
+    expression = compile_jsonpath(rule.prop)
+
+    def evaluate(request_data: dict) -> bool:
+        results = [match.value for match in expression.find(request_data["body"])]
+        result = rule.operator.apply(results[0] if len(results) == 1 else results)
+        return not result if rule.invert else result
+
+    return evaluate
+
+
+def measure(evaluate: Callable[[dict], bool], request_data: dict, repeat: int) -> tuple[float, int, bool]:
+    """Returns the best time in seconds, the peak traced allocation in bytes and the result."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = evaluate(request_data)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    evaluate(request_data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    request_data = {"body": make_body(args.users)}
+    rules = {
+        "includes early hit": Rule("body", "$.users[*].id", "ARRAY_INCLUDES", 10),
+        "includes late hit": Rule("body", "$.users[*].id", "ARRAY_INCLUDES", args.users - 1),
+        "any of, no hit": Rule("body", "$.users[*].id", "ANY_OF", [-1, -2]),
+        "descendant ids not null": Rule("body", "$..id", "NULL", None, invert=True),
+        "tags not empty": Rule("body", "$.users[*].tags", "EMPTY_ARRAY", None, invert=True),
+        "equals first id": Rule("body", "$.users[0].id", "EQUALS", 0),
+    }
+
+    print(f"{'rule':<26} {'before ms':>10} {'after ms':>10} {'before MB':>10} {'after MB':>10}")
+    for label, rule in rules.items():
+        before = measure(materialized(rule), request_data, args.repeat)
+        after = measure(rule.evaluate, request_data, args.repeat)
+        assert before[2] == after[2], label
+        print(
+            f"{label:<26} {before[0] * 1e3:>10.2f} {after[0] * 1e3:>10.2f} "
+            f"{before[1] / 1e6:>10.2f} {after[1] / 1e6:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
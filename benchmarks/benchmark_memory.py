@@ -0,0 +1,56 @@
+"""Reports the memory cost per Rule when loading a large synthetic rulebook.
+
+Usage: python benchmarks/benchmark_memory.py [--scenarios 20000] [--rules-per-scenario 5]
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from ruleenginex.scenario import Scenario
+
+
+def make_definitions(scenarios: int, rules_per_scenario: int) -> list[dict]:
+    # Build every string at runtime so identical values start out as distinct objects, as they do after JSON parsing
+    def text(value: str) -> str:
+        return "".join(list(value))
+
+    definitions = []
+    for i in range(scenarios):
+        rules = [
+            {"target": text("method"), "prop": text(""), "op": "EQUALS", "value": text("POST")},
+            {"target": text("path"), "prop": text(""), "op": "EQUALS", "value": f"/api/v1/tenants/{i % 100}/orders"},
+            {"target": text("headers"), "prop": text("Authorization"), "op": "REGEX", "value": text("^Bearer ")},
+            {"target": text("body"), "prop": text("order.status"), "op": "EQUALS", "value": text("open")},
+            {"target": text("body"), "prop": text("order.total"), "op": "NULL", "value": None, "invert": True},
+        ]
+        definitions.append(
+            {"scenario_name": f"scenario-{i}", "rules": rules[:rules_per_scenario], "response": {"status": 200}}
+        )
+    return definitions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", type=int, default=20_000)
+    parser.add_argument("--rules-per-scenario", type=int, default=5, choices=range(1, 6))
+    args = parser.parse_args()
+
+    Scenario("warm-up", make_definitions(1, 5)[0]["rules"], {})  # populate the process-wide caches
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    definitions = make_definitions(args.scenarios, args.rules_per_scenario)
+    scenarios = [Scenario(**definition) for definition in definitions]
+    del definitions  # only what the scenarios retain is counted
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    rule_count = sum(len(scenario.rules.rules) for scenario in scenarios)
+    print(f"scenarios={len(scenarios)} rules={rule_count}")
+    print(f"retained={(after - before) / 1e6:.1f} MB  bytes/rule={(after - before) / rule_count:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Times a single ARRAY_INCLUDES rule over a large body, then Rules with 10, 100 and 1,000 rules.
+
+Usage: python benchmarks/benchmark_rules.py [--users 100000] [--repeat 5]
+
+For regression tracking against a stored baseline use the pytest-benchmark suite instead:
+``hatch run bench:compare``.
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+from datasets import make_request, make_rule_definitions, make_users_body
+
+from ruleenginex.rule import Rule
+from ruleenginex.rules import Rules
+
+
+def best_of(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_large_json(users: int, repeat: int):
+    large_data = {"body": make_users_body(users)}
+    rule = Rule(target="body", prop="$.users[*].id", op="ARRAY_INCLUDES", value=users // 2)
+    elapsed = best_of(lambda: rule.evaluate(large_data), repeat)
+    print(f"ARRAY_INCLUDES over {users:,} users: {elapsed * 1e3:.3f} ms, result {rule.evaluate(large_data)}")
+
+
+def benchmark_rule_sets(repeat: int):
+    request_data = make_request()
+    for size in (10, 100, 1000):
+        rules = Rules(make_rule_definitions(size))
+        predicate = rules.compile()
+        interpreted = best_of(lambda rules=rules: rules.evaluate(request_data), repeat)
+        compiled = best_of(lambda predicate=predicate: predicate(request_data), repeat)
+        print(f"Rules({size:>4}): evaluate {interpreted * 1e6:9.1f} us, compiled {compiled * 1e6:9.1f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    benchmark_large_json(args.users, args.repeat)
+    benchmark_rule_sets(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
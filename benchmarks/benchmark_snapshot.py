@@ -0,0 +1,58 @@
+"""Compares building a rulebook from JSON definitions with loading it from a binary snapshot.
+
+Usage: python benchmarks/benchmark_snapshot.py [--scenarios 100000]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from ruleenginex.scenario import Scenario
+from ruleenginex.snapshot import load_snapshot, save_snapshot
+
+
+def make_definitions(scenarios: int) -> list[dict]:
+    return [
+        {
+            "scenario_name": f"scenario-{i}",
+            "rules": [
+                {"target": "method", "prop": "", "op": "EQUALS", "value": "POST"},
+                {"target": "path", "prop": "", "op": "EQUALS", "value": f"/api/v1/tenants/{i % 100}/orders/{i}"},
+                {"target": "headers", "prop": "Authorization", "op": "REGEX", "value": "^Bearer "},
+                {"target": "body", "prop": "$.order.status", "op": "EQUALS", "value": "open"},
+            ],
+            "response": {"status": 200, "body": {"id": i}},
+        }
+        for i in range(scenarios)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "rulebook.json")
+        snapshot_path = os.path.join(tmp, "rulebook.snap")
+        with open(json_path, "w", encoding="utf-8") as fp:
+            json.dump(make_definitions(args.scenarios), fp)
+
+        start = time.perf_counter()
+        with open(json_path, encoding="utf-8") as fp:
+            scenarios = [Scenario(**definition) for definition in json.load(fp)]
+        from_json = time.perf_counter() - start
+
+        save_snapshot(scenarios, snapshot_path)
+        start = time.perf_counter()
+        loaded = load_snapshot(snapshot_path)
+        from_snapshot = time.perf_counter() - start
+
+        print(f"scenarios={len(loaded)} snapshot={os.path.getsize(snapshot_path) / 1e6:.1f} MB")
+        print(f"json={from_json:.3f}s  snapshot={from_snapshot:.3f}s  speedup={from_json / from_snapshot:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Shared fixtures for the pytest-benchmark suite, including peak-memory tracking against a stored baseline.
+
+Timing baselines are stored and compared by pytest-benchmark itself (``--benchmark-autosave``,
+``--benchmark-compare`` and ``--benchmark-compare-fail``); peak memory is compared here against
+``memory_baseline.json``, which is machine independent for a given Python version.
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+DEFAULT_MEMORY_BASELINE = Path(__file__).with_name("memory_baseline.json")
+
+# Peak bytes measured in this session, by test id
+_MEMORY_RESULTS: dict[str, int] = {}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("ruleenginex-benchmarks")
+    group.addoption("--memory-baseline", default=str(DEFAULT_MEMORY_BASELINE), help="Peak memory baseline file.")
+    group.addoption(
+        "--memory-threshold",
+        type=float,
+        default=0.10,
+        help="Fail when a peak exceeds its baseline by more than this fraction (default: 0.10).",
+    )
+    group.addoption("--save-memory-baseline", action="store_true", help="Rewrite the baseline from this run.")
+
+
+@pytest.fixture(scope="session")
+def memory_baseline(request) -> dict[str, Any]:
+    path = Path(request.config.getoption("--memory-baseline"))
+    if not path.exists():
+        return {}
+    baseline = json.loads(path.read_text(encoding="utf-8"))
+    # Allocation sizes change between interpreter versions, so only compare like with like
+    if baseline.get("python") != _python_version():
+        return {}
+    return baseline.get("peaks", {})
+
+
+@pytest.fixture
+def peak_memory(request, benchmark, memory_baseline) -> Callable[[Callable[[], Any]], int]:
+    """Returns a function that measures the peak traced allocation of a call and checks it against the baseline."""
+
+    def measure(func: Callable[[], Any]) -> int:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["peak_bytes"] = peak
+        _MEMORY_RESULTS[request.node.nodeid] = peak
+
+        baseline = memory_baseline.get(request.node.nodeid)
+        threshold = request.config.getoption("--memory-threshold")
+        if baseline and not request.config.getoption("--save-memory-baseline") and peak > baseline * (1 + threshold):
+            pytest.fail(f"Peak memory regressed: {peak} bytes vs baseline {baseline} (+{threshold:.0%} allowed)")
+        return peak
+
+    return measure
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if not config.getoption("--save-memory-baseline", default=False) or not _MEMORY_RESULTS:
+        return
+    path = Path(config.getoption("--memory-baseline"))
+    document = {"python": _python_version(), "peaks": dict(sorted(_MEMORY_RESULTS.items()))}
+    path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+
+def _python_version() -> str:
+    return f"{sys.version_info.major}.{sys.version_info.minor}"
@@ -0,0 +1,151 @@
+"""Deterministic synthetic data for the benchmark suite; every generator takes a seed."""
+
+import random
+from typing import Any
+
+DEFAULT_SEED = 1234
+
+METHODS = ("GET", "POST", "PUT", "DELETE")
+TARGET_PROPS = (("body", "user.id"), ("body", "user.role"), ("headers", "X-Tenant"), ("params", "page"))
+
+
+def make_users_body(users: int) -> dict[str, Any]:
+    """The README's large-body example: a list of users with ids, names and tags."""
+    return {"users": [{"id": i, "name": f"user-{i}", "tags": ["a", "b"] if i % 2 else []} for i in range(users)]}
+
+
+def make_request(seed: int = DEFAULT_SEED) -> dict[str, Any]:
+    """A request that every definition from ``make_rule_definitions`` with ``passing=True`` matches."""
+    rng = random.Random(seed)
+    return {
+        "method": "POST",
+        "path": f"/api/v1/tenants/{rng.randint(1, 50)}/orders",
+        "headers": {"X-Tenant": "acme", "Authorization": "Bearer token"},
+        "params": {"page": "1"},
+        "body": {
+            "user": {"id": 7, "role": "admin", "tags": ["beta", "staff"]},
+            "items": [{"sku": "A-1"}, {"sku": "B-2"}],
+        },
+    }
+
+
+def make_rule_definitions(count: int, seed: int = DEFAULT_SEED) -> list[dict[str, Any]]:
+    """Rules that all pass on ``make_request()``, so evaluation never short-circuits."""
+    rng = random.Random(seed)
+    templates = [
+        {"target": "method", "prop": "", "op": "EQUALS", "value": "POST"},
+        {"target": "body", "prop": "user.id", "op": "EQUALS", "value": 7},
+        {"target": "body", "prop": "$.user.role", "op": "IN", "value": ["admin", "owner"]},
+        {"target": "headers", "prop": "X-Tenant", "op": "REGEX", "value": "^ac"},
+        {"target": "body", "prop": "$.items[*].sku", "op": "ARRAY_INCLUDES", "value": "A-1"},
+        {"target": "body", "prop": "user.tags", "op": "EMPTY_ARRAY", "value": None, "invert": True},
+        {"target": "params", "prop": "page", "op": "NULL", "value": None, "invert": True},
+    ]
+    return [dict(rng.choice(templates)) for _ in range(count)]
+
+
+def make_scenario_definitions(count: int, seed: int = DEFAULT_SEED) -> list[dict[str, Any]]:
+    """Mock-server style scenarios: method and path equality plus a few body and header checks."""
+    rng = random.Random(seed)
+    definitions = []
+    for i in range(count):
+        rules = [
+            {"target": "method", "prop": "", "op": "EQUALS", "value": rng.choice(METHODS)},
+            {"target": "path", "prop": "", "op": "EQUALS", "value": f"/api/v1/resources/{i}"},
+        ]
+        target, prop = rng.choice(TARGET_PROPS)
+        rules.append({"target": target, "prop": prop, "op": "REGEX", "value": f"^{rng.randint(0, 9)}"})
+        if rng.random() < 0.3:
+            rules.append({"target": "body", "prop": "$.user.role", "op": "IN", "value": ["admin", "staff"]})
+        definitions.append({"scenario_name": f"scenario-{i}", "rules": rules, "response": {"status": 200, "id": i}})
+    return definitions
+
+
+def make_scenario_requests(count: int, scenarios: int, seed: int = DEFAULT_SEED) -> list[dict[str, Any]]:
+    """Requests addressed at random scenarios of ``make_scenario_definitions(scenarios)``."""
+    rng = random.Random(seed)
+    return [
+        {
+            "method": rng.choice(METHODS),
+            "path": f"/api/v1/resources/{rng.randrange(scenarios)}",
+            "headers": {"X-Tenant": str(rng.randint(0, 9))},
+            "params": {"page": str(rng.randint(0, 9))},
+            "body": {"user": {"id": str(rng.randint(0, 9)), "role": rng.choice(["admin", "guest"])}},
+        }
+        for _ in range(count)
+    ]
+
+
+def make_route_definitions(count: int, seed: int = DEFAULT_SEED) -> list[dict[str, Any]]:
+    """Scenarios routed by method equality and a path regex with a literal prefix."""
+    rng = random.Random(seed)
+    return [
+        {
+            "scenario_name": f"route-{i}",
+            "rules": [
+                {"target": "method", "prop": "", "op": "EQUALS", "value": rng.choice(METHODS)},
+                {"target": "path", "prop": "", "op": "REGEX", "value": rf"^/api/v1/resources/{i}/items/\d+$"},
+            ],
+            "response": {"status": 200, "id": i},
+        }
+        for i in range(count)
+    ]
+
+
+def make_route_requests(count: int, routes: int, seed: int = DEFAULT_SEED) -> list[dict[str, Any]]:
+    """Requests addressed at random routes of ``make_route_definitions(routes)``."""
+    rng = random.Random(seed)
+    return [
+        {"method": rng.choice(METHODS), "path": f"/api/v1/resources/{rng.randrange(routes)}/items/{rng.randint(1, 99)}"}
+        for _ in range(count)
+    ]
+
+
+def make_tier_definitions(count: int) -> list[dict[str, Any]]:
+    """Pricing tiers: one scenario per ``BETWEEN`` band of 100 units, all on the same path."""
+    return [
+        {
+            "scenario_name": f"tier-{i}",
+            "rules": [
+                {"target": "path", "prop": "", "op": "EQUALS", "value": "/price"},
+                {"target": "body", "prop": "quantity", "op": "BETWEEN", "value": [i * 100, i * 100 + 99]},
+            ],
+            "response": {"status": 200, "tier": i},
+        }
+        for i in range(count)
+    ]
+
+
+def make_tier_requests(count: int, tiers: int, seed: int = DEFAULT_SEED) -> list[dict[str, Any]]:
+    """Requests for quantities within the bands of ``make_tier_definitions(tiers)``."""
+    rng = random.Random(seed)
+    return [{"path": "/price", "body": {"quantity": rng.randrange(tiers * 100)}} for _ in range(count)]
+
+
+def make_shared_rule_definitions(count: int) -> list[dict[str, Any]]:
+    """Scenarios repeating the same method and Authorization rules, told apart by an unindexed tag rule."""
+    return [
+        {
+            "scenario_name": f"tagged-{i}",
+            "rules": [
+                {"target": "method", "prop": "", "op": "EQUALS", "value": "POST"},
+                {"target": "headers", "prop": "Authorization", "op": "REGEX", "value": "^Bearer [A-Za-z0-9._-]+$"},
+                {"target": "body", "prop": "$.tags[*]", "op": "ANY_OF", "value": [f"tag-{i}", f"tag-{i + 1}"]},
+            ],
+            "response": {"status": 200, "id": i},
+        }
+        for i in range(count)
+    ]
+
+
+def make_shared_rule_requests(count: int, scenarios: int, seed: int = DEFAULT_SEED) -> list[dict[str, Any]]:
+    """Authorized requests tagged for random scenarios of ``make_shared_rule_definitions(scenarios)``."""
+    rng = random.Random(seed)
+    return [
+        {
+            "method": "POST",
+            "headers": {"Authorization": f"Bearer token-{rng.randrange(1000)}"},
+            "body": {"tags": [f"tag-{rng.randrange(scenarios)}", "priority"]},
+        }
+        for _ in range(count)
+    ]
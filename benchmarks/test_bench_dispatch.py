@@ -0,0 +1,148 @@
+"""Scenario selection over 10,000 scenarios."""
+
+import json
+
+import pytest
+from datasets import (
+    make_route_definitions,
+    make_route_requests,
+    make_scenario_definitions,
+    make_scenario_requests,
+    make_shared_rule_definitions,
+    make_shared_rule_requests,
+    make_tier_definitions,
+    make_tier_requests,
+)
+
+from ruleenginex.decisions import DecisionCache
+from ruleenginex.dispatcher import Dispatcher
+from ruleenginex.interning import RulePool
+from ruleenginex.request import Headers, RequestView
+from ruleenginex.scenario import Scenario
+
+pytest.importorskip("pytest_benchmark")
+
+SCENARIOS = 10_000
+REQUESTS = 200
+
+
+@pytest.fixture(scope="module")
+def scenarios() -> list[Scenario]:
+    return [Scenario(**definition) for definition in make_scenario_definitions(SCENARIOS)]
+
+
+def test_dispatcher_match(benchmark, scenarios):
+    dispatcher = Dispatcher(scenarios)
+    requests = make_scenario_requests(REQUESTS, SCENARIOS)
+
+    def match_all_requests():
+        return sum(dispatcher.match(request_data) is not None for request_data in requests)
+
+    assert benchmark(match_all_requests) > 0
+
+
+def test_dispatcher_match_routes(benchmark):
+    """Path regex routes: only the regexes whose literal prefix matches the request path are tried."""
+    dispatcher = Dispatcher([Scenario(**definition) for definition in make_route_definitions(SCENARIOS)])
+    requests = make_route_requests(REQUESTS, SCENARIOS)
+
+    def match_all_requests():
+        return sum(dispatcher.match(request_data) is not None for request_data in requests)
+
+    assert benchmark(match_all_requests) > 0
+
+
+def test_dispatcher_match_tiers(benchmark):
+    """Numeric ranges: only the tiers whose band contains the quantity are tried."""
+    dispatcher = Dispatcher([Scenario(**definition) for definition in make_tier_definitions(SCENARIOS)])
+    requests = make_tier_requests(REQUESTS, SCENARIOS)
+
+    def match_all_requests():
+        return sum(dispatcher.match(request_data) is not None for request_data in requests)
+
+    assert benchmark(match_all_requests) == REQUESTS
+
+
+@pytest.mark.parametrize("pooled", [False, True], ids=["separate", "rule_pool"])
+def test_dispatcher_match_all_shared_rules(benchmark, pooled):
+    """Rules repeated across candidates: a RulePool evaluates each of them once per request."""
+    scenarios = [Scenario(**definition) for definition in make_shared_rule_definitions(1000)]
+    if pooled:
+        pool = RulePool()
+        scenarios = [pool.intern_scenario(scenario) for scenario in scenarios]
+    dispatcher = Dispatcher(scenarios)
+    requests = make_shared_rule_requests(REQUESTS, 1000)
+
+    def match_all_requests():
+        return sum(len(dispatcher.match_all(request_data)) for request_data in requests)
+
+    assert benchmark(match_all_requests) > 0
+
+
+@pytest.mark.parametrize("cached", [False, True], ids=["uncached", "decision_cache"])
+def test_repeated_requests(benchmark, cached):
+    """Load-test traffic repeating 20 distinct requests, against 1,000 scenarios no index can narrow down."""
+    scenarios = [
+        Scenario(
+            f"tenant-{i}",
+            [
+                {"target": "headers", "prop": "X-Tenant", "op": "REGEX", "value": f".*-{i}$"},
+                {"target": "body", "prop": "$.user.role", "op": "IN", "value": ["admin", "staff"]},
+            ],
+            {"status": 200},
+        )
+        for i in range(1000)
+    ]
+    dispatcher = Dispatcher(scenarios)
+    distinct = make_scenario_requests(20, SCENARIOS)
+    requests = [{**distinct[i % 20], "number": i} for i in range(REQUESTS)]
+    match = DecisionCache(dispatcher).match if cached else dispatcher.match
+
+    def match_all_requests():
+        return sum(match(request_data) is not None for request_data in requests)
+
+    assert benchmark(match_all_requests) >= 0
+
+
+def test_linear_scan(benchmark, scenarios):
+    """The baseline the dispatcher replaces: evaluate scenarios in order until one matches."""
+    requests = make_scenario_requests(REQUESTS // 20, SCENARIOS)
+
+    def match_all_requests():
+        return sum(any(scenario.evaluate(request_data) for scenario in scenarios) for request_data in requests)
+
+    benchmark(match_all_requests)
+
+
+def test_dispatcher_build(benchmark, scenarios, peak_memory):
+    dispatcher = benchmark(Dispatcher, scenarios)
+    assert len(dispatcher.scenarios) == SCENARIOS
+    peak_memory(lambda: Dispatcher(scenarios))
+
+
+@pytest.mark.parametrize("decoding", ["eager", "lazy"])
+def test_dispatcher_match_raw(benchmark, scenarios, decoding):
+    """Raw requests either parsed up front or wrapped in a RequestView that decodes only what rules read."""
+    dispatcher = Dispatcher(scenarios)
+    raw_requests = [
+        (
+            request_data["method"],
+            request_data["path"],
+            json.dumps({**request_data["body"], "payload": list(range(200))}).encode(),
+            [(name.encode(), value.encode()) for name, value in request_data["headers"].items()],
+        )
+        for request_data in make_scenario_requests(REQUESTS, SCENARIOS)
+    ]
+
+    def eager(method, path, body, headers):
+        return {"method": method, "path": path, "body": json.loads(body), "headers": Headers(headers)}
+
+    def lazy(method, path, body, headers):
+        return RequestView(method, path, body=body, headers=headers)
+
+    build = eager if decoding == "eager" else lazy
+
+    def match_all_requests():
+        return sum(dispatcher.match(build(*raw)) is not None for raw in raw_requests)
+
+    assert benchmark(match_all_requests) > 0
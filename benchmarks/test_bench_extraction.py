@@ -0,0 +1,57 @@
+"""Dot-path versus JSONPath extraction, and JSON Schema validation of an extracted value."""
+
+import pytest
+from datasets import make_request, make_users_body
+
+from ruleenginex.rule import Rule
+
+pytest.importorskip("pytest_benchmark")
+
+PATHS = {
+    "dot_path": "user.role",
+    "simple_jsonpath": "$.user.role",
+    "wildcard_jsonpath": "$.items[*].sku",
+    "descendant_jsonpath": "$..sku",
+}
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "users": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"id": {"type": "integer"}, "name": {"type": "string"}},
+                "required": ["id", "name"],
+            },
+        }
+    },
+}
+
+
+@pytest.mark.parametrize("prop", PATHS.values(), ids=PATHS.keys())
+def test_extract(benchmark, prop):
+    rule = Rule(target="body", prop=prop, op="NULL", value=None, invert=True)
+    request_data = make_request()
+    assert benchmark(rule.extract, request_data) is not None
+
+
+@pytest.mark.parametrize("prop", PATHS.values(), ids=PATHS.keys())
+def test_compiled_extractor(benchmark, prop):
+    extract = Rule(target="body", prop=prop, op="NULL", value=None, invert=True).compile_extractor()
+    assert benchmark(extract, make_request()) is not None
+
+
+@pytest.mark.parametrize("users", [10, 1000])
+def test_schema_validation(benchmark, users):
+    rule = Rule(target="body", prop="", op="VALID_JSON_SCHEMA", value=SCHEMA)
+    request_data = {"body": make_users_body(users)}
+    assert benchmark(rule.evaluate, request_data) is True
+
+
+def test_large_array_includes(benchmark, peak_memory):
+    """The README example: find one id among 100,000 users."""
+    rule = Rule(target="body", prop="$.users[*].id", op="ARRAY_INCLUDES", value=50000)
+    request_data = {"body": make_users_body(100_000)}
+    assert benchmark(rule.evaluate, request_data) is True
+    peak_memory(lambda: rule.evaluate(request_data))
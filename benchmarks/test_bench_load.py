@@ -0,0 +1,37 @@
+"""Rulebook load time and peak memory: from JSON definitions versus from a binary snapshot."""
+
+import json
+
+import pytest
+from datasets import make_scenario_definitions
+
+from ruleenginex.loader import load_scenarios
+from ruleenginex.snapshot import load_snapshot, save_snapshot
+
+pytest.importorskip("pytest_benchmark")
+
+SCENARIOS = 10_000
+
+
+@pytest.fixture(scope="module")
+def rulebook_files(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("rulebook")
+    json_path = directory / "scenarios.json"
+    json_path.write_text(json.dumps(make_scenario_definitions(SCENARIOS)), encoding="utf-8")
+    snapshot_path = directory / "scenarios.snap"
+    save_snapshot(load_scenarios(json_path), snapshot_path)
+    return json_path, snapshot_path
+
+
+def test_load_json(benchmark, rulebook_files, peak_memory):
+    json_path, _ = rulebook_files
+    scenarios = benchmark.pedantic(load_scenarios, args=(json_path,), rounds=3, iterations=1)
+    assert len(scenarios) == SCENARIOS
+    peak_memory(lambda: load_scenarios(json_path))
+
+
+def test_load_snapshot(benchmark, rulebook_files, peak_memory):
+    _, snapshot_path = rulebook_files
+    scenarios = benchmark.pedantic(load_snapshot, args=(snapshot_path,), rounds=5, iterations=1)
+    assert len(scenarios) == SCENARIOS
+    peak_memory(lambda: load_snapshot(snapshot_path))
@@ -0,0 +1,48 @@
+"""One benchmark per operator, applied to an already extracted value."""
+
+import pytest
+
+from ruleenginex.constants import OperatorEnum
+from ruleenginex.operatorx import OperatorEvaluator
+
+pytest.importorskip("pytest_benchmark")
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"id": {"type": "integer"}, "email": {"type": "string"}},
+    "required": ["id", "email"],
+}
+
+# operator -> (expected value, actual value); every case evaluates to True, and a new operator without one fails
+CASES = {
+    OperatorEnum.EQUALS: ("premium", "premium"),
+    OperatorEnum.REGEX: (r"^ORD-[0-9]+$", "ORD-123456"),
+    OperatorEnum.REGEX_CASE_INSENSITIVE: (r"^discount-\d+$", "DISCOUNT-1234"),
+    OperatorEnum.NULL: (None, None),
+    OperatorEnum.EMPTY_ARRAY: (None, []),
+    OperatorEnum.ARRAY_INCLUDES: (499, list(range(500))),
+    OperatorEnum.VALID_JSON_SCHEMA: (SCHEMA, {"id": 1, "email": "a@example.com"}),
+    OperatorEnum.IN: ([f"role-{i}" for i in range(100)], "role-99"),
+    OperatorEnum.ANY_OF: ([f"tag-{i}" for i in range(100)], ["x", "y", "tag-50"]),
+    OperatorEnum.ALL_OF: (["beta", "staff"], ["admin", "beta", "staff"]),
+    OperatorEnum.INTERSECTS: ([f"tag-{i}" for i in range(100)], "tag-7"),
+    OperatorEnum.GT: (1000, 1500),
+    OperatorEnum.GTE: (1000, 1000),
+    OperatorEnum.LT: (100, "42"),
+    OperatorEnum.LTE: (99.5, 99.5),
+    OperatorEnum.BETWEEN: ([500, 599], 503),
+}
+
+
+@pytest.mark.parametrize("operator", list(OperatorEnum), ids=lambda operator: operator.name)
+def test_apply(benchmark, operator):
+    expected_value, actual_value = CASES[operator]
+    evaluator = OperatorEvaluator(operator, expected_value)
+    assert benchmark(evaluator.apply, actual_value) is True
+
+
+@pytest.mark.parametrize("operator", list(OperatorEnum), ids=lambda operator: operator.name)
+def test_compiled(benchmark, operator):
+    expected_value, actual_value = CASES[operator]
+    test = OperatorEvaluator(operator, expected_value).compile()
+    assert benchmark(test, actual_value) is True
@@ -0,0 +1,30 @@
+"""Rules evaluation with 10, 100 and 1,000 rules, interpreted and compiled."""
+
+import pytest
+from datasets import make_request, make_rule_definitions
+
+from ruleenginex.rules import Rules
+
+pytest.importorskip("pytest_benchmark")
+
+SIZES = [10, 100, 1000]
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_evaluate(benchmark, size):
+    rules = Rules(make_rule_definitions(size))
+    assert benchmark(rules.evaluate, make_request()) is True
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_compiled(benchmark, size):
+    predicate = Rules(make_rule_definitions(size)).compile()
+    assert benchmark(predicate, make_request()) is True
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_construct(benchmark, size, peak_memory):
+    definitions = make_rule_definitions(size)
+    rules = benchmark(Rules, definitions)
+    assert len(rules.rules) == size
+    peak_memory(lambda: Rules(definitions))
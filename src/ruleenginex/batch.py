@@ -0,0 +1,26 @@
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+MASK_TYPECODE = "b"
+
+
+def as_sequence(records: Iterable[Any]) -> Sequence[Any]:
+    """Returns records as a sequence, materializing one-shot iterables once."""
+    return records if isinstance(records, Sequence) else list(records)
+
+
+def new_mask(size: int, fill: bool = True) -> array:  # noqa: FBT001, FBT002
+    """Returns a boolean mask of the given size with every entry set to fill.
+
+    Masks are ``array('b')`` of 0/1 bytes; ``numpy.frombuffer(mask, dtype=bool)`` gives a
+    zero-copy NumPy view when NumPy is available.
+    """
+    return array(MASK_TYPECODE, [int(fill)]) * size
+
+
+def to_mask(results: Iterable[Any], invert: bool = False) -> array:  # noqa: FBT001, FBT002
+    """Packs per-record results into a boolean mask, optionally inverting them."""
+    if invert:
+        return array(MASK_TYPECODE, [not result for result in results])
+    return array(MASK_TYPECODE, [bool(result) for result in results])
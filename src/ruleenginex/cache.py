@@ -0,0 +1,103 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """Snapshot of cache statistics."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """A thread-safe, bounded least-recently-used cache with hit/miss counters.
+
+    With ttl, entries expire ttl seconds after they were created, as measured by clock;
+    an expired entry counts as a miss and is dropped when next looked up.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None, clock: Callable[[], float] = time.monotonic):
+        if maxsize <= 0:
+            msg = "maxsize must be a positive integer"
+            raise ValueError(msg)
+        if ttl is not None and ttl <= 0:
+            msg = "ttl must be a positive number of seconds"
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        # key -> clock time it expires at, only tracked with a ttl
+        self._deadlines: dict[Hashable, float] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _expired(self, key: Hashable) -> bool:
+        """Drops key if its ttl has passed; the caller holds the lock."""
+        if self.ttl is None or self._deadlines.get(key, float("inf")) > self._clock():
+            return False
+        self._data.pop(key, None)
+        self._deadlines.pop(key, None)
+        return True
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Returns the cached value for key, building it with factory on a miss.
+
+        Exceptions raised by factory propagate and nothing is cached.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+            else:
+                if not self._expired(key):
+                    self._hits += 1
+                    self._data.move_to_end(key)
+                    return value
+                self._misses += 1
+
+        value = factory()
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if self.ttl is not None:
+                self._deadlines[key] = self._clock() + self.ttl
+            while len(self._data) > self.maxsize:
+                evicted, _ = self._data.popitem(last=False)
+                self._deadlines.pop(evicted, None)
+        return value
+
+    def discard(self, key: Hashable) -> None:
+        """Removes key from the cache if present."""
+        with self._lock:
+            self._data.pop(key, None)
+            self._deadlines.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes every entry and resets the counters."""
+        with self._lock:
+            self._data.clear()
+            self._deadlines.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """Returns the current hit/miss counters and size."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._data))
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data and not self._expired(key)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
@@ -0,0 +1,124 @@
+import argparse
+import json
+import sys
+from collections.abc import Sequence
+
+from ruleenginex.dispatcher import Dispatcher
+from ruleenginex.interning import RulePool
+from ruleenginex.loader import load_rules, load_scenarios
+from ruleenginex.metrics import MetricsRegistry, collecting_metrics
+from ruleenginex.stream import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CHUNK_SIZE,
+    FilterStats,
+    filter_stream,
+    iter_lines,
+    open_input,
+)
+
+
+def _filter(args: argparse.Namespace) -> int:
+    rules = load_rules(args.rules)
+    target = None if args.request else args.target
+    sink = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    totals = FilterStats()
+    try:
+        for path in args.inputs or ["-"]:
+            source = open_input(path)
+            try:
+                stats = filter_stream(
+                    rules, source, sink, target, chunk_size=args.chunk_size, batch_size=args.batch_size
+                )
+            finally:
+                if source is not sys.stdin.buffer:
+                    source.close()
+            totals.records += stats.records
+            totals.matched += stats.matched
+            totals.errors += stats.errors
+        sink.flush()
+    finally:
+        if sink is not sys.stdout.buffer:
+            sink.close()
+    if args.stats:
+        sys.stderr.write(f"{totals}\n")
+    return 0
+
+
+def _profile(args: argparse.Namespace) -> int:
+    dispatcher = Dispatcher(load_scenarios(args.scenarios))
+    source = open_input(args.requests)
+    with collecting_metrics(MetricsRegistry(sample_rate=args.sample_rate)) as registry:
+        try:
+            for line in iter_lines(source):
+                if line.strip():
+                    dispatcher.match(json.loads(line))
+        finally:
+            if source is not sys.stdin.buffer:
+                source.close()
+
+    if args.format == "json":
+        sys.stdout.write(registry.to_json() + "\n")
+    elif args.format == "prometheus":
+        sys.stdout.write(registry.to_prometheus())
+    else:
+        sys.stdout.write(f"{'total ms':>10} {'mean us':>9} {'count':>8} {'match %':>8} {'extract %':>9}  rule\n")
+        for stats in registry.top_rules(args.top):
+            extract_share = 100 * stats["extract_ns"] / stats["total_ns"] if stats["total_ns"] else 0.0
+            sys.stdout.write(
+                f"{stats['total_ns'] / 1e6:10.3f} {stats['mean_ns'] / 1e3:9.2f} {stats['count']:8d} "
+                f"{100 * stats['match_rate']:8.1f} {extract_share:9.1f}  {stats['label']} {stats['description']}\n"
+            )
+    return 0
+
+
+def _dedupe(args: argparse.Namespace) -> int:
+    pool = RulePool()
+    for scenario in load_scenarios(args.scenarios):
+        pool.intern_scenario(scenario)
+    sys.stdout.write(f"{pool.info()}\n")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the ``ruleenginex`` command-line parser."""
+    parser = argparse.ArgumentParser(
+        prog="ruleenginex", description="Evaluate RuleEngineX rules from the command line."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    filter_parser = subparsers.add_parser("filter", help="Write the NDJSON records that match every rule.")
+    filter_parser.add_argument("rules", help="JSON/YAML file with a list of rules, or a scenario with a 'rules' key.")
+    filter_parser.add_argument("inputs", nargs="*", help="NDJSON input files, optionally gzipped; '-' is stdin.")
+    filter_parser.add_argument("-o", "--output", default="-", help="Output file; defaults to stdout.")
+    filter_parser.add_argument("--target", default="body", help="Target each record is exposed as (default: body).")
+    filter_parser.add_argument("--request", action="store_true", help="Treat each record as the full request data.")
+    filter_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Read size in bytes.")
+    filter_parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Records per batch.")
+    filter_parser.add_argument("--stats", action="store_true", help="Print throughput statistics to stderr.")
+    filter_parser.set_defaults(handler=_filter)
+
+    profile_parser = subparsers.add_parser("profile", help="Replay recorded requests and report the slowest rules.")
+    profile_parser.add_argument("scenarios", help="JSON/YAML file with the scenarios to select between.")
+    profile_parser.add_argument("requests", help="NDJSON file of recorded request data, optionally gzipped.")
+    profile_parser.add_argument("--top", type=int, default=10, help="Number of rules to report (default: 10).")
+    profile_parser.add_argument("--sample-rate", type=float, default=1.0, help="Fraction of evaluations to time.")
+    profile_parser.add_argument("--format", choices=("table", "json", "prometheus"), default="table")
+    profile_parser.set_defaults(handler=_profile)
+
+    dedupe_parser = subparsers.add_parser(
+        "dedupe", help="Report the rules repeated across scenarios and the memory sharing them saves."
+    )
+    dedupe_parser.add_argument("scenarios", help="JSON/YAML file with the scenarios to inspect.")
+    dedupe_parser.set_defaults(handler=_dedupe)
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entry point for the ``ruleenginex`` console script."""
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,15 @@ class OperatorEnum(Enum):
     REGEX = auto()
     REGEX_CASE_INSENSITIVE = auto()
     VALID_JSON_SCHEMA = auto()
+    IN = auto()
+    ANY_OF = auto()
+    ALL_OF = auto()
+    INTERSECTS = auto()
+    GT = auto()
+    GTE = auto()
+    LT = auto()
+    LTE = auto()
+    BETWEEN = auto()
 
     def __str__(self):
         """Returns a user-friendly string representation of the OperatorEnum."""
@@ -26,6 +35,15 @@ TARGET_OPERATOR_MAP: dict[str, set[OperatorEnum]] = {
         OperatorEnum.EMPTY_ARRAY,
         OperatorEnum.ARRAY_INCLUDES,
         OperatorEnum.VALID_JSON_SCHEMA,
+        OperatorEnum.IN,
+        OperatorEnum.ANY_OF,
+        OperatorEnum.ALL_OF,
+        OperatorEnum.INTERSECTS,
+        OperatorEnum.GT,
+        OperatorEnum.GTE,
+        OperatorEnum.LT,
+        OperatorEnum.LTE,
+        OperatorEnum.BETWEEN,
     },
     "params": {
         OperatorEnum.EQUALS,
@@ -35,6 +53,15 @@ TARGET_OPERATOR_MAP: dict[str, set[OperatorEnum]] = {
         OperatorEnum.EMPTY_ARRAY,
         OperatorEnum.ARRAY_INCLUDES,
         OperatorEnum.VALID_JSON_SCHEMA,
+        OperatorEnum.IN,
+        OperatorEnum.ANY_OF,
+        OperatorEnum.ALL_OF,
+        OperatorEnum.INTERSECTS,
+        OperatorEnum.GT,
+        OperatorEnum.GTE,
+        OperatorEnum.LT,
+        OperatorEnum.LTE,
+        OperatorEnum.BETWEEN,
     },
     "headers": {
         OperatorEnum.EQUALS,
@@ -44,6 +71,15 @@ TARGET_OPERATOR_MAP: dict[str, set[OperatorEnum]] = {
         OperatorEnum.EMPTY_ARRAY,
         OperatorEnum.ARRAY_INCLUDES,
         OperatorEnum.VALID_JSON_SCHEMA,
+        OperatorEnum.IN,
+        OperatorEnum.ANY_OF,
+        OperatorEnum.ALL_OF,
+        OperatorEnum.INTERSECTS,
+        OperatorEnum.GT,
+        OperatorEnum.GTE,
+        OperatorEnum.LT,
+        OperatorEnum.LTE,
+        OperatorEnum.BETWEEN,
     },
     "route_params": {
         OperatorEnum.EQUALS,
@@ -51,10 +87,26 @@ TARGET_OPERATOR_MAP: dict[str, set[OperatorEnum]] = {
         OperatorEnum.REGEX_CASE_INSENSITIVE,
         OperatorEnum.NULL,
         OperatorEnum.VALID_JSON_SCHEMA,
+        OperatorEnum.IN,
+        OperatorEnum.GT,
+        OperatorEnum.GTE,
+        OperatorEnum.LT,
+        OperatorEnum.LTE,
+        OperatorEnum.BETWEEN,
+    },
+    "path": {OperatorEnum.EQUALS, OperatorEnum.REGEX, OperatorEnum.REGEX_CASE_INSENSITIVE, OperatorEnum.IN},
+    "method": {OperatorEnum.EQUALS, OperatorEnum.REGEX, OperatorEnum.REGEX_CASE_INSENSITIVE, OperatorEnum.IN},
+    "number": {
+        OperatorEnum.EQUALS,
+        OperatorEnum.REGEX,
+        OperatorEnum.REGEX_CASE_INSENSITIVE,
+        OperatorEnum.IN,
+        OperatorEnum.GT,
+        OperatorEnum.GTE,
+        OperatorEnum.LT,
+        OperatorEnum.LTE,
+        OperatorEnum.BETWEEN,
     },
-    "path": {OperatorEnum.EQUALS, OperatorEnum.REGEX, OperatorEnum.REGEX_CASE_INSENSITIVE},
-    "method": {OperatorEnum.EQUALS, OperatorEnum.REGEX, OperatorEnum.REGEX_CASE_INSENSITIVE},
-    "number": {OperatorEnum.EQUALS, OperatorEnum.REGEX, OperatorEnum.REGEX_CASE_INSENSITIVE},
     "global_variable": {
         OperatorEnum.EQUALS,
         OperatorEnum.REGEX,
@@ -63,6 +115,15 @@ TARGET_OPERATOR_MAP: dict[str, set[OperatorEnum]] = {
         OperatorEnum.EMPTY_ARRAY,
         OperatorEnum.ARRAY_INCLUDES,
         OperatorEnum.VALID_JSON_SCHEMA,
+        OperatorEnum.IN,
+        OperatorEnum.ANY_OF,
+        OperatorEnum.ALL_OF,
+        OperatorEnum.INTERSECTS,
+        OperatorEnum.GT,
+        OperatorEnum.GTE,
+        OperatorEnum.LT,
+        OperatorEnum.LTE,
+        OperatorEnum.BETWEEN,
     },
     "data_bucket": {
         OperatorEnum.EQUALS,
@@ -72,5 +133,66 @@ TARGET_OPERATOR_MAP: dict[str, set[OperatorEnum]] = {
         OperatorEnum.EMPTY_ARRAY,
         OperatorEnum.ARRAY_INCLUDES,
         OperatorEnum.VALID_JSON_SCHEMA,
+        OperatorEnum.IN,
+        OperatorEnum.ANY_OF,
+        OperatorEnum.ALL_OF,
+        OperatorEnum.INTERSECTS,
+        OperatorEnum.GT,
+        OperatorEnum.GTE,
+        OperatorEnum.LT,
+        OperatorEnum.LTE,
+        OperatorEnum.BETWEEN,
     },
 }
+
+# Relative cost estimates used to order rules and to decide which rules run off the event loop.
+OPERATOR_COSTS: dict[OperatorEnum, int] = {
+    OperatorEnum.EQUALS: 1,
+    OperatorEnum.NULL: 1,
+    OperatorEnum.EMPTY_ARRAY: 1,
+    OperatorEnum.ARRAY_INCLUDES: 2,
+    OperatorEnum.IN: 1,
+    OperatorEnum.ANY_OF: 2,
+    OperatorEnum.ALL_OF: 2,
+    OperatorEnum.INTERSECTS: 2,
+    OperatorEnum.GT: 1,
+    OperatorEnum.GTE: 1,
+    OperatorEnum.LT: 1,
+    OperatorEnum.LTE: 1,
+    OperatorEnum.BETWEEN: 1,
+    OperatorEnum.REGEX: 4,
+    OperatorEnum.REGEX_CASE_INSENSITIVE: 4,
+    OperatorEnum.VALID_JSON_SCHEMA: 20,
+}
+
+# Operators whose expected value is a collection of members, held as a frozenset for constant-time lookups.
+MEMBERSHIP_OPERATORS = frozenset({OperatorEnum.IN, OperatorEnum.ANY_OF, OperatorEnum.ALL_OF, OperatorEnum.INTERSECTS})
+
+# Operators comparing a number against a range, with their expected values coerced to numbers once.
+RANGE_OPERATORS = frozenset(
+    {OperatorEnum.GT, OperatorEnum.GTE, OperatorEnum.LT, OperatorEnum.LTE, OperatorEnum.BETWEEN}
+)
+
+# Operators that can decide from a prefix of a JSONPath's matches, so extraction stops as soon as they do.
+EARLY_EXIT_OPERATORS = frozenset(
+    {
+        OperatorEnum.ARRAY_INCLUDES,
+        OperatorEnum.ANY_OF,
+        OperatorEnum.ALL_OF,
+        OperatorEnum.INTERSECTS,
+        OperatorEnum.EQUALS,
+        OperatorEnum.NULL,
+        OperatorEnum.EMPTY_ARRAY,
+    }
+)
+
+# Extraction cost estimates: whole target, dot path, natively indexed JSONPath, other JSONPath without
+# wildcards, and JSONPath with wildcards, descent or filters.
+TARGET_LOOKUP_COST = 0
+OBJECT_PATH_COST = 1
+SIMPLE_JSONPATH_COST = 2
+JSONPATH_COST = 8
+JSONPATH_SCAN_COST = 30
+
+# Rules at or above this estimated cost are sent to an executor by the async evaluation API.
+DEFAULT_ASYNC_COST_THRESHOLD = 20
@@ -0,0 +1,180 @@
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any, NamedTuple
+
+from ruleenginex.cache import LRUCache
+from ruleenginex.dispatcher import Dispatcher
+from ruleenginex.interning import freeze
+from ruleenginex.rule import ExtractionContext, Rule
+from ruleenginex.rulebook import Rulebook
+from ruleenginex.scenario import Scenario
+
+DEFAULT_DECISION_CACHE_SIZE = 4096
+
+# Budget for one request's extracted values: one unit per scalar or container item, plus string lengths.
+DEFAULT_MAX_FINGERPRINT_SIZE = 4096
+
+
+class DecisionCacheInfo(NamedTuple):
+    """Snapshot of decision cache statistics."""
+
+    hits: int
+    misses: int
+    bypassed: int
+    invalidations: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of all lookups, bypassed ones included, answered from the cache."""
+        lookups = self.hits + self.misses + self.bypassed
+        return self.hits / lookups if lookups else 0.0
+
+
+# Extracts one (target, prop) of a request: ((target, prop), extractor)
+FieldExtractor = tuple[tuple[str, Any], Callable[[dict], Any]]
+
+
+class _Binding(NamedTuple):
+    """The dispatcher a cache is answering for, the extractors of its fields, and its generation."""
+
+    dispatcher: Dispatcher
+    extractors: tuple[FieldExtractor, ...]
+    generation: int
+
+
+def _field_extractors(dispatcher: Dispatcher) -> tuple[FieldExtractor, ...]:
+    """Returns one compiled extractor per (target, prop) read by any scenario."""
+    extractors: dict[tuple[str, Any], Rule] = {}
+    for scenario in dispatcher.scenarios:
+        for rule in scenario.rules.rules:
+            extractors.setdefault((rule.target, rule.prop), rule)
+    return tuple((key, rule.compile_extractor()) for key, rule in extractors.items())
+
+
+class DecisionCache:
+    """Memoizes scenario selection by a fingerprint of the request values the scenarios read.
+
+    Every (target, prop) referenced by any rule is collected once; a request's fingerprint
+    is the tuple of those extracted values, so requests that differ only in fields no rule
+    inspects share an entry. Results live in a bounded LRU with an optional ttl in seconds.
+    Extractions are shared with the evaluation that follows a miss, but every field is
+    extracted up front, including bodies a ``RequestView`` would otherwise leave undecoded.
+
+    A request whose values are unhashable objects, exceed max_fingerprint_size, or fail
+    to extract is evaluated directly and counted as bypassed. Given a Rulebook, the cache
+    follows its current version and drops every entry when a new version is published;
+    call ``invalidate`` after changing anything else the scenarios depend on.
+    """
+
+    def __init__(
+        self,
+        source: Dispatcher | Rulebook,
+        maxsize: int = DEFAULT_DECISION_CACHE_SIZE,
+        ttl: float | None = None,
+        max_fingerprint_size: int = DEFAULT_MAX_FINGERPRINT_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.source = source
+        self.max_fingerprint_size = max_fingerprint_size
+        self._cache = LRUCache(maxsize, ttl, clock)
+        self._lock = threading.Lock()
+        self._bypassed = 0
+        self._invalidations = 0
+        # Counters of the cache generations already dropped
+        self._retired_hits = 0
+        self._retired_misses = 0
+        dispatcher = self._source_dispatcher()
+        self._binding = _Binding(dispatcher, _field_extractors(dispatcher), 0)
+
+    def _source_dispatcher(self) -> Dispatcher:
+        return self.source.current.dispatcher if isinstance(self.source, Rulebook) else self.source
+
+    def _bound(self) -> _Binding:
+        """Returns the binding for the source's current dispatcher, rebinding after a rulebook change."""
+        binding = self._binding
+        dispatcher = self._source_dispatcher()
+        if dispatcher is binding.dispatcher:
+            return binding
+        with self._lock:
+            if self._binding.dispatcher is not dispatcher:
+                self._rebind(dispatcher)
+            return self._binding
+
+    def _rebind(self, dispatcher: Dispatcher):
+        # Entries carry their generation in the key, so results computed against the old
+        # dispatcher while this runs can never be served afterwards
+        self._binding = _Binding(dispatcher, _field_extractors(dispatcher), self._binding.generation + 1)
+        self._invalidations += 1
+        cache_info = self._cache.info()
+        self._retired_hits += cache_info.hits
+        self._retired_misses += cache_info.misses
+        self._cache.clear()
+
+    def invalidate(self):
+        """Drops every cached decision."""
+        with self._lock:
+            self._rebind(self._source_dispatcher())
+
+    def fingerprint(self, request_data: dict) -> Hashable | None:
+        """Returns the hashable projection of request_data the decision depends on, or None if it cannot be cached."""
+        return self._fingerprint(self._bound(), request_data, {})
+
+    def _fingerprint(self, binding: _Binding, request_data: dict, context: ExtractionContext) -> Hashable | None:
+        budget = self.max_fingerprint_size
+        values: list[Hashable] = []
+        try:
+            for key, extract in binding.extractors:
+                # Filled in like Rule.extract would, so evaluating a miss reuses every extraction
+                value = context[key] = extract(request_data)
+                if type(value) is str:
+                    budget -= len(value) + 1
+                    values.append(value)
+                else:
+                    frozen, budget = freeze(value, budget)
+                    values.append(frozen)
+        except Exception:
+            # Unsupported or oversized values, or a path that fails on this request; evaluation decides
+            return None
+        return tuple(values) if budget >= 0 else None
+
+    def _lookup(self, kind: str, request_data: dict, evaluate: Callable[[Dispatcher, ExtractionContext], Any]) -> Any:
+        binding = self._bound()
+        context: ExtractionContext = {}
+        fingerprint = self._fingerprint(binding, request_data, context)
+        if fingerprint is None:
+            with self._lock:
+                self._bypassed += 1
+            return evaluate(binding.dispatcher, context)
+        return self._cache.get_or_create(
+            (kind, binding.generation, fingerprint), lambda: evaluate(binding.dispatcher, context)
+        )
+
+    def match(self, request_data: dict) -> Scenario | None:
+        """Returns the first matching scenario, as ``Dispatcher.match`` would."""
+        return self._lookup("match", request_data, lambda dispatcher, context: dispatcher.match(request_data, context))
+
+    def match_all(self, request_data: dict) -> list[Scenario]:
+        """Returns every matching scenario, as ``Dispatcher.match_all`` would."""
+        return list(
+            self._lookup(
+                "match_all",
+                request_data,
+                lambda dispatcher, context: tuple(dispatcher.match_all(request_data, context)),
+            )
+        )
+
+    def info(self) -> DecisionCacheInfo:
+        """Returns hit, miss and bypass counters; see ``DecisionCacheInfo.hit_ratio``."""
+        cache_info = self._cache.info()
+        with self._lock:
+            return DecisionCacheInfo(
+                self._retired_hits + cache_info.hits,
+                self._retired_misses + cache_info.misses,
+                self._bypassed,
+                self._invalidations,
+                cache_info.maxsize,
+                cache_info.currsize,
+            )
@@ -0,0 +1,395 @@
+import asyncio
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from typing import Any, NamedTuple
+
+from ruleenginex.constants import DEFAULT_ASYNC_COST_THRESHOLD, OperatorEnum
+from ruleenginex.intervals import IntervalTree
+from ruleenginex.operatorx import REGEX_FLAGS, NumericRange, fold_case, literal_prefix, to_number
+from ruleenginex.rule import ExtractionContext, Rule
+from ruleenginex.scenario import Scenario
+
+IndexKey = tuple[str, Any]
+
+# (target, prop, ignore case) of the regex rules filed by literal prefix
+PrefixKey = tuple[str, Any, bool]
+
+# Shorter literal prefixes, such as a lone "/", would match nearly every request
+MIN_ROUTE_PREFIX_LENGTH = 2
+
+# Kinds of filing, in order of preference among equally selective ones
+_EQUALITY, _PREFIX, _RANGE = range(3)
+
+
+class _Filing(NamedTuple):
+    """Where a scenario can be filed: an equality value, a regex literal prefix, or a numeric range."""
+
+    key: Any  # IndexKey, or PrefixKey for prefixes
+    value: Any
+    rule: Rule
+    kind: int
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _is_indexable(rule: Rule) -> bool:
+    """Returns True if the rule is a plain equality check on a hashable value."""
+    if rule.operator.operator is not OperatorEnum.EQUALS or rule.invert:
+        return False
+    return _is_hashable(rule.operator.expected_value)
+
+
+def _index_key(rule: Rule) -> IndexKey:
+    return (rule.target, rule.prop)
+
+
+def _route_prefix(rule: Rule) -> tuple[PrefixKey, str] | None:
+    """Returns the prefix key and literal prefix every value matching a regex rule starts with, if useful."""
+    operator = rule.operator.operator
+    if operator not in REGEX_FLAGS or rule.invert:
+        return None
+    prefix, ignore_case = literal_prefix(rule.operator.expected_value, REGEX_FLAGS[operator])
+    if len(prefix) < MIN_ROUTE_PREFIX_LENGTH:
+        return None
+    return (rule.target, rule.prop, ignore_case), prefix
+
+
+def _numeric_range(rule: Rule) -> NumericRange | None:
+    return None if rule.invert else rule.operator.numeric_range
+
+
+def _filings(scenario: Scenario) -> list[_Filing]:
+    filings = []
+    for rule in scenario.rules.rules:
+        if _is_indexable(rule):
+            filings.append(_Filing(_index_key(rule), rule.operator.expected_value, rule, _EQUALITY))
+        elif (route := _route_prefix(rule)) is not None:
+            filings.append(_Filing(route[0], route[1], rule, _PREFIX))
+        elif (numeric_range := _numeric_range(rule)) is not None:
+            filings.append(_Filing(_index_key(rule), numeric_range, rule, _RANGE))
+    return filings
+
+
+def _filed_values(filings: list[_Filing]) -> set[tuple[int, Any, Any]]:
+    # A scenario counts once per (kind, key, value), however many duplicate rules it has
+    return {(filing.kind, filing.key, filing.value) for filing in filings}
+
+
+# Stands for a value the prefilter failed to extract
+_UNEXTRACTABLE = object()
+
+
+def _try_extract(rule: Rule, request_data: dict, context: ExtractionContext) -> Any:
+    """Extracts rule's value, or returns _UNEXTRACTABLE if that raises.
+
+    A linear scan only extracts what the scenarios it reaches read, so a failure here must
+    not fail the request; the scenarios filed under the value are kept and evaluating them
+    raises as it would without the index.
+    """
+    try:
+        return rule.extract(request_data, context)
+    except Exception:
+        return _UNEXTRACTABLE
+
+
+def _without(index: dict[Any, list[int]], value: Any, sequence: int) -> dict[Any, list[int]]:
+    """Returns a copy of index with sequence removed from value's bucket, dropping the bucket once empty."""
+    index = dict(index)
+    bucket = [other for other in index[value] if other != sequence]
+    if bucket:
+        index[value] = bucket
+    else:
+        del index[value]
+    return index
+
+
+class Dispatcher:
+    """Selects the scenarios matching a request without evaluating every scenario.
+
+    Each scenario is filed under one of its ``EQUALS`` rules in a hash index keyed by
+    (``target``, ``prop``) and expected value, or under the literal prefix of one of its
+    ``REGEX`` rules (``^/api/v1/users/`` for ``^/api/v1/users/\\d+$``) in a prefix index,
+    or under the range of one of its ``GT``, ``GTE``, ``LT``, ``LTE`` or ``BETWEEN`` rules
+    in an interval tree. A prefix index keeps one hash table per prefix length, so a lookup
+    costs one probe per distinct length however many routes share it; an interval tree finds
+    the ranges containing a number in O(log n). A request only evaluates the scenarios whose
+    indexed value, prefix or range matches, plus those that have no indexable rule, in
+    declaration order, so the results are identical to a linear scan.
+    """
+
+    def __init__(self, scenarios: Iterable[Scenario]):
+        # Sequence numbers give the declaration order and stay stable across ``replace``
+        self._scenarios: dict[int, Scenario] = dict(enumerate(scenarios))
+        self._sequences = {id(scenario): sequence for sequence, scenario in self._scenarios.items()}
+        self._next_sequence = len(self._scenarios)
+        self._build_indexes()
+
+    @property
+    def scenarios(self) -> list[Scenario]:
+        """The dispatched scenarios, in declaration order."""
+        return list(self._scenarios.values())
+
+    def _build_indexes(self):
+        """Files every scenario under its most selective equality value, regex prefix or range."""
+        filings = {sequence: _filings(scenario) for sequence, scenario in self._scenarios.items()}
+
+        self._value_counts: Counter = Counter()
+        for scenario_filings in filings.values():
+            self._value_counts.update(_filed_values(scenario_filings))
+
+        self._extractors: dict[IndexKey, Rule] = {}
+        self._indexes: dict[IndexKey, dict[Any, list[int]]] = {}
+        self._prefix_extractors: dict[PrefixKey, Rule] = {}
+        # key -> prefix length -> prefix -> sequences
+        self._prefixes: dict[PrefixKey, dict[int, dict[str, list[int]]]] = {}
+        self._range_extractors: dict[IndexKey, Rule] = {}
+        # key -> range -> sequences, and the interval tree over those buckets
+        self._ranges: dict[IndexKey, dict[NumericRange, list[int]]] = {}
+        self._range_trees: dict[IndexKey, IntervalTree] = {}
+        self._unindexed: set[int] = set()
+        # Where each scenario is filed, or None when unindexed
+        self._filed: dict[int, _Filing | None] = {}
+
+        # Popped as they are filed, so the unchosen filings are freed while the indexes grow
+        for sequence in list(filings):
+            self._file(sequence, filings.pop(sequence), copy=False)
+        for key in self._ranges:
+            self._plant(key)
+
+    def _choose(self, filings: list[_Filing]) -> _Filing:
+        """Picks the filing shared by the fewest scenarios, preferring equality, then longer prefixes, then ranges."""
+        return min(
+            filings,
+            key=lambda filing: (
+                self._value_counts[(filing.kind, filing.key, filing.value)],
+                filing.kind,
+                -len(filing.value) if filing.kind == _PREFIX else 0,
+            ),
+        )
+
+    def _hash_tables(self, kind: int) -> tuple[dict[IndexKey, Rule], dict[IndexKey, dict[Any, list[int]]]]:
+        """Returns the extractors and indexes holding equality values, or ranges."""
+        return (self._extractors, self._indexes) if kind == _EQUALITY else (self._range_extractors, self._ranges)
+
+    def _plant(self, key: IndexKey):
+        """Rebuilds the interval tree over one key's ranges, dropping it once they are gone."""
+        if key in self._ranges:
+            self._range_trees[key] = IntervalTree(self._ranges[key].items())
+        else:
+            self._range_trees.pop(key, None)
+
+    def _file(self, sequence: int, filings: list[_Filing], *, copy: bool):
+        """Files one scenario; with copy, touched indexes and buckets are copied rather than mutated."""
+        if not filings:
+            self._unindexed.add(sequence)
+            self._filed[sequence] = None
+            return
+        filing = self._choose(filings)
+        self._filed[sequence] = filing
+        if filing.kind == _PREFIX:
+            self._prefix_extractors.setdefault(filing.key, filing.rule)
+            by_length = self._prefixes.get(filing.key, {})
+            index = by_length.get(len(filing.value), {})
+            bucket = index.get(filing.value, [])
+            if copy:
+                by_length, index, bucket = dict(by_length), dict(index), list(bucket)
+            bucket.append(sequence)
+            index[filing.value] = bucket
+            by_length[len(filing.value)] = index
+            self._prefixes[filing.key] = by_length
+            return
+        extractors, indexes = self._hash_tables(filing.kind)
+        extractors.setdefault(filing.key, filing.rule)
+        index = indexes.get(filing.key, {})
+        bucket = index.get(filing.value, [])
+        if copy:
+            index, bucket = dict(index), list(bucket)
+        bucket.append(sequence)
+        index[filing.value] = bucket
+        indexes[filing.key] = index
+
+    def _unfile(self, sequence: int):
+        """Removes one scenario from the indexes, copying whatever it touches."""
+        filing = self._filed.pop(sequence)
+        if filing is None:
+            self._unindexed.discard(sequence)
+            return
+        if filing.kind == _PREFIX:
+            by_length = dict(self._prefixes[filing.key])
+            by_length[len(filing.value)] = _without(by_length[len(filing.value)], filing.value, sequence)
+            if not by_length[len(filing.value)]:
+                del by_length[len(filing.value)]
+            if by_length:
+                self._prefixes[filing.key] = by_length
+            else:
+                del self._prefixes[filing.key]
+                del self._prefix_extractors[filing.key]
+            return
+        extractors, indexes = self._hash_tables(filing.kind)
+        index = _without(indexes[filing.key], filing.value, sequence)
+        if index:
+            indexes[filing.key] = index
+        else:
+            del indexes[filing.key]
+            del extractors[filing.key]
+
+    def replace(self, old: Scenario | None, new: Scenario | None) -> "Dispatcher":
+        """Returns a dispatcher with old swapped for new, leaving this one untouched.
+
+        new takes old's place in declaration order; a None old appends new, a None new removes
+        old. Only the index buckets the two scenarios are filed under, and the interval trees
+        of their ranges, are rebuilt, so in-flight lookups on this dispatcher are unaffected.
+        """
+        clone = Dispatcher.__new__(Dispatcher)
+        clone._scenarios = dict(self._scenarios)
+        clone._sequences = dict(self._sequences)
+        clone._next_sequence = self._next_sequence
+        clone._value_counts = self._value_counts.copy()
+        clone._extractors = dict(self._extractors)
+        clone._indexes = dict(self._indexes)
+        clone._prefix_extractors = dict(self._prefix_extractors)
+        clone._prefixes = dict(self._prefixes)
+        clone._range_extractors = dict(self._range_extractors)
+        clone._ranges = dict(self._ranges)
+        clone._range_trees = dict(self._range_trees)
+        clone._unindexed = set(self._unindexed)
+        clone._filed = dict(self._filed)
+
+        touched = []
+        if old is None:
+            sequence = clone._next_sequence
+            clone._next_sequence += 1
+        else:
+            try:
+                sequence = clone._sequences.pop(id(old))
+            except KeyError as ke:
+                msg = f"Scenario {old.scenario_name!r} is not dispatched here"
+                raise ValueError(msg) from ke
+            touched.append(clone._filed[sequence])
+            clone._unfile(sequence)
+            clone._value_counts.subtract(_filed_values(_filings(old)))
+
+        if new is None:
+            del clone._scenarios[sequence]
+        else:
+            # Assigning to an existing sequence keeps its place in the dict's order
+            clone._scenarios[sequence] = new
+            clone._sequences[id(new)] = sequence
+            filings = _filings(new)
+            clone._value_counts.update(_filed_values(filings))
+            clone._file(sequence, filings, copy=True)
+            touched.append(clone._filed[sequence])
+        for filing in touched:
+            if filing is not None and filing.kind == _RANGE:
+                clone._plant(filing.key)
+        return clone
+
+    def _candidate_positions(self, request_data: dict, context: ExtractionContext) -> list[int]:
+        """Returns the sequence numbers of scenarios that may match, in declaration order."""
+        positions = set(self._unindexed)
+        for key, index in self._indexes.items():
+            actual_value = _try_extract(self._extractors[key], request_data, context)
+            if actual_value is not _UNEXTRACTABLE:
+                try:
+                    bucket = index.get(actual_value)
+                except TypeError:
+                    pass  # Unhashable values cannot be looked up
+                else:
+                    if bucket:
+                        positions.update(bucket)
+                    continue
+            # Keep every scenario in this index
+            for bucket in index.values():
+                positions.update(bucket)
+        for prefix_key, by_length in self._prefixes.items():
+            actual_value = _try_extract(self._prefix_extractors[prefix_key], request_data, context)
+            if actual_value is _UNEXTRACTABLE:
+                for index in by_length.values():
+                    for bucket in index.values():
+                        positions.update(bucket)
+                continue
+            # Regex operators match against str(value), so prefixes are compared with the same text
+            text = str(actual_value)
+            if prefix_key[2]:
+                text = fold_case(text)
+            for length, index in by_length.items():
+                bucket = index.get(text[:length])
+                if bucket:
+                    positions.update(bucket)
+        for key, tree in self._range_trees.items():
+            actual_value = _try_extract(self._range_extractors[key], request_data, context)
+            if actual_value is _UNEXTRACTABLE:
+                for bucket in self._ranges[key].values():
+                    positions.update(bucket)
+                continue
+            number = to_number(actual_value)
+            # Range operators never match what is not a number
+            if number is not None:
+                for bucket in tree.stab(number):
+                    positions.update(bucket)
+        return sorted(positions)
+
+    def candidates(self, request_data: dict, context: ExtractionContext | None = None) -> list[Scenario]:
+        """Returns the scenarios that survive the index prefilter, in declaration order."""
+        if context is None:
+            context = {}
+        scenarios = self._scenarios
+        return [scenarios[position] for position in self._candidate_positions(request_data, context)]
+
+    def match(self, request_data: dict, context: ExtractionContext | None = None) -> Scenario | None:
+        """Returns the first scenario, in declaration order, that matches the request."""
+        if context is None:
+            context = {}
+        for scenario in self.candidates(request_data, context):
+            if scenario.evaluate(request_data, context):
+                return scenario
+        return None
+
+    def match_all(self, request_data: dict, context: ExtractionContext | None = None) -> list[Scenario]:
+        """Returns every scenario that matches the request, in declaration order."""
+        if context is None:
+            context = {}
+        return [
+            scenario for scenario in self.candidates(request_data, context) if scenario.evaluate(request_data, context)
+        ]
+
+    async def amatch(
+        self,
+        request_data: dict,
+        executor: Executor | None = None,
+        cost_threshold: int = DEFAULT_ASYNC_COST_THRESHOLD,
+    ) -> Scenario | None:
+        """Async ``match``: candidates are evaluated one at a time, in declaration order.
+
+        A later candidate's expensive rules are only sent to the executor once every earlier
+        candidate has failed, so no more work is done than ``match`` would do.
+        """
+        context: ExtractionContext = {}
+        for scenario in self.candidates(request_data, context):
+            if await scenario.aevaluate(request_data, executor, cost_threshold, context):
+                return scenario
+        return None
+
+    async def amatch_all(
+        self,
+        request_data: dict,
+        executor: Executor | None = None,
+        cost_threshold: int = DEFAULT_ASYNC_COST_THRESHOLD,
+    ) -> list[Scenario]:
+        """Async ``match_all``: every candidate scenario is evaluated concurrently."""
+        context: ExtractionContext = {}
+        candidates = self.candidates(request_data, context)
+        results = await asyncio.gather(
+            *(scenario.aevaluate(request_data, executor, cost_threshold, context) for scenario in candidates)
+        )
+        return [scenario for scenario, matched in zip(candidates, results, strict=True) if matched]
+
+    def __len__(self) -> int:
+        return len(self._scenarios)
@@ -12,6 +12,27 @@ class RuleValidationError(Exception):
     """Base exception for rule validation errors."""
 
 
+class InvalidRegexError(RuleValidationError):
+    """Exception raised when a regex operator is given an invalid pattern."""
+
+    def __init__(self, pattern: object, reason: str):
+        super().__init__(f"Invalid regex pattern {pattern!r}: {reason}")
+
+
+class InvalidJsonSchemaError(RuleValidationError):
+    """Exception raised when VALID_JSON_SCHEMA is given a schema that fails its metaschema."""
+
+    def __init__(self, reason: str):
+        super().__init__(f"Invalid JSON schema: {reason}")
+
+
+class InvalidExpectedValueError(RuleValidationError):
+    """Exception raised when an operator is given an expected value of the wrong shape."""
+
+    def __init__(self, operator: object, reason: str):
+        super().__init__(f"Invalid expected value for {operator}: {reason}")
+
+
 class JsonPathParsingError(Exception):
     """Base exception for jsonpath validation errors."""
 
@@ -21,3 +42,7 @@ class InvalidTargetError(RuleValidationError):
 
     def __init__(self, target: str):
         super().__init__(f"Invalid target '{target}'. Must be one of: {', '.join(TARGET_OPERATOR_MAP.keys())}")
+
+
+class SnapshotError(Exception):
+    """Exception raised when a rulebook snapshot cannot be written or is corrupt, truncated or incompatible."""
@@ -0,0 +1,171 @@
+import sys
+import threading
+from collections.abc import Hashable
+from typing import Any, NamedTuple
+
+from ruleenginex.operatorx import MemberSet, OperatorEvaluator
+from ruleenginex.rule import Rule
+from ruleenginex.rules import Rules
+from ruleenginex.scenario import Scenario
+
+
+class FreezeError(Exception):
+    """A value is of an unsupported type or exceeds the size budget."""
+
+
+def freeze(value: Any, budget: int = sys.maxsize) -> tuple[Hashable, int]:
+    """Returns a hashable copy of value that equals another only if both evaluate identically, and the budget left.
+
+    Numbers that compare equal across types (True, 1 and 1.0) or print differently
+    (0.0 and -0.0) are told apart, since REGEX sees ``str(value)``.
+    """
+    kind = type(value)
+    if kind is str or kind is bytes:
+        budget -= len(value) + 1
+        frozen: Hashable = value
+    elif kind is int or value is None:
+        budget -= 1
+        frozen = value
+    elif kind is bool:
+        budget -= 1
+        frozen = (bool, value)
+    elif kind is float:
+        budget -= 1
+        frozen = (float, value.hex())
+    elif kind is list or kind is tuple:
+        items = []
+        for item in value:
+            frozen_item, budget = freeze(item, budget - 1)
+            items.append(frozen_item)
+        frozen = (kind, tuple(items))
+    elif kind is dict:
+        # Insertion order is kept: it shows in str(value)
+        pairs = []
+        for key, item in value.items():
+            frozen_key, budget = freeze(key, budget - 1)
+            frozen_item, budget = freeze(item, budget)
+            pairs.append((frozen_key, frozen_item))
+        frozen = (dict, tuple(pairs))
+    else:
+        raise FreezeError
+    if budget < 0:
+        raise FreezeError
+    return frozen, budget
+
+
+def _owned_size(obj: Any, seen: set[int]) -> int:
+    """Estimates the bytes held by obj and the containers it references, counting each object once.
+
+    Strings are interned, and compiled patterns, paths and schema validators come from
+    process-wide caches, so they are shared already and left out.
+    """
+    if obj is None or isinstance(obj, (bool, str, bytes)) or id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, (int, float)):
+        return sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(_owned_size(key, seen) + _owned_size(item, seen) for key, item in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sys.getsizeof(obj) + sum(_owned_size(item, seen) for item in obj)
+    if isinstance(obj, (Rule, OperatorEvaluator, MemberSet)):
+        return sys.getsizeof(obj) + sum(_owned_size(getattr(obj, slot, None), seen) for slot in obj.__slots__)
+    return 0
+
+
+class RulePoolInfo(NamedTuple):
+    """Snapshot of rule pool statistics."""
+
+    references: int
+    unique: int
+    bytes_saved: int
+
+    @property
+    def deduplicated(self) -> int:
+        """References served by a rule that another reference already pooled."""
+        return self.references - self.unique
+
+    def __str__(self):
+        return (
+            f"rules={self.references} unique={self.unique} deduplicated={self.deduplicated} "
+            f"bytes_saved={self.bytes_saved:,}"
+        )
+
+
+class _Entry:
+    __slots__ = ("footprint", "references", "rule")
+
+    def __init__(self, rule: Rule):
+        self.rule = rule
+        self.references = 1
+        self.footprint = _owned_size(rule, set())
+
+
+class RulePool:
+    """Interns structurally identical rules, so every scenario referencing one shares a single Rule.
+
+    Rules are identical when their ``target``, ``prop``, ``op``, ``value`` and ``invert`` are,
+    values being compared by type as well (1, 1.0 and True differ). A rule handed to more than
+    one scenario is marked ``shared``: its result is kept in the evaluation's context, so the
+    dispatcher evaluates it at most once per request however many candidates reference it.
+    Rules whose value cannot be frozen, e.g. a set, are left as they are.
+    """
+
+    def __init__(self):
+        self._entries: dict[Hashable, _Entry] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(rule: Rule) -> Hashable | None:
+        definition = (rule.target, rule.prop, rule.operator.operator.name, rule.operator.expected_value, rule.invert)
+        try:
+            return freeze(definition)[0]
+        except FreezeError:
+            return None
+
+    def intern(self, rule: Rule) -> Rule:
+        """Returns the pooled rule identical to rule, pooling rule itself if it is the first."""
+        key = self._key(rule)
+        if key is None:
+            return rule
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._entries[key] = _Entry(rule)
+                return rule
+            entry.references += 1
+            entry.rule.shared = True
+            return entry.rule
+
+    def intern_scenario(self, scenario: Scenario) -> Scenario:
+        """Points the scenario's rules at their pooled copies, in place, and returns it."""
+        rules = scenario.rules
+        pooled = [self.intern(rule) for rule in rules.rules]
+        if any(interned is not rule for interned, rule in zip(pooled, rules.rules, strict=True)):
+            scenario.rules = Rules.from_rules(pooled, rules.adaptive, rules.name)
+        return scenario
+
+    def release(self, scenario: Scenario):
+        """Drops the scenario's references; a rule no scenario references any more leaves the pool."""
+        for rule in scenario.rules.rules:
+            key = self._key(rule)
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None or entry.rule is not rule:
+                    continue
+                entry.references -= 1
+                if not entry.references:
+                    del self._entries[key]
+
+    def info(self) -> RulePoolInfo:
+        """Returns how many rule references were deduplicated and an estimate of the bytes that saved."""
+        with self._lock:
+            entries = list(self._entries.values())
+        return RulePoolInfo(
+            sum(entry.references for entry in entries),
+            len(entries),
+            sum((entry.references - 1) * entry.footprint for entry in entries),
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,72 @@
+from collections.abc import Iterable
+from typing import Any
+
+from ruleenginex.operatorx import NumericRange
+
+
+class _Node:
+    """The ranges containing center, sorted by low and by high, and the ranges either side of it."""
+
+    __slots__ = ("by_high", "by_low", "center", "left", "right")
+
+    def __init__(self, entries: list[tuple[NumericRange, Any]]):
+        endpoints = sorted(bound for numeric_range, _ in entries for bound in (numeric_range.low, numeric_range.high))
+        # An endpoint of some range, so at least that range stays here and each side gets at most half
+        self.center = center = endpoints[len(endpoints) // 2]
+        here, left, right = [], [], []
+        for entry in entries:
+            if entry[0].high < center:
+                left.append(entry)
+            elif entry[0].low > center:
+                right.append(entry)
+            else:
+                here.append(entry)
+        self.by_low = sorted(here, key=lambda entry: entry[0].low)
+        self.by_high = sorted(here, key=lambda entry: entry[0].high, reverse=True)
+        self.left = _Node(left) if left else None
+        self.right = _Node(right) if right else None
+
+
+class IntervalTree:
+    """A centered interval tree mapping numeric ranges to values.
+
+    ``stab`` returns the values of every range containing a number in O(log n + k) for k
+    results, rather than testing all n ranges. The tree is immutable; build a new one to
+    add or remove ranges.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, entries: Iterable[tuple[NumericRange, Any]] = ()):
+        entries = list(entries)
+        self._root = _Node(entries) if entries else None
+        self._size = len(entries)
+
+    def stab(self, number: int | float) -> list[Any]:
+        """Returns the values of the ranges containing number, in no particular order."""
+        found = []
+        node = self._root
+        while node is not None:
+            if number < node.center:
+                # Every range here reaches the center, so those starting at or below number contain it
+                for numeric_range, value in node.by_low:
+                    if numeric_range.low > number:
+                        break
+                    if numeric_range.contains(number):
+                        found.append(value)
+                node = node.left
+            elif number > node.center:
+                for numeric_range, value in node.by_high:
+                    if numeric_range.high < number:
+                        break
+                    if numeric_range.contains(number):
+                        found.append(value)
+                node = node.right
+            else:
+                # The center itself, or NaN: only the ranges here can contain it
+                found.extend(value for numeric_range, value in node.by_low if numeric_range.contains(number))
+                break
+        return found
+
+    def __len__(self) -> int:
+        return self._size
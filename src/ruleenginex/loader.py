@@ -0,0 +1,40 @@
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from ruleenginex.rules import Rules
+from ruleenginex.scenario import Scenario
+
+
+def load_document(path: str | Path) -> Any:
+    """Loads a JSON or YAML document from path; JSON is parsed as a YAML subset."""
+    with open(path, encoding="utf-8") as fp:
+        return yaml.safe_load(fp)
+
+
+def load_rules(path: str | Path) -> Rules:
+    """Loads a Rules collection from a list of rule dicts, or a scenario-shaped document with a "rules" key."""
+    document = load_document(path)
+    if isinstance(document, dict):
+        document = document.get("rules", [])
+    if not isinstance(document, list):
+        msg = f"Expected a list of rules in {path}"
+        raise ValueError(msg)
+    return Rules(document)
+
+
+def load_scenario_definitions(path: str | Path) -> list[dict]:
+    """Loads scenario dicts from a list, a document with a "scenarios" key, or a single scenario."""
+    document = load_document(path)
+    if isinstance(document, dict):
+        document = document["scenarios"] if "scenarios" in document else [document]
+    if not isinstance(document, list):
+        msg = f"Expected a list of scenarios in {path}"
+        raise ValueError(msg)
+    return document
+
+
+def load_scenarios(path: str | Path) -> list[Scenario]:
+    """Loads scenarios from a list of scenario dicts, a document with a "scenarios" key, or a single scenario."""
+    return [Scenario(**definition) for definition in load_scenario_definitions(path)]
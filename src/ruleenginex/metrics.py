@@ -0,0 +1,217 @@
+import json
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+# Upper bounds, in nanoseconds, of the evaluation latency histogram buckets.
+LATENCY_BUCKETS_NS = (1_000, 5_000, 10_000, 50_000, 100_000, 500_000, 1_000_000, 5_000_000, 10_000_000)
+
+NS_PER_SECOND = 1_000_000_000
+
+
+class EvaluationStats:
+    """Counters and a latency histogram for one rule or rule set."""
+
+    __slots__ = ("buckets", "count", "description", "extract_ns", "label", "matches", "operator_ns", "total_ns")
+
+    def __init__(self, label: str, description: str = ""):
+        self.label = label
+        self.description = description
+        self.count = 0
+        self.matches = 0
+        self.total_ns = 0
+        self.extract_ns = 0
+        self.operator_ns = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_NS) + 1)  # last bucket is +Inf
+
+    def observe(self, matched: bool, elapsed_ns: int, extract_ns: int = 0, operator_ns: int = 0):  # noqa: FBT001
+        """Records one sampled evaluation."""
+        self.count += 1
+        self.matches += bool(matched)
+        self.total_ns += elapsed_ns
+        self.extract_ns += extract_ns
+        self.operator_ns += operator_ns
+        for position, bound in enumerate(LATENCY_BUCKETS_NS):
+            if elapsed_ns <= bound:
+                self.buckets[position] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    @property
+    def match_rate(self) -> float:
+        return self.matches / self.count if self.count else 0.0
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the counters as plain JSON-serializable values."""
+        return {
+            "label": self.label,
+            "description": self.description,
+            "count": self.count,
+            "matches": self.matches,
+            "match_rate": self.match_rate,
+            "total_ns": self.total_ns,
+            "mean_ns": self.mean_ns,
+            "extract_ns": self.extract_ns,
+            "operator_ns": self.operator_ns,
+            "histogram": dict(zip([*map(str, LATENCY_BUCKETS_NS), "+Inf"], self.buckets, strict=True)),
+        }
+
+
+class MetricsRegistry:
+    """Collects per-rule and per-rule-set evaluation metrics.
+
+    With sample_rate below 1, only every ``round(1 / sample_rate)``-th evaluation is timed,
+    which keeps the overhead low enough to leave enabled in production; counts then cover
+    sampled evaluations only.
+
+    Metrics are kept by label, not by object: a rule is labelled by the scenario declaring it
+    and its index there (``"Create order[1]"``), a rule set by its name. Identical labels share
+    one series, so reloading a scenario continues its series and retired rules are not kept alive.
+    """
+
+    def __init__(self, sample_rate: float = 1.0):
+        if not 0 < sample_rate <= 1:
+            msg = "sample_rate must be in (0, 1]"
+            raise ValueError(msg)
+        self.sample_rate = sample_rate
+        self._sample_every = max(1, round(1 / sample_rate))
+        self._ticks = {"rule": 0, "rule_set": 0}
+        self._lock = threading.Lock()
+        self._rules: dict[str, EvaluationStats] = {}
+        self._rule_sets: dict[str, EvaluationStats] = {}
+
+    def sample(self, scope: str = "rule") -> bool:
+        """Returns True if the current evaluation in scope ("rule" or "rule_set") should be measured."""
+        self._ticks[scope] += 1
+        return self._ticks[scope] % self._sample_every == 0
+
+    def _stats(self, table: dict[str, EvaluationStats], label: str, description: str = "") -> EvaluationStats:
+        with self._lock:
+            return table.setdefault(label, EvaluationStats(label, description))
+
+    def observe_rule(self, rule: Any, matched: bool, extract_ns: int, operator_ns: int):  # noqa: FBT001
+        """Records one sampled rule evaluation, split into extraction and operator time.
+
+        A rule no named rule set labelled is recorded under its definition.
+        """
+        description = repr(rule)
+        label = rule.label or description
+        stats = self._rules.get(label) or self._stats(self._rules, label, description)
+        stats.observe(matched, extract_ns + operator_ns, extract_ns, operator_ns)
+
+    def observe_rule_set(self, label: str, matched: bool, elapsed_ns: int):  # noqa: FBT001
+        """Records one sampled evaluation of a rule set, such as a scenario."""
+        stats = self._rule_sets.get(label) or self._stats(self._rule_sets, label)
+        stats.observe(matched, elapsed_ns)
+
+    def reset(self):
+        """Drops every collected metric."""
+        with self._lock:
+            self._rules.clear()
+            self._rule_sets.clear()
+            self._ticks = {"rule": 0, "rule_set": 0}
+
+    def snapshot(self) -> dict[str, list[dict[str, Any]]]:
+        """Returns a point-in-time copy of every metric."""
+        with self._lock:
+            rules = [stats.to_dict() for stats in self._rules.values()]
+            rule_sets = [stats.to_dict() for stats in self._rule_sets.values()]
+        return {"rules": rules, "rule_sets": rule_sets}
+
+    def top_rules(self, n: int = 10, key: str = "total_ns") -> list[dict[str, Any]]:
+        """Returns the n rules with the highest value for key, e.g. total_ns or mean_ns."""
+        return sorted(self.snapshot()["rules"], key=lambda stats: stats[key], reverse=True)[:n]
+
+    def to_json(self) -> str:
+        """Exports the snapshot as JSON."""
+        return json.dumps(self.snapshot())
+
+    def to_prometheus(self) -> str:
+        """Exports the snapshot in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines: list[str] = []
+        for scope, label_name in (("rules", "rule"), ("rule_sets", "rule_set")):
+            prefix = f"ruleenginex_{label_name}"
+            series = snapshot[scope]
+            counters = [
+                ("evaluations_total", "Sampled evaluations.", "count", 1),
+                ("matches_total", "Sampled evaluations that matched.", "matches", 1),
+            ]
+            if scope == "rules":
+                counters += [
+                    ("extract_seconds_total", "Time spent extracting values.", "extract_ns", NS_PER_SECOND),
+                    ("operator_seconds_total", "Time spent in operators.", "operator_ns", NS_PER_SECOND),
+                ]
+            for suffix, help_text, field, scale in counters:
+                samples = [(stats["label"], stats[field] if scale == 1 else stats[field] / scale) for stats in series]
+                lines.extend(_counter(f"{prefix}_{suffix}", help_text, label_name, samples))
+            lines.extend(_histogram(f"{prefix}_duration_seconds", "Evaluation latency.", label_name, series))
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _counter(name: str, help_text: str, label_name: str, samples: list[tuple[str, float]]) -> list[str]:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+    lines.extend(f'{name}{{{label_name}="{_escape(label)}"}} {value}' for label, value in samples)
+    return lines
+
+
+def _histogram(name: str, help_text: str, label_name: str, series: list[dict]) -> list[str]:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for stats in series:
+        label = f'{label_name}="{_escape(stats["label"])}"'
+        cumulative = 0
+        for bound, count in stats["histogram"].items():
+            cumulative += count
+            le = bound if bound == "+Inf" else str(int(bound) / NS_PER_SECOND)
+            lines.append(f'{name}_bucket{{{label},le="{le}"}} {cumulative}')
+        lines.append(f"{name}_sum{{{label}}} {stats['total_ns'] / NS_PER_SECOND}")
+        lines.append(f"{name}_count{{{label}}} {stats['count']}")
+    return lines
+
+
+class _MetricsState:
+    __slots__ = ("registry",)
+
+    def __init__(self):
+        self.registry: MetricsRegistry | None = None
+
+
+# The active registry; evaluation only pays an attribute check while this is None.
+STATE = _MetricsState()
+
+
+def enable_metrics(registry: MetricsRegistry | None = None) -> MetricsRegistry:
+    """Activates metrics collection process-wide and returns the active registry."""
+    STATE.registry = registry if registry is not None else MetricsRegistry()
+    return STATE.registry
+
+
+def disable_metrics():
+    """Deactivates metrics collection."""
+    STATE.registry = None
+
+
+def active_registry() -> MetricsRegistry | None:
+    """Returns the active registry, or None when metrics are off."""
+    return STATE.registry
+
+
+@contextmanager
+def collecting_metrics(registry: MetricsRegistry | None = None) -> Iterator[MetricsRegistry]:
+    """Collects metrics for every evaluation inside the block, restoring the previous registry afterwards."""
+    previous = STATE.registry
+    active = enable_metrics(registry)
+    try:
+        yield active
+    finally:
+        STATE.registry = previous
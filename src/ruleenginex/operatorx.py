@@ -1,32 +1,352 @@
+import hashlib
+import json
 import logging
+import math
 import re
-from typing import Any
+import string
+import sys
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from itertools import chain
+from typing import Any, NamedTuple
 
-from jsonschema import ValidationError, validate
+from jsonschema.exceptions import SchemaError
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 
-from ruleenginex.constants import OperatorEnum
-from ruleenginex.exceptions import UnsupportedOperatorError
+from ruleenginex.cache import CacheInfo, LRUCache
+from ruleenginex.constants import EARLY_EXIT_OPERATORS, MEMBERSHIP_OPERATORS, RANGE_OPERATORS, OperatorEnum
+from ruleenginex.exceptions import (
+    InvalidExpectedValueError,
+    InvalidJsonSchemaError,
+    InvalidRegexError,
+    UnsupportedOperatorError,
+)
 
 logger = logging.getLogger(__name__)
 
+REGEX_CACHE_SIZE = 4096
+
+# Process-wide cache of compiled patterns, keyed by (pattern, flags), shared by all rules.
+REGEX_CACHE = LRUCache(REGEX_CACHE_SIZE)
+
+# Process-wide cache of regex literal prefixes, keyed by (pattern, flags).
+LITERAL_PREFIX_CACHE = LRUCache(REGEX_CACHE_SIZE)
+
+SCHEMA_CACHE_SIZE = 1024
+
+# Process-wide cache of schema validators, keyed by a hash of the canonical JSON schema.
+SCHEMA_CACHE = LRUCache(SCHEMA_CACHE_SIZE)
+
+REGEX_FLAGS = {
+    OperatorEnum.REGEX: 0,
+    OperatorEnum.REGEX_CASE_INSENSITIVE: re.IGNORECASE,
+}
+
+# ``^`` and ``\A``; ``re.match`` is anchored at the start either way.
+_START_ANCHORS = ("^", "\\A")
+
+# Characters that end a literal prefix, and quantifiers that make the preceding literal optional.
+_METACHARACTERS = frozenset(".^$*+?{}[]()|\\")
+_OPTIONAL_QUANTIFIERS = frozenset("*?{")
+
+# Global inline flags such as ``(?i)``; Python before 3.11 also applies them mid-pattern.
+_INLINE_FLAGS = re.compile(r"\(\?([aiLmsux]+)\)")
+
+# Numeric text the range operators accept: no whitespace, underscores, "+", "inf" or "nan".
+_DECIMAL = re.compile(r"-?\d+(\.\d+)?([eE][+-]?\d+)?", re.ASCII)
+
+
+def _compile_regex(pattern: str, flags: int) -> re.Pattern:
+    try:
+        return re.compile(pattern, flags)
+    except re.error as e:
+        raise InvalidRegexError(pattern, str(e)) from e
+
+
+def compile_regex(pattern: Any, flags: int = 0) -> re.Pattern:
+    """Returns the compiled pattern, shared with every other rule using the same pattern and flags."""
+    if not isinstance(pattern, str):
+        raise InvalidRegexError(pattern, "pattern must be a string")
+    return REGEX_CACHE.get_or_create((pattern, flags), lambda: _compile_regex(pattern, flags))
+
+
+def regex_cache_info() -> CacheInfo:
+    """Returns hit/miss statistics for the compiled regex cache."""
+    return REGEX_CACHE.info()
+
+
+# Under re.IGNORECASE an ASCII letter also matches its other case and these four non-ASCII characters.
+_CASE_FOLD = str.maketrans(
+    {
+        **{upper: upper.lower() for upper in string.ascii_uppercase},
+        "\u0130": "i",  # LATIN CAPITAL LETTER I WITH DOT ABOVE
+        "\u0131": "i",  # LATIN SMALL LETTER DOTLESS I
+        "\u017f": "s",  # LATIN SMALL LETTER LONG S
+        "\u212a": "k",  # KELVIN SIGN
+    }
+)
+
+
+def fold_case(text: str) -> str:
+    """Maps every character that re.IGNORECASE matches to an ASCII letter onto that lower-case letter."""
+    return text.translate(_CASE_FOLD)
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    """Returns True if pattern has a ``|`` outside every group and character class."""
+    depth = 0
+    position = 0
+    while position < len(pattern):
+        character = pattern[position]
+        if character == "\\":
+            position += 1
+        elif character == "[":
+            # A ``]`` right after ``[`` or ``[^`` is a literal member
+            position += 2 if pattern.startswith("[^", position) else 1
+            if pattern.startswith("]", position):
+                position += 1
+            while position < len(pattern) and pattern[position] != "]":
+                position += 2 if pattern[position] == "\\" else 1
+        elif character == "(":
+            depth += 1
+        elif character == ")":
+            depth -= 1
+        elif character == "|" and depth == 0:
+            return True
+        position += 1
+    return False
+
+
+def _literal_prefix(pattern: str, flags: int) -> tuple[str, bool]:
+    inline_flags = "".join(_INLINE_FLAGS.findall(pattern))
+    ignore_case = bool(flags & re.IGNORECASE) or "i" in inline_flags
+    # Verbose patterns ignore whitespace, and alternatives need not share a prefix
+    if flags & re.VERBOSE or "x" in inline_flags or _has_top_level_alternation(pattern):
+        return "", ignore_case
+    position = 0
+    if (match := _INLINE_FLAGS.match(pattern)) is not None:
+        position = match.end()
+    for anchor in _START_ANCHORS:
+        if pattern.startswith(anchor, position):
+            position += len(anchor)
+            break
+    characters = []
+    while position < len(pattern):
+        character = pattern[position]
+        if character == "\\":
+            # Escaped punctuation is literal; letters and digits are classes, anchors or references
+            escaped = pattern[position + 1 : position + 2]
+            if not escaped or escaped.isalnum() or escaped == "_":
+                break
+            character, width = escaped, 2
+        elif character in _METACHARACTERS:
+            break
+        else:
+            width = 1
+        if pattern[position + width : position + width + 1] in _OPTIONAL_QUANTIFIERS:
+            break
+        if ignore_case:
+            # Past ASCII the case rules get irregular; a shorter prefix is still a valid filter
+            if not character.isascii():
+                break
+            character = character.lower()
+        characters.append(character)
+        position += width
+    return "".join(characters), ignore_case
+
+
+def literal_prefix(pattern: str, flags: int = 0) -> tuple[str, bool]:
+    """Returns the literal text every ``re.match`` of pattern starts with, and whether it ignores case.
+
+    The prefix is the run of literal characters, after a leading ``^`` or ``\\A``, up to the
+    first metacharacter or escape class; a top-level alternation has none. A case-insensitive
+    prefix is lower-cased and should be compared with ``fold_case(text)``.
+    """
+    return LITERAL_PREFIX_CACHE.get_or_create((pattern, flags), lambda: _literal_prefix(pattern, flags))
+
+
+def _schema_key(schema: Any) -> str | None:
+    """Returns a canonical hash of the schema, or None if it is not JSON-serializable."""
+    try:
+        canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"), allow_nan=False)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _build_schema_validator(schema: Any) -> Validator:
+    validator_cls = validator_for(schema)
+    try:
+        validator_cls.check_schema(schema)
+    except SchemaError as e:
+        raise InvalidJsonSchemaError(e.message) from e
+    return validator_cls(schema)
+
+
+def compile_json_schema(schema: Any) -> Validator:
+    """Returns a validator for the schema, checked against its metaschema once and shared by identical schemas."""
+    key = _schema_key(schema)
+    if key is None:
+        return _build_schema_validator(schema)
+    return SCHEMA_CACHE.get_or_create(key, lambda: _build_schema_validator(schema))
+
+
+def schema_cache_info() -> CacheInfo:
+    """Returns hit/miss statistics for the schema validator cache."""
+    return SCHEMA_CACHE.info()
+
+
+class MemberSet:
+    """The expected members of a membership operator: a frozenset, plus a scan list for unhashable members."""
+
+    __slots__ = ("hashable", "unhashable")
+
+    def __init__(self, members: Iterable[Any]):
+        hashable, unhashable = [], []
+        for member in members:
+            try:
+                hash(member)
+            except TypeError:
+                unhashable.append(member)
+            else:
+                hashable.append(member)
+        self.hashable = frozenset(hashable)
+        self.unhashable = tuple(unhashable)
+
+    def __contains__(self, value: Any) -> bool:
+        try:
+            return value in self.hashable
+        except TypeError:
+            # Unhashable values can only equal unhashable members
+            return value in self.unhashable
+
+    def __len__(self) -> int:
+        return len(self.hashable) + len(self.unhashable)
+
+    def any_in(self, values: Iterable[Any]) -> bool:
+        """Returns True at the first value that is a member."""
+        return any(value in self for value in values)
+
+    def all_in(self, values: Iterable[Any]) -> bool:
+        """Returns True as soon as values have covered every member."""
+        missing = set(self.hashable)
+        missing_unhashable = list(self.unhashable)
+        if not missing and not missing_unhashable:
+            return True
+        for value in values:
+            try:
+                missing.discard(value)
+            except TypeError:
+                if value in missing_unhashable:
+                    missing_unhashable.remove(value)
+            if not missing and not missing_unhashable:
+                return True
+        return False
+
+
+def _member_set(operator: OperatorEnum, expected_value: Any) -> MemberSet:
+    if isinstance(expected_value, (str, bytes, dict)) or not isinstance(expected_value, Iterable):
+        raise InvalidExpectedValueError(operator, "expected a list of values")
+    return MemberSet(expected_value)
+
+
+def to_number(value: Any) -> int | float | None:
+    """Returns value as the range operators compare it, or None if it is not a number.
+
+    Ints and floats are taken as they are and decimal strings, such as header and query
+    values (``"42"``, ``"-0.5"``, ``"1e3"``), are parsed. Booleans, NaN and infinities are
+    not numbers here.
+    """
+    kind = type(value)
+    if kind is int or kind is float:
+        number = value
+    elif kind is str and _DECIMAL.fullmatch(value):
+        try:
+            number = int(value)
+        except ValueError:
+            number = float(value)
+    else:
+        return None
+    return None if type(number) is float and not math.isfinite(number) else number
+
+
+class NumericRange(NamedTuple):
+    """The numbers a range operator accepts: from low to high, each bound included or not."""
+
+    low: int | float
+    high: int | float
+    low_inclusive: bool
+    high_inclusive: bool
+
+    def contains(self, number: int | float) -> bool:
+        """Returns True if number lies within the range."""
+        low, high = self.low, self.high
+        return (low < number or (self.low_inclusive and low == number)) and (
+            number < high or (self.high_inclusive and number == high)
+        )
+
+
+def _expected_number(operator: OperatorEnum, value: Any) -> int | float:
+    number = to_number(value)
+    if number is None:
+        raise InvalidExpectedValueError(operator, f"expected a number, got {value!r}")
+    return number
+
+
+def _numeric_range(operator: OperatorEnum, expected_value: Any) -> NumericRange:
+    """Coerces a range operator's expected value; ``BETWEEN`` takes an inclusive [low, high] pair."""
+    if operator is OperatorEnum.BETWEEN:
+        pair = expected_value if isinstance(expected_value, (list, tuple)) else ()
+        try:
+            low_value, high_value = pair
+        except ValueError as e:
+            raise InvalidExpectedValueError(operator, "expected a [low, high] pair of numbers") from e
+        low, high = _expected_number(operator, low_value), _expected_number(operator, high_value)
+        if low > high:
+            raise InvalidExpectedValueError(operator, f"low bound {low} exceeds high bound {high}")
+        return NumericRange(low, high, low_inclusive=True, high_inclusive=True)
+    number = _expected_number(operator, expected_value)
+    match operator:
+        case OperatorEnum.GT:
+            return NumericRange(number, math.inf, low_inclusive=False, high_inclusive=True)
+        case OperatorEnum.GTE:
+            return NumericRange(number, math.inf, low_inclusive=True, high_inclusive=True)
+        case OperatorEnum.LT:
+            return NumericRange(-math.inf, number, low_inclusive=True, high_inclusive=False)
+        case _:
+            return NumericRange(-math.inf, number, low_inclusive=True, high_inclusive=True)
+
+
+# Marks an exhausted match stream.
+_MISSING = object()
+
 
 class OperatorEvaluator:
     """Handles evaluation logic for different operators."""
 
+    __slots__ = ("_members", "_pattern", "_range", "_validator", "expected_value", "operator")
+
     def __init__(self, operator: OperatorEnum, expected_value: Any):
         self.operator = operator
-        self.expected_value = expected_value
+        # Identical expected strings across rules share one object
+        self.expected_value = sys.intern(expected_value) if type(expected_value) is str else expected_value
+        self._pattern = compile_regex(expected_value, REGEX_FLAGS[operator]) if operator in REGEX_FLAGS else None
+        self._validator = compile_json_schema(expected_value) if operator is OperatorEnum.VALID_JSON_SCHEMA else None
+        self._members = _member_set(operator, expected_value) if operator in MEMBERSHIP_OPERATORS else None
+        self._range = _numeric_range(operator, expected_value) if operator in RANGE_OPERATORS else None
 
-    def apply(self, actual_value: Any) -> bool:
-        """Applies the operator logic to the actual value."""
+    @property
+    def early_exit(self) -> bool:
+        """True if ``apply_matches`` can stop reading matches before the stream ends."""
+        return self.operator in EARLY_EXIT_OPERATORS
 
-        logger.debug(
-            "Applying operator=%s on actual_value=%r with expected_value=%r",
-            self.operator,
-            actual_value,
-            self.expected_value,
-        )
+    @property
+    def numeric_range(self) -> NumericRange | None:
+        """The coerced range of a range operator, None for the other operators."""
+        return self._range
 
+    def apply(self, actual_value: Any) -> bool:
+        """Applies the operator logic to the actual value."""
         match self.operator:
             case OperatorEnum.EQUALS:
                 return actual_value == self.expected_value
@@ -34,21 +354,128 @@ class OperatorEvaluator:
                 return isinstance(actual_value, list) and self.expected_value in actual_value
             case OperatorEnum.EMPTY_ARRAY:
                 return isinstance(actual_value, list) and len(actual_value) == 0
-            case OperatorEnum.REGEX:
-                return bool(re.match(self.expected_value, str(actual_value)))
-            case OperatorEnum.REGEX_CASE_INSENSITIVE:
-                return bool(re.match(self.expected_value, str(actual_value), re.IGNORECASE))
+            case OperatorEnum.REGEX | OperatorEnum.REGEX_CASE_INSENSITIVE:
+                return self._pattern is not None and self._pattern.match(str(actual_value)) is not None
             case OperatorEnum.NULL:
                 return actual_value is None
             case OperatorEnum.VALID_JSON_SCHEMA:
                 return self._validate_json_schema(actual_value)
+            case OperatorEnum.IN if self._members is not None:
+                return actual_value in self._members
+            case OperatorEnum.ANY_OF if self._members is not None:
+                return isinstance(actual_value, list) and self._members.any_in(actual_value)
+            case OperatorEnum.ALL_OF if self._members is not None:
+                return isinstance(actual_value, list) and self._members.all_in(actual_value)
+            case OperatorEnum.INTERSECTS if self._members is not None:
+                if isinstance(actual_value, list):
+                    return self._members.any_in(actual_value)
+                return actual_value in self._members
+            case OperatorEnum.GT | OperatorEnum.GTE | OperatorEnum.LT | OperatorEnum.LTE | OperatorEnum.BETWEEN if (
+                self._range is not None
+            ):
+                number = to_number(actual_value)
+                return number is not None and self._range.contains(number)
             case _:
                 raise UnsupportedOperatorError(str(self.operator))
 
+    def apply_matches(self, matches: Iterator[Any]) -> bool:
+        """Applies the operator to a stream of JSONPath matches, as ``apply`` would to their extracted value.
+
+        A single match is the value itself and several matches form a list, as in ``Rule.extract``.
+        Operators in ``EARLY_EXIT_OPERATORS`` stop reading the stream once the outcome is known.
+        """
+        first = next(matches, _MISSING)
+        if first is _MISSING:
+            return self.apply([])
+        second = next(matches, _MISSING)
+        if second is _MISSING:
+            return self.apply(first)
+        values = chain((first, second), matches)
+        match self.operator:
+            case OperatorEnum.ARRAY_INCLUDES:
+                return self.expected_value in values
+            case OperatorEnum.ANY_OF | OperatorEnum.INTERSECTS if self._members is not None:
+                return self._members.any_in(values)
+            case OperatorEnum.ALL_OF if self._members is not None:
+                return self._members.all_in(values)
+            case OperatorEnum.NULL | OperatorEnum.EMPTY_ARRAY:
+                # Two matches already make a non-empty list
+                return False
+            case OperatorEnum.EQUALS:
+                return self._equals_list(values)
+            case _:
+                return self.apply(list(values))
+
+    def _equals_list(self, values: Iterator[Any]) -> bool:
+        """Compares streamed matches with the expected value, stopping at the first difference."""
+        expected_value = self.expected_value
+        if not isinstance(expected_value, list):
+            return False
+        count = 0
+        for count, value in enumerate(values, 1):
+            if count > len(expected_value):
+                return False
+            item = expected_value[count - 1]
+            # Identity first, as list comparison does
+            if value is not item and value != item:
+                return False
+        return count == len(expected_value)
+
+    def compile(self) -> Callable[[Any], bool]:
+        """Returns a predicate equivalent to ``apply`` with the operator dispatch resolved up front."""
+        expected_value = self.expected_value
+        match self.operator:
+            case OperatorEnum.EQUALS:
+                return lambda actual_value: actual_value == expected_value
+            case OperatorEnum.ARRAY_INCLUDES:
+                return lambda actual_value: isinstance(actual_value, list) and expected_value in actual_value
+            case OperatorEnum.EMPTY_ARRAY:
+                return lambda actual_value: isinstance(actual_value, list) and not actual_value
+            case OperatorEnum.REGEX | OperatorEnum.REGEX_CASE_INSENSITIVE if self._pattern is not None:
+                match_pattern = self._pattern.match
+                return lambda actual_value: match_pattern(str(actual_value)) is not None
+            case OperatorEnum.NULL:
+                return lambda actual_value: actual_value is None
+            case OperatorEnum.VALID_JSON_SCHEMA if self._validator is not None:
+                return self._validator.is_valid
+            case OperatorEnum.IN if self._members is not None:
+                return self._members.__contains__
+            case OperatorEnum.ANY_OF if self._members is not None:
+                any_in = self._members.any_in
+                return lambda actual_value: isinstance(actual_value, list) and any_in(actual_value)
+            case OperatorEnum.ALL_OF if self._members is not None:
+                all_in = self._members.all_in
+                return lambda actual_value: isinstance(actual_value, list) and all_in(actual_value)
+            case OperatorEnum.INTERSECTS if self._members is not None:
+                members = self._members
+                return lambda actual_value: (
+                    members.any_in(actual_value) if isinstance(actual_value, list) else actual_value in members
+                )
+            case OperatorEnum.GT | OperatorEnum.GTE | OperatorEnum.LT | OperatorEnum.LTE | OperatorEnum.BETWEEN if (
+                self._range is not None
+            ):
+                contains = self._range.contains
+                return lambda actual_value: (number := to_number(actual_value)) is not None and contains(number)
+            case _:
+                raise UnsupportedOperatorError(str(self.operator))
+
+    def apply_many(self, actual_values: Sequence[Any]) -> list[bool]:
+        """Applies the operator logic to each value, with fast paths for the cheap operators."""
+        match self.operator:
+            case OperatorEnum.EQUALS:
+                expected_value = self.expected_value
+                return [actual_value == expected_value for actual_value in actual_values]
+            case OperatorEnum.NULL:
+                return [actual_value is None for actual_value in actual_values]
+            case OperatorEnum.EMPTY_ARRAY:
+                return [isinstance(actual_value, list) and not actual_value for actual_value in actual_values]
+            case OperatorEnum.IN if self._members is not None:
+                members = self._members
+                return [actual_value in members for actual_value in actual_values]
+            case _:
+                apply = self.apply
+                return [apply(actual_value) for actual_value in actual_values]
+
     def _validate_json_schema(self, actual_value: Any) -> bool:
         """Validates the actual value against the expected JSON schema."""
-        try:
-            validate(instance=actual_value, schema=self.expected_value)
-            return True
-        except ValidationError:
-            return False
+        return self._validator is not None and self._validator.is_valid(actual_value)
@@ -0,0 +1,139 @@
+from array import array
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from typing import Any
+
+from ruleenginex.batch import MASK_TYPECODE, as_sequence
+from ruleenginex.dispatcher import Dispatcher
+from ruleenginex.rules import Rules
+from ruleenginex.scenario import Scenario
+
+DEFAULT_CHUNK_SIZE = 2048
+DEFAULT_SERIAL_THRESHOLD = 10_000
+
+NO_MATCH = -1
+
+# Per-process evaluation state, built once by the pool initializer.
+_WORKER: dict[str, Any] = {}
+
+
+def _init_worker(rule_definitions: list[dict] | None, scenario_definitions: list[dict] | None):
+    """Rebuilds the rulebook inside a worker process from its pickled definitions."""
+    if rule_definitions is not None:
+        _WORKER["rules"] = Rules(rule_definitions)
+    if scenario_definitions is not None:
+        scenarios = [Scenario(**definition) for definition in scenario_definitions]
+        _WORKER["dispatcher"] = Dispatcher(scenarios)
+        _WORKER["positions"] = {id(scenario): position for position, scenario in enumerate(scenarios)}
+
+
+def _evaluate_chunk(records: Sequence[dict]) -> bytes:
+    return _WORKER["rules"].evaluate_many(records).tobytes()
+
+
+def _match_chunk(records: Sequence[dict]) -> list[int]:
+    return _match_positions(_WORKER["dispatcher"], _WORKER["positions"], records)
+
+
+def _match_positions(dispatcher: Dispatcher, positions: dict[int, int], records: Sequence[dict]) -> list[int]:
+    matches = []
+    for record in records:
+        scenario = dispatcher.match(record)
+        matches.append(NO_MATCH if scenario is None else positions[id(scenario)])
+    return matches
+
+
+def _chunks(records: Sequence[dict], chunk_size: int) -> Iterable[Sequence[dict]]:
+    for start in range(0, len(records), chunk_size):
+        yield records[start : start + chunk_size]
+
+
+class ParallelEvaluator:
+    """Evaluates large record batches across a process pool.
+
+    Wraps either a ``Rules`` collection (``evaluate`` returns a mask) or a list of scenarios
+    (``match`` returns the first matching scenario per record). Rule definitions are sent to
+    each worker once, when the pool starts; tasks only carry records. Inputs smaller than
+    ``serial_threshold`` are evaluated in the calling process. Results are always in input order.
+    """
+
+    def __init__(
+        self,
+        rulebook: Rules | Sequence[Scenario],
+        max_workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        serial_threshold: int = DEFAULT_SERIAL_THRESHOLD,
+        mp_context: BaseContext | None = None,
+    ):
+        if chunk_size <= 0:
+            msg = "chunk_size must be a positive integer"
+            raise ValueError(msg)
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.serial_threshold = serial_threshold
+        self.mp_context = mp_context
+        self._pool: ProcessPoolExecutor | None = None
+
+        if isinstance(rulebook, Rules):
+            self.rules: Rules | None = rulebook
+            self.scenarios: list[Scenario] = []
+            self._initargs: tuple = (rulebook.to_list(), None)
+        else:
+            self.rules = None
+            self.scenarios = list(rulebook)
+            self._dispatcher = Dispatcher(self.scenarios)
+            self._positions = {id(scenario): position for position, scenario in enumerate(self.scenarios)}
+            self._initargs = (None, [scenario.to_dict() for scenario in self.scenarios])
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=self.mp_context,
+                initializer=_init_worker,
+                initargs=self._initargs,
+            )
+        return self._pool
+
+    def _run_serial(self, records: Sequence[dict]) -> bool:
+        return self.max_workers == 1 or len(records) < self.serial_threshold
+
+    def evaluate(self, records: Iterable[dict]) -> array:
+        """Returns a boolean mask of the records that satisfy every rule."""
+        if self.rules is None:
+            msg = "evaluate() requires a Rules collection; use match() for scenarios"
+            raise TypeError(msg)
+        records = as_sequence(records)
+        if self._run_serial(records):
+            return self.rules.evaluate_many(records)
+        mask = array(MASK_TYPECODE)
+        for chunk in self._get_pool().map(_evaluate_chunk, _chunks(records, self.chunk_size)):
+            mask.frombytes(chunk)
+        return mask
+
+    def match(self, records: Iterable[dict]) -> list[Scenario | None]:
+        """Returns the first matching scenario for each record, or None when nothing matches."""
+        if self.rules is not None:
+            msg = "match() requires a list of scenarios; use evaluate() for Rules"
+            raise TypeError(msg)
+        records = as_sequence(records)
+        if self._run_serial(records):
+            positions = _match_positions(self._dispatcher, self._positions, records)
+        else:
+            positions = []
+            for chunk in self._get_pool().map(_match_chunk, _chunks(records, self.chunk_size)):
+                positions.extend(chunk)
+        return [None if position == NO_MATCH else self.scenarios[position] for position in positions]
+
+    def close(self):
+        """Shuts down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
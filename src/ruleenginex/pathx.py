@@ -0,0 +1,343 @@
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from jsonpath_ng import JSONPath
+from jsonpath_ng import jsonpath as jsonpath_nodes
+from jsonpath_ng.ext import parse
+from jsonpath_ng.jsonpath import AutoIdForDatum, Child, DatumInContext, Descendants, Fields, Index, Root, Slice, This
+
+from ruleenginex.cache import CacheInfo, LRUCache
+from ruleenginex.exceptions import JsonPathParsingError
+
+JSONPATH_CACHE_SIZE = 4096
+
+# Process-wide cache of compiled JSONPath expressions, keyed by the path string.
+JSONPATH_CACHE = LRUCache(JSONPATH_CACHE_SIZE)
+
+# Process-wide cache of value walkers, keyed by the path string.
+JSONPATH_WALKER_CACHE = LRUCache(JSONPATH_CACHE_SIZE)
+
+# data -> the values a JSONPath matches in data, produced lazily in jsonpath_ng's order.
+JsonPathWalker = Callable[[Any], Iterator[Any]]
+
+# Process-wide cache of value getters, keyed by the path string.
+JSONPATH_GETTER_CACHE = LRUCache(JSONPATH_CACHE_SIZE)
+
+# data -> what a rule extracts: the only match, a list of several matches, or [] when nothing matches.
+JsonPathGetter = Callable[[Any], Any]
+
+# (value, root document) -> the values one step of a path matches under value.
+_Step = Callable[[Any, Any], Iterator[Any]]
+
+_MISSING = object()
+
+_WALKABLE_NODES = frozenset({Root, This, Fields, Index, Slice, Child, Descendants})
+
+
+def _parse_jsonpath(jsonpath: str) -> JSONPath:
+    try:
+        return parse(jsonpath)
+    except Exception as e:
+        msg = f"Invalid JSONPath syntax: {jsonpath}"
+        raise JsonPathParsingError(msg) from e
+
+
+def compile_jsonpath(jsonpath: str) -> JSONPath:
+    """Returns the compiled expression for jsonpath, parsing it at most once per cache lifetime."""
+    return JSONPATH_CACHE.get_or_create(jsonpath, lambda: _parse_jsonpath(jsonpath))
+
+
+def jsonpath_cache_info() -> CacheInfo:
+    """Returns hit/miss statistics for the compiled JSONPath cache."""
+    return JSONPATH_CACHE.info()
+
+
+def _iter_slice(expression: Slice, datum: DatumInContext) -> Iterator[DatumInContext]:
+    """Lazy ``Slice.find``: wraps one element at a time instead of the whole list."""
+    value = datum.value
+    if value is None:
+        return
+    if isinstance(value, (dict, int, float, str, bool)):
+        # Slice.find treats a single object or constant as a one-element list
+        datum = DatumInContext([value], path=datum.path, context=datum.context)
+        value = datum.value
+    for position in range(len(value))[expression.start : expression.end : expression.step]:
+        yield DatumInContext(value[position], path=Index(position), context=datum)
+
+
+def _iter_matches(expression: JSONPath, datum: DatumInContext) -> Iterator[DatumInContext]:
+    if isinstance(expression, Child):
+        for left in _iter_matches(expression.left, datum):
+            # Auto ids have no children, as in Child.find
+            if not isinstance(left, AutoIdForDatum):
+                yield from _iter_matches(expression.right, left)
+    elif type(expression) is Slice:
+        yield from _iter_slice(expression, datum)
+    else:
+        yield from expression.find(datum)
+
+
+def iter_jsonpath(expression: JSONPath, data: Any) -> Iterator[Any]:
+    """Yields the values expression matches in data, in ``find`` order, walking only as far as they are read.
+
+    Each step of a path is expanded one parent at a time, so a consumer that stops early
+    never visits the remaining branches.
+    """
+    for match in _iter_matches(expression, DatumInContext.wrap(data)):
+        yield match.value
+
+
+def _root_step(_value: Any, root: Any) -> Iterator[Any]:
+    yield root
+
+
+def _this_step(value: Any, _root: Any) -> Iterator[Any]:
+    yield value
+
+
+def _fields_step(fields: tuple[str, ...]) -> _Step:
+    if "*" in fields:
+
+        def all_fields(value: Any, _root: Any) -> Iterator[Any]:
+            try:
+                keys = tuple(value.keys())
+            except AttributeError:
+                return
+            for key in keys:
+                field_value = value.get(key, _MISSING)
+                if field_value is not _MISSING:
+                    yield field_value
+
+        return all_fields
+
+    def named_fields(value: Any, _root: Any) -> Iterator[Any]:
+        for field in fields:
+            try:
+                field_value = value.get(field, _MISSING)
+            except (TypeError, AttributeError):
+                continue
+            if field_value is not _MISSING:
+                yield field_value
+
+    return named_fields
+
+
+def _index_step(indices: tuple[int, ...]) -> _Step:
+    def index(value: Any, _root: Any) -> Iterator[Any]:
+        if isinstance(value, dict):
+            return
+        for position in indices:
+            if value and -len(value) <= position < len(value):
+                yield value[position]
+
+    return index
+
+
+def _slice_step(start: int | None, end: int | None, step: int | None) -> _Step:
+    def slice_values(value: Any, _root: Any) -> Iterator[Any]:
+        if value is None:
+            return
+        if isinstance(value, (dict, int, float, str, bool)):
+            # Slice.find treats a single object or constant as a one-element list
+            value = [value]
+        for position in range(len(value))[start:end:step]:
+            yield value[position]
+
+    return slice_values
+
+
+def _child_step(left: _Step, right: _Step) -> _Step:
+    def child(value: Any, root: Any) -> Iterator[Any]:
+        for left_value in left(value, root):
+            yield from right(left_value, root)
+
+    return child
+
+
+def _descendants_step(left: _Step, right: _Step) -> _Step:
+    def descend(value: Any, root: Any) -> Iterator[Any]:
+        # Same order as Descendants.find: the node's own matches, then each child's, depth first
+        yield from right(value, root)
+        if isinstance(value, list):
+            for item in value:
+                yield from descend(item, root)
+        elif isinstance(value, dict):
+            for key in value:
+                yield from descend(value[key], root)
+
+    def descendants(value: Any, root: Any) -> Iterator[Any]:
+        for left_value in left(value, root):
+            yield from descend(left_value, root)
+
+    return descendants
+
+
+def _compile_step(expression: JSONPath) -> _Step | None:
+    """Translates expression into value-only steps, or returns None if a node needs jsonpath_ng's context."""
+    # Exact types only: subclasses, such as the ext parser's extensions, may change find()
+    if type(expression) not in _WALKABLE_NODES:
+        return None
+    if isinstance(expression, Root):
+        return _root_step
+    if isinstance(expression, This):
+        return _this_step
+    if isinstance(expression, Fields):
+        return _fields_step(expression.fields)
+    if isinstance(expression, Index):
+        return _index_step(expression.indices)
+    if isinstance(expression, Slice):
+        return _slice_step(expression.start, expression.end, expression.step)
+    if isinstance(expression, (Child, Descendants)):
+        left, right = _compile_step(expression.left), _compile_step(expression.right)
+        if left is None or right is None:
+            return None
+        return _child_step(left, right) if isinstance(expression, Child) else _descendants_step(left, right)
+    return None
+
+
+def _build_walker(jsonpath: str) -> JsonPathWalker:
+    expression = compile_jsonpath(jsonpath)
+    # Auto ids are synthesised from the match context, so only the context-tracking walk can produce them
+    step = _compile_step(expression) if jsonpath_nodes.auto_id_field is None else None
+    if step is None:
+        return lambda data: iter_jsonpath(expression, data)
+    return lambda data: step(data, data)
+
+
+def compile_jsonpath_walker(jsonpath: str) -> JsonPathWalker:
+    """Returns a function that lazily yields the values jsonpath matches, without match-context objects.
+
+    Fields, indices, slices, wildcards and recursive descent are walked directly over dicts
+    and lists; paths using filters or other extensions fall back to ``iter_jsonpath``.
+    """
+    return JSONPATH_WALKER_CACHE.get_or_create(jsonpath, lambda: _build_walker(jsonpath))
+
+
+# Steps of the simple JSONPath subset handled by the native getter.
+_FIELD, _INDEX, _WILDCARD = range(3)
+
+# Types that Slice.find treats as a one-element list.
+_SLICE_SCALARS = (dict, int, float, str, bool)
+
+
+def _simple_steps(expression: JSONPath) -> tuple[tuple[int, Any], ...] | None:
+    """Returns the steps of a ``$.name``, ``[index]`` and ``[*]`` chain, or None for anything else."""
+    if jsonpath_nodes.auto_id_field is not None:
+        return None
+    steps = []
+    node = expression
+    while type(node) is Child:
+        right = node.right
+        if type(right) is Fields and len(right.fields) == 1 and right.fields[0] != "*":
+            steps.append((_FIELD, right.fields[0]))
+        elif type(right) is Index and len(right.indices) == 1:
+            steps.append((_INDEX, right.indices[0]))
+        elif type(right) is Slice and right.start is None and right.end is None and right.step is None:
+            steps.append((_WILDCARD, None))
+        else:
+            return None
+        node = node.left
+    if type(node) is not Root:
+        return None
+    return tuple(reversed(steps))
+
+
+def _single_match_getter(steps: tuple[tuple[int, Any], ...]) -> JsonPathGetter:
+    if all(kind == _FIELD for kind, _ in steps):
+        names = tuple(name for _, name in steps)
+
+        def get_fields(data: Any) -> Any:
+            value = data
+            for name in names:
+                try:
+                    value = value.get(name, _MISSING)
+                except (TypeError, AttributeError):
+                    return []
+                if value is _MISSING:
+                    return []
+            return value
+
+        return get_fields
+
+    def get_path(data: Any) -> Any:
+        value = data
+        for kind, key in steps:
+            if kind == _FIELD:
+                try:
+                    value = value.get(key, _MISSING)
+                except (TypeError, AttributeError):
+                    return []
+                if value is _MISSING:
+                    return []
+            # Same bounds check as Index.find, which also matches nothing inside a dict
+            elif isinstance(value, dict) or not (value and -len(value) <= key < len(value)):
+                return []
+            else:
+                value = value[key]
+        return value
+
+    return get_path
+
+
+def _multi_match_getter(steps: tuple[tuple[int, Any], ...]) -> JsonPathGetter:
+    def get_all(data: Any) -> Any:
+        values = [data]
+        for kind, key in steps:
+            matched: list[Any] = []
+            if kind == _FIELD:
+                for value in values:
+                    try:
+                        field_value = value.get(key, _MISSING)
+                    except (TypeError, AttributeError):
+                        continue
+                    if field_value is not _MISSING:
+                        matched.append(field_value)
+            elif kind == _INDEX:
+                for value in values:
+                    if not isinstance(value, dict) and value and -len(value) <= key < len(value):
+                        matched.append(value[key])
+            else:
+                for value in values:
+                    if value is None:
+                        continue
+                    if isinstance(value, _SLICE_SCALARS):
+                        matched.append(value)
+                    elif type(value) is list:
+                        matched.extend(value)
+                    else:
+                        matched.extend(value[position] for position in range(len(value)))
+            values = matched
+        return values[0] if len(values) == 1 else values
+
+    return get_all
+
+
+def _build_getter(jsonpath: str) -> JsonPathGetter:
+    expression = compile_jsonpath(jsonpath)
+    steps = _simple_steps(expression)
+    if steps is None:
+        walk = compile_jsonpath_walker(jsonpath)
+
+        def get_walked(data: Any) -> Any:
+            values = list(walk(data))
+            return values[0] if len(values) == 1 else values
+
+        return get_walked
+    if any(kind == _WILDCARD for kind, _ in steps):
+        return _multi_match_getter(steps)
+    return _single_match_getter(steps)
+
+
+def is_simple_jsonpath(jsonpath: str) -> bool:
+    """Returns True if jsonpath is a chain of ``.name``, ``[index]`` and ``[*]`` steps from ``$``."""
+    return _simple_steps(compile_jsonpath(jsonpath)) is not None
+
+
+def compile_jsonpath_getter(jsonpath: str) -> JsonPathGetter:
+    """Returns a function extracting jsonpath's value: the single match itself, else a list of all matches.
+
+    Simple paths (see ``is_simple_jsonpath``) are resolved by direct indexing over dicts and
+    lists; everything else goes through ``compile_jsonpath_walker``. Results are identical
+    to collecting jsonpath_ng's ``find`` matches.
+    """
+    return JSONPATH_GETTER_CACHE.get_or_create(jsonpath, lambda: _build_getter(jsonpath))
@@ -0,0 +1,190 @@
+import json
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import Any
+from urllib.parse import parse_qsl
+
+RawHeaders = Mapping[Any, Any] | Iterable[tuple[Any, Any]]
+
+_MISSING = object()
+
+
+def _text(value: Any) -> Any:
+    """Decodes HTTP wire bytes (latin-1, as in ASGI and WSGI) and passes everything else through."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).decode("latin-1")
+    return value
+
+
+class Headers(dict):
+    """Header values keyed by name, with case-insensitive lookups.
+
+    Names keep the casing of their first occurrence; a lower-case index built once maps
+    any other casing back to it. Repeated headers are combined into one comma-separated
+    value, as HTTP allows.
+    """
+
+    __slots__ = ("_index",)
+
+    def __init__(self, headers: RawHeaders = ()):
+        super().__init__()
+        self._index: dict[str, str] = {}
+        pairs = headers.items() if isinstance(headers, Mapping) else headers
+        for raw_name, raw_value in pairs:
+            name, value = _text(raw_name), _text(raw_value)
+            canonical = self._index.setdefault(name.lower(), name)
+            if dict.__contains__(self, canonical):
+                value = f"{dict.__getitem__(self, canonical)}, {value}"
+            dict.__setitem__(self, canonical, value)
+
+    def _canonical(self, name: Any) -> Any:
+        return self._index.get(name.lower(), name) if isinstance(name, str) else name
+
+    def __missing__(self, name: Any) -> Any:
+        canonical = self._canonical(name)
+        if canonical != name and dict.__contains__(self, canonical):
+            return dict.__getitem__(self, canonical)
+        raise KeyError(name)
+
+    def get(self, name: Any, default: Any = None) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def __contains__(self, name: object) -> bool:
+        return dict.__contains__(self, self._canonical(name))
+
+
+def decode_body(raw: Any) -> Any:
+    """Parses a JSON body; a body that is not JSON decodes to its text."""
+    if not isinstance(raw, (bytes, bytearray, memoryview, str)):
+        return raw
+    try:
+        return json.loads(raw if not isinstance(raw, memoryview) else bytes(raw))
+    except (ValueError, UnicodeDecodeError):
+        return raw if isinstance(raw, str) else bytes(raw).decode("utf-8", "replace")
+
+
+def decode_query(raw: Any) -> Any:
+    """Parses a query string into a dict; repeated names map to a list of their values."""
+    if not isinstance(raw, (bytes, bytearray, memoryview, str)):
+        return raw
+    params: dict[str, Any] = {}
+    for name, value in parse_qsl(_text(raw).lstrip("?"), keep_blank_values=True):
+        if name not in params:
+            params[name] = value
+        elif isinstance(params[name], list):
+            params[name].append(value)
+        else:
+            params[name] = [params[name], value]
+    return params
+
+
+# How each raw target becomes the value rules see; other targets only have bytes decoded to text.
+DECODERS: dict[str, Callable[[Any], Any]] = {
+    "body": decode_body,
+    "headers": Headers,
+    "params": decode_query,
+}
+
+
+class RequestView(dict):  # noqa: PLW1641
+    """Request data decoded lazily from raw HTTP parts, accepted wherever ``request_data`` is.
+
+    Each target is decoded the first time a rule reads it, and the decoded value is kept for
+    the rules that follow. A request whose rules only check ``method`` and ``path`` never
+    parses its body. ``body`` takes raw JSON bytes, ``headers`` a list of (name, value) pairs
+    as servers deliver them, and ``params`` a raw query string; already decoded values and
+    any other target, e.g. ``route_params``, are accepted as keyword arguments too. An empty
+    raw body (``b""`` or ``""``) reads as absent; a decoded one such as ``[]`` or ``0`` does not.
+    """
+
+    __slots__ = ("_raw",)
+
+    def __init__(
+        self,
+        method: str | bytes | None = None,
+        path: str | bytes | None = None,
+        *,
+        body: Any = None,
+        headers: RawHeaders | None = None,
+        params: Any = None,
+        **targets: Any,
+    ):
+        super().__init__()
+        if isinstance(body, (bytes, bytearray, memoryview, str)) and not len(body):
+            body = None
+        raw = {"method": method, "path": path, "body": body, "headers": headers, "params": params, **targets}
+        self._raw = {target: value for target, value in raw.items() if value is not None}
+
+    def _decode(self, target: Any) -> Any:
+        """Decodes and caches target; raises KeyError if the request does not have it."""
+        try:
+            raw = self._raw[target]
+        except KeyError:
+            # Another thread may have decoded it since the caller's lookup
+            value = dict.get(self, target, _MISSING)
+            if value is _MISSING:
+                raise
+            return value
+        value = DECODERS.get(target, _text)(raw)
+        dict.__setitem__(self, target, value)
+        # Decoding twice from two threads is harmless; the raw value is only dropped once cached
+        self._raw.pop(target, None)
+        return value
+
+    def is_decoded(self, target: str) -> bool:
+        """Returns True once target has been decoded (or was never given)."""
+        return target not in self._raw
+
+    def __missing__(self, target: Any) -> Any:
+        return self._decode(target)
+
+    def get(self, target: Any, default: Any = None) -> Any:
+        try:
+            return self[target]
+        except KeyError:
+            return default
+
+    def __contains__(self, target: object) -> bool:
+        return dict.__contains__(self, target) or target in self._raw
+
+    def _decode_all(self):
+        for target in list(self._raw):
+            self.get(target)
+
+    def __iter__(self) -> Iterator[Any]:
+        self._decode_all()
+        return dict.__iter__(self)
+
+    def __len__(self) -> int:
+        self._decode_all()
+        return dict.__len__(self)
+
+    def __bool__(self) -> bool:
+        return bool(self._raw) or dict.__len__(self) > 0
+
+    def keys(self):
+        self._decode_all()
+        return dict.keys(self)
+
+    def values(self):
+        self._decode_all()
+        return dict.values(self)
+
+    def items(self):
+        self._decode_all()
+        return dict.items(self)
+
+    def __eq__(self, other: object) -> bool:
+        self._decode_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        self._decode_all()
+        return dict.__ne__(self, other)
+
+    def __repr__(self):
+        decoded = ", ".join(f"{target!r}: {value!r}" for target, value in dict.items(self))
+        pending = ", ".join(repr(target) for target in self._raw)
+        return f"RequestView({{{decoded}}}, undecoded=[{pending}])"
@@ -1,22 +1,60 @@
 import logging
 import re
+import sys
+import time
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from functools import reduce
 from operator import getitem
 from typing import Any
 
-from jsonpath_ng.ext import parse
-
-from ruleenginex.constants import TARGET_OPERATOR_MAP, OperatorEnum
+from ruleenginex.batch import as_sequence, to_mask
+from ruleenginex.constants import (
+    JSONPATH_COST,
+    JSONPATH_SCAN_COST,
+    OBJECT_PATH_COST,
+    OPERATOR_COSTS,
+    SIMPLE_JSONPATH_COST,
+    TARGET_LOOKUP_COST,
+    TARGET_OPERATOR_MAP,
+    OperatorEnum,
+)
 from ruleenginex.exceptions import InvalidTargetError, JsonPathParsingError, UnsupportedOperatorError
+from ruleenginex.metrics import STATE as METRICS
 from ruleenginex.operatorx import OperatorEvaluator
+from ruleenginex.pathx import compile_jsonpath_getter, compile_jsonpath_walker, is_simple_jsonpath
+from ruleenginex.tracing import STATE as TRACING
+from ruleenginex.tracing import TraceEvent
 
 logger = logging.getLogger(__name__)
 
+# A compiled rule or rule set: request_data -> bool
+Predicate = Callable[[dict[str, Any]], bool]
+
+# Per-evaluation memo shared by every rule of a pass: extracted values keyed by (target, prop), and
+# the results of shared rules (see ``RulePool``) keyed by the rule itself.
+ExtractionContext = dict[Any, Any]
+
 
 class Rule:
     """Represents a rule that evaluates a request against a condition."""
 
+    __slots__ = (
+        "_early_exit",
+        "_get",
+        "_path",
+        "_walk",
+        "cost",
+        "invert",
+        "label",
+        "operator",
+        "prop",
+        "shared",
+        "target",
+    )
+
     JSONPATH_PATTERN = re.compile(r"^\$")
+    JSONPATH_SCAN_PATTERN = re.compile(r"\.\.|\?|\*")
 
     def __init__(
         self,
@@ -33,19 +71,77 @@ class Rule:
         except KeyError as ke:
             raise UnsupportedOperatorError(op) from ke
 
-        self.target = target
-        self.prop = prop
-        self.operator = OperatorEvaluator(operator_enum, value)
-        self.invert = invert
+        self._assign(target, prop, OperatorEvaluator(operator_enum, value), invert)
 
         # Validate target and operator
         self._validate_target()
         self._validate_operator()
 
+        self._prepare()
+
         logger.debug(
             "Initialized Rule with target=%s, prop=%s, op=%s, value=%r, invert=%s", target, prop, op, value, invert
         )
 
+    @classmethod
+    def from_validated(
+        cls,
+        target: str,
+        prop: str,
+        operator: OperatorEvaluator,
+        invert: bool = False,  # noqa: FBT001, FBT002
+        template: "Rule | None" = None,
+    ) -> "Rule":
+        """Builds a rule from a definition that already passed validation, e.g. one read from a snapshot.
+
+        Target and operator checks are skipped. A template rule with the same prop and operator
+        lends its compiled path and cost instead of recomputing them.
+        """
+        rule = cls.__new__(cls)
+        rule._assign(target, prop, operator, invert)
+        if template is not None and template.prop == prop and template.operator.operator is operator.operator:
+            rule._get, rule._walk, rule._path = template._get, template._walk, template._path
+            rule._early_exit, rule.cost = template._early_exit, template.cost
+        else:
+            rule._prepare()
+        return rule
+
+    def _assign(self, target: str, prop: str, operator: OperatorEvaluator, invert: bool):  # noqa: FBT001
+        # Interned so the many rules sharing a target or path share one string
+        self.target = sys.intern(target) if isinstance(target, str) else target
+        self.prop = sys.intern(prop) if isinstance(prop, str) else prop
+        self.operator = operator
+        self.invert = invert
+        # Set once a RulePool hands this rule to several scenarios
+        self.shared = False
+        # Metrics label, set by the first named Rules holding this rule
+        self.label: str | None = None
+
+    def _prepare(self):
+        """Compiles the property path and estimates the evaluation cost."""
+        prop = self.prop
+        # Compile JSONPath props once, so syntax errors surface at load time
+        is_jsonpath = bool(prop) and self._is_jsonpath()
+        self._get = compile_jsonpath_getter(prop) if is_jsonpath else None
+        self._walk = compile_jsonpath_walker(prop) if is_jsonpath else None
+        # Split dot paths once instead of on every lookup
+        self._path = tuple(map(sys.intern, prop.split("."))) if prop and not is_jsonpath else None
+        # Operators that decide from the first few matches stop walking multi-match paths there
+        self._early_exit = (
+            is_jsonpath and self.operator.early_exit and self.JSONPATH_SCAN_PATTERN.search(prop) is not None
+        )
+        self.cost = self._estimate_cost()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the rule definition accepted by ``Rule(**definition)``."""
+        return {
+            "target": self.target,
+            "prop": self.prop,
+            "op": self.operator.operator.name,
+            "value": self.operator.expected_value,
+            "invert": self.invert,
+        }
+
     def _validate_target(self):
         """Validates that the target is supported."""
         if self.target not in TARGET_OPERATOR_MAP:
@@ -57,6 +153,20 @@ class Rule:
         if self.operator.operator not in supported_operators:
             raise UnsupportedOperatorError(str(self.operator))
 
+    def _estimate_cost(self) -> int:
+        """Estimates the relative cost of evaluating this rule from its path and operator."""
+        if not self.prop:
+            extraction_cost = TARGET_LOOKUP_COST
+        elif self._get is None:
+            extraction_cost = OBJECT_PATH_COST
+        elif self.JSONPATH_SCAN_PATTERN.search(self.prop):
+            extraction_cost = JSONPATH_SCAN_COST
+        elif is_simple_jsonpath(self.prop):
+            extraction_cost = SIMPLE_JSONPATH_COST
+        else:
+            extraction_cost = JSONPATH_COST
+        return extraction_cost + OPERATOR_COSTS.get(self.operator.operator, 1)
+
     def _is_jsonpath(self) -> bool:
         """Detects whether the property string is a JSONPath."""
         return bool(self.JSONPATH_PATTERN.match(self.prop))
@@ -74,40 +184,188 @@ class Rule:
         """Evaluates JSONPath expression on the given data."""
         if not jsonpath:
             return data
+        get = self._get if jsonpath == self.prop and self._get is not None else compile_jsonpath_getter(jsonpath)
         try:
-            jsonpath_expr = parse(jsonpath)
-            results = [match.value for match in jsonpath_expr.find(data)]
-            return results[0] if len(results) == 1 else results
+            return get(data)
         except Exception as e:
-            msg = f"Invalid JSONPath syntax: {jsonpath}"
+            msg = f"Failed to evaluate JSONPath: {jsonpath}"
             raise JsonPathParsingError(msg) from e
 
-    def evaluate(self, request_data: dict[str, Any]) -> bool:
-        """Evaluates the rule using the OperatorEvaluator class."""
-        logger.debug("Evaluating Rule against request_data=%s", request_data)
-        target_data = request_data.get(self.target, {})  # Get the top-level target data
+    def _iter_jsonpath_values(self, target_data: Any) -> Iterator[Any]:
+        """Streams the JSONPath matches in target_data; see ``pathx.compile_jsonpath_walker``."""
+        if self._walk is None:
+            return
+        try:
+            yield from self._walk(target_data)
+        except Exception as e:
+            msg = f"Failed to evaluate JSONPath: {self.prop}"
+            raise JsonPathParsingError(msg) from e
+
+    def _apply(self, request_data: dict[str, Any], context: ExtractionContext | None) -> bool:
+        """Applies the operator to the extracted value, streaming JSONPath matches when it can stop early."""
+        if self._early_exit and (context is None or (self.target, self.prop) not in context):
+            # A partial walk cannot be shared through the context, so the value is not memoized
+            return self.operator.apply_matches(self._iter_jsonpath_values(request_data.get(self.target, {})))
+        return self.operator.apply(self.extract(request_data, context))
 
+    def _extract_from_target(self, target_data: Any) -> Any:
+        if self._path is not None:
+            try:
+                return reduce(getitem, self._path, target_data)
+            except (KeyError, TypeError):
+                return None  # Return None if any key is missing
+        if self._get is not None:
+            return self._get_jsonpath_value(target_data, self.prop)
         # If property is empty or None, use full target data
-        if not self.prop:
-            actual_value = target_data
-        elif self._is_jsonpath():
-            actual_value = self._get_jsonpath_value(target_data, self.prop)
+        return target_data
+
+    def extract(self, request_data: dict[str, Any], context: ExtractionContext | None = None) -> Any:
+        """Extracts the value this rule inspects from the request data.
+
+        When a context is given, each (target, prop) is resolved at most once per context.
+        """
+        if context is None:
+            return self._extract_from_target(request_data.get(self.target, {}))
+        key = (self.target, self.prop)
+        try:
+            return context[key]
+        except KeyError:
+            value = context[key] = self._extract_from_target(request_data.get(self.target, {}))
+            return value
+
+    def extract_many(self, records: Sequence[dict[str, Any]]) -> list[Any]:
+        """Extracts this rule's value from each record, choosing the lookup strategy once."""
+        target = self.target
+        targets = [record.get(target, {}) for record in records]
+        if self._path is None:
+            return [self._extract_from_target(target_data) for target_data in targets]
+
+        keys = self._path
+        values = []
+        for target_data in targets:
+            try:
+                values.append(reduce(getitem, keys, target_data))
+            except (KeyError, TypeError):
+                values.append(None)
+        return values
+
+    def compile_extractor(self) -> Callable[[dict[str, Any]], Any]:
+        """Returns a function equivalent to ``extract`` specialised for this rule's path."""
+        target = self.target
+        keys = self._path
+        if keys is not None and len(keys) == 1:
+            (key,) = keys
+
+            def extract_key(request_data: dict[str, Any]) -> Any:
+                try:
+                    return request_data.get(target, {})[key]
+                except (KeyError, TypeError):
+                    return None
+
+            return extract_key
+
+        if keys is not None:
+
+            def extract_path(request_data: dict[str, Any]) -> Any:
+                value = request_data.get(target, {})
+                try:
+                    for key in keys:
+                        value = value[key]
+                except (KeyError, TypeError):
+                    return None
+                return value
+
+            return extract_path
+
+        if self._get is not None:
+            get, prop = self._get, self.prop
+
+            def extract_jsonpath(request_data: dict[str, Any]) -> Any:
+                try:
+                    return get(request_data.get(target, {}))
+                except Exception as e:
+                    msg = f"Failed to evaluate JSONPath: {prop}"
+                    raise JsonPathParsingError(msg) from e
+
+            return extract_jsonpath
+
+        return lambda request_data: request_data.get(target, {})
+
+    def compile_test(self) -> Callable[[Any], bool]:
+        """Returns the operator predicate for an extracted value, with inversion applied."""
+        test = self.operator.compile()
+        if self.invert:
+            return lambda actual_value: not test(actual_value)
+        return test
+
+    def compile(self) -> Predicate:
+        """Returns a predicate equivalent to ``evaluate`` with path and operator dispatch resolved up front."""
+        if self._early_exit:
+            apply_matches, stream, target = self.operator.apply_matches, self._iter_jsonpath_values, self.target
+            if self.invert:
+                return lambda request_data: not apply_matches(stream(request_data.get(target, {})))
+            return lambda request_data: apply_matches(stream(request_data.get(target, {})))
+        extract, test = self.compile_extractor(), self.compile_test()
+        return lambda request_data: test(extract(request_data))
+
+    def evaluate_many(self, records: Iterable[dict[str, Any]]) -> array:
+        """Evaluates the rule against every record and returns a boolean mask."""
+        results = self.operator.apply_many(self.extract_many(as_sequence(records)))
+        return to_mask(results, invert=self.invert)
+
+    def evaluate(self, request_data: dict[str, Any], context: ExtractionContext | None = None) -> bool:
+        """Evaluates the rule using the OperatorEvaluator class.
+
+        A shared rule keeps its result in context, so every scenario evaluated against the
+        same request reuses it.
+        """
+        if self.shared and context is not None:
+            return self._evaluate_shared(request_data, context)
+        if TRACING.tracer is not None or METRICS.registry is not None:
+            return self._evaluate_instrumented(request_data, context)
+        result = self._apply(request_data, context)
+        return not result if self.invert else result
+
+    def _evaluate_shared(self, request_data: dict[str, Any], context: ExtractionContext) -> bool:
+        try:
+            return context[self]
+        except KeyError:
+            pass
+        if TRACING.tracer is not None or METRICS.registry is not None:
+            result = self._evaluate_instrumented(request_data, context)
         else:
-            actual_value = self._get_object_path_value(target_data, self.prop)
+            result = self._apply(request_data, context)
+            result = not result if self.invert else result
+        context[self] = result
+        return result
 
-        # Print out details before applying operator
-        logger.debug(
-            "Rule extracted value=%s from target=%s, prop=%s; applying operator=%s",
-            actual_value,
-            self.target,
-            self.prop,
-            self.operator.operator,
-        )
+    def _evaluate_instrumented(self, request_data: dict[str, Any], context: ExtractionContext | None) -> bool:
+        """Evaluates the rule while recording trace events and/or sampled metrics."""
+        tracer = TRACING.tracer
+        registry = METRICS.registry
+        if registry is not None and not registry.sample():
+            registry = None
+        if tracer is None and registry is None:
+            result = self._apply(request_data, context)
+            return not result if self.invert else result
 
+        start = time.perf_counter_ns()
+        actual_value = self.extract(request_data, context)
+        extracted = time.perf_counter_ns()
         result = self.operator.apply(actual_value)
         final_result = not result if self.invert else result
+        finished = time.perf_counter_ns()
 
-        logger.debug(
-            "Rule evaluation -> operator result=%s, invert=%s => final_result=%s", result, self.invert, final_result
-        )
+        if registry is not None:
+            registry.observe_rule(self, final_result, extracted - start, finished - extracted)
+        if tracer is not None:
+            tracer.record(
+                TraceEvent("rule", self, tracer.summarize(actual_value), bool(final_result), finished - start)
+            )
         return final_result
+
+    def __repr__(self):
+        return (
+            f"Rule(target={self.target!r}, prop={self.prop!r}, op={self.operator.operator.name!r}, "
+            f"value={self.operator.expected_value!r}, invert={self.invert!r})"
+        )
@@ -0,0 +1,280 @@
+import logging
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, NamedTuple
+
+from ruleenginex.dispatcher import Dispatcher
+from ruleenginex.interning import FreezeError, RulePool, freeze
+from ruleenginex.loader import load_scenario_definitions
+from ruleenginex.scenario import Scenario
+
+logger = logging.getLogger(__name__)
+
+SCENARIO_FILE_SUFFIXES = frozenset({".json", ".yaml", ".yml"})
+
+# Above this share of changed scenarios, rebuilding the dispatcher beats patching it one scenario at a time.
+REBUILD_FRACTION = 0.125
+
+
+class RulebookVersion(NamedTuple):
+    """An immutable view of a rulebook; readers holding one see a consistent set of scenarios."""
+
+    number: int
+    scenarios: Mapping[str, Scenario]
+    dispatcher: Dispatcher
+
+    def match(self, request_data: dict) -> Scenario | None:
+        """Returns the first scenario, in declaration order, that matches the request."""
+        return self.dispatcher.match(request_data)
+
+    def match_all(self, request_data: dict) -> list[Scenario]:
+        """Returns every scenario that matches the request, in declaration order."""
+        return self.dispatcher.match_all(request_data)
+
+
+# Key order of ``Rule.to_dict``
+_RULE_KEYS = ("target", "prop", "op", "value", "invert")
+
+
+def _normalize_rule(rule: dict) -> dict[str, Any]:
+    rule = {**rule, "op": str(rule.get("op", "")).strip().upper(), "invert": rule.get("invert", False)}
+    normalized = {key: rule.pop(key) for key in _RULE_KEYS if key in rule}
+    normalized.update(rule)
+    return normalized
+
+
+def _normalize(definition: dict) -> dict[str, Any]:
+    """Returns a scenario definition in the form produced by ``Scenario.to_dict``."""
+    return {
+        "scenario_name": definition.get("scenario_name"),
+        "rules": [_normalize_rule(rule) for rule in definition.get("rules", [])],
+        "response": definition.get("response"),
+    }
+
+
+def _unchanged(scenario: Scenario, definition: dict[str, Any]) -> bool:
+    """Returns True if scenario was built from definition; 1, 1.0 and True are told apart."""
+    try:
+        return freeze(scenario.to_dict())[0] == freeze(definition)[0]
+    except FreezeError:
+        return False
+
+
+class Rulebook:
+    """Scenarios keyed by ``scenario_name`` that can be added, updated and removed one at a time.
+
+    Every change publishes a new ``RulebookVersion`` with a single reference assignment, so
+    readers in other threads that take ``current`` once per request keep a consistent view
+    while writers prepare the next one. Unchanged scenarios, with their compiled rules, and
+    the untouched parts of the dispatch index are shared between versions.
+
+    With a pool, every scenario entering the rulebook has its rules interned in place, so
+    identical rules across scenarios are one shared object evaluated at most once per
+    request; ``pool.info()`` reports how much that deduplicated.
+    """
+
+    def __init__(self, scenarios: Iterable[Scenario] = (), pool: RulePool | None = None):
+        by_name: dict[str, Scenario] = {}
+        for scenario in scenarios:
+            if scenario.scenario_name in by_name:
+                msg = f"Duplicate scenario name {scenario.scenario_name!r}"
+                raise ValueError(msg)
+            by_name[scenario.scenario_name] = scenario
+        self.pool = pool
+        if pool is not None:
+            for scenario in by_name.values():
+                pool.intern_scenario(scenario)
+        self._lock = threading.Lock()
+        self._current = RulebookVersion(0, MappingProxyType(by_name), Dispatcher(by_name.values()))
+
+    @property
+    def current(self) -> RulebookVersion:
+        """The latest published version."""
+        return self._current
+
+    @property
+    def version(self) -> int:
+        return self._current.number
+
+    def apply(self, upserts: Iterable[Scenario] = (), removals: Iterable[str] = ()) -> RulebookVersion:
+        """Publishes removals and upserts as one new version and returns it.
+
+        An upserted scenario replaces the one with the same name in place, or is appended.
+        Removing an unknown name raises KeyError and publishes nothing.
+        """
+        with self._lock:
+            version = self._current
+            scenarios = dict(version.scenarios)
+            replacements: list[tuple[Scenario | None, Scenario | None]] = []
+            for name in removals:
+                if name not in scenarios:
+                    msg = f"Unknown scenario {name!r}"
+                    raise KeyError(msg)
+                replacements.append((scenarios.pop(name), None))
+            for scenario in upserts:
+                replacements.append((scenarios.get(scenario.scenario_name), scenario))
+                scenarios[scenario.scenario_name] = scenario
+            if not replacements:
+                return version
+            if self.pool is not None:
+                for old, new in replacements:
+                    # Released first, so re-upserting the same scenario keeps its reference counts
+                    if old is not None:
+                        self.pool.release(old)
+                    if new is not None:
+                        self.pool.intern_scenario(new)
+
+            if len(replacements) > REBUILD_FRACTION * max(len(scenarios), 1):
+                dispatcher = Dispatcher(scenarios.values())
+            else:
+                dispatcher = version.dispatcher
+                for old, new in replacements:
+                    dispatcher = dispatcher.replace(old, new)
+            self._current = RulebookVersion(version.number + 1, MappingProxyType(scenarios), dispatcher)
+            logger.debug("Published rulebook version %d with %d change(s)", version.number + 1, len(replacements))
+            return self._current
+
+    def add(self, scenario: Scenario) -> RulebookVersion:
+        """Appends a scenario whose name is not in use yet."""
+        if scenario.scenario_name in self._current.scenarios:
+            msg = f"Scenario {scenario.scenario_name!r} already exists"
+            raise ValueError(msg)
+        return self.apply(upserts=[scenario])
+
+    def update(self, scenario: Scenario) -> RulebookVersion:
+        """Replaces the scenario with the same name, keeping its position."""
+        if scenario.scenario_name not in self._current.scenarios:
+            msg = f"Unknown scenario {scenario.scenario_name!r}"
+            raise KeyError(msg)
+        return self.apply(upserts=[scenario])
+
+    def remove(self, scenario_name: str) -> RulebookVersion:
+        """Removes the scenario with the given name."""
+        return self.apply(removals=[scenario_name])
+
+    def get(self, scenario_name: str) -> Scenario | None:
+        return self._current.scenarios.get(scenario_name)
+
+    def match(self, request_data: dict) -> Scenario | None:
+        """Matches against the current version; see ``Dispatcher.match``."""
+        return self._current.dispatcher.match(request_data)
+
+    def match_all(self, request_data: dict) -> list[Scenario]:
+        """Matches against the current version; see ``Dispatcher.match_all``."""
+        return self._current.dispatcher.match_all(request_data)
+
+    def __contains__(self, scenario_name: object) -> bool:
+        return scenario_name in self._current.scenarios
+
+    def __iter__(self) -> Iterator[Scenario]:
+        return iter(list(self._current.scenarios.values()))
+
+    def __len__(self) -> int:
+        return len(self._current.scenarios)
+
+
+class DirectoryWatcher:
+    """Keeps a Rulebook in sync with a directory of JSON/YAML scenario files.
+
+    ``sync`` reloads only the files whose size or modification time changed and publishes
+    the result as one version; scenarios whose definition did not change keep their compiled
+    objects. ``start`` repeats ``sync`` every interval seconds in a daemon thread, keeping the
+    last good version when a file fails to load.
+    """
+
+    def __init__(self, rulebook: Rulebook, directory: str | Path, interval: float = 1.0):
+        self.rulebook = rulebook
+        self.directory = Path(directory)
+        self.interval = interval
+        # path -> ((mtime_ns, size), names of the scenarios it defines)
+        self._files: dict[Path, tuple[tuple[int, int], list[str]]] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        signatures = {}
+        for path in sorted(self.directory.iterdir()):
+            if path.suffix.lower() in SCENARIO_FILE_SUFFIXES and path.is_file():
+                stat = path.stat()
+                signatures[path] = (stat.st_mtime_ns, stat.st_size)
+        return signatures
+
+    def sync(self) -> RulebookVersion | None:
+        """Applies changed, added and deleted files; returns the new version, or None if nothing changed."""
+        signatures = self._scan()
+        changed = [path for path, signature in signatures.items() if self._files.get(path, (None,))[0] != signature]
+        deleted = [path for path in self._files if path not in signatures]
+        if not changed and not deleted:
+            return None
+
+        # Load everything before publishing, so a broken file leaves the rulebook untouched
+        loaded = {path: [_normalize(definition) for definition in load_scenario_definitions(path)] for path in changed}
+        names: dict[str, Path] = {}
+        for path in signatures:
+            file_names = (
+                [definition["scenario_name"] for definition in loaded[path]] if path in loaded else self._files[path][1]
+            )
+            for name in file_names:
+                if name in names:
+                    msg = f"Scenario {name!r} is defined in both {names[name]} and {path}"
+                    raise ValueError(msg)
+                names[name] = path
+
+        current = self.rulebook.current.scenarios
+        upserts = []
+        for definitions in loaded.values():
+            for definition in definitions:
+                existing = current.get(definition["scenario_name"])
+                if existing is None or not _unchanged(existing, definition):
+                    upserts.append(Scenario(**definition))
+        dropped = {name for path in [*changed, *deleted] for name in self._files.get(path, (None, []))[1]}
+        removals = [name for name in dropped if name not in names and name in current]
+
+        version = self.rulebook.apply(upserts, removals)
+        self._files = {
+            path: (
+                (signature, [definition["scenario_name"] for definition in loaded[path]])
+                if path in loaded
+                else self._files[path]
+            )
+            for path, signature in signatures.items()
+        }
+        logger.info(
+            "Synced %s: %d file(s) changed, %d deleted, %d scenario(s) updated, %d removed",
+            self.directory,
+            len(changed),
+            len(deleted),
+            len(upserts),
+            len(removals),
+        )
+        return version
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.sync()
+            except Exception:
+                logger.exception("Failed to sync scenarios from %s", self.directory)
+
+    def start(self) -> "DirectoryWatcher":
+        """Syncs once, raising any load error, then keeps syncing in a background thread."""
+        self.sync()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="ruleenginex-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops the background thread, if running."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
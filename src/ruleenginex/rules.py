@@ -1,12 +1,247 @@
-from ruleenginex.rule import Rule
+import asyncio
+import hashlib
+import time
+from array import array
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor
+from typing import Any
+
+from ruleenginex.batch import as_sequence, new_mask
+from ruleenginex.constants import DEFAULT_ASYNC_COST_THRESHOLD
+from ruleenginex.metrics import STATE as METRICS
+from ruleenginex.metrics import MetricsRegistry
+from ruleenginex.rule import ExtractionContext, Predicate, Rule
+from ruleenginex.tracing import STATE as TRACING
+from ruleenginex.tracing import TraceEvent, Tracer
+
+
+def _chain_all(extract: Callable[[dict], Any], tests: tuple[Callable[[Any], bool], ...]) -> Predicate:
+    def check(request_data: dict) -> bool:
+        actual_value = extract(request_data)
+        for test in tests:
+            if not test(actual_value):
+                return False
+        return True
+
+    return check
 
 
 class Rules:
-    """Represents a collection of rules that must all match for a scenario to activate."""
+    """Represents a collection of rules that must all match for a scenario to activate.
+
+    Rules keep their declaration order in ``rules`` but are evaluated in plan order: cheapest
+    estimated cost first. With ``adaptive=True`` the plan is periodically re-ranked by
+    ``cost / (1 - pass rate)`` from observed outcomes, so selective rules move forward.
+    Since every rule must pass, the plan order never changes the result.
+    """
+
+    REPLAN_INTERVAL = 1000
+
+    __slots__ = ("_compiled", "_outcomes", "_since_replan", "adaptive", "name", "plan", "rules")
+
+    def __init__(self, rules: list[dict], adaptive: bool = False, name: str | None = None):  # noqa: FBT001, FBT002
+        self._assign([Rule(**rule) for rule in rules], adaptive, name)
+
+    @classmethod
+    def from_rules(
+        cls,
+        rules: Iterable[Rule],
+        adaptive: bool = False,  # noqa: FBT001, FBT002
+        name: str | None = None,
+    ) -> "Rules":
+        """Builds a collection from already constructed Rule objects."""
+        instance = cls.__new__(cls)
+        instance._assign(list(rules), adaptive, name)
+        return instance
+
+    def _assign(self, rules: list[Rule], adaptive: bool, name: str | None):  # noqa: FBT001
+        self.rules = rules
+        self.name = name
+        self.adaptive = adaptive
+        if name is not None:
+            for index, rule in enumerate(rules):
+                if rule.label is None:
+                    rule.label = f"{name}[{index}]"
+        plan = sorted(self.rules, key=lambda rule: rule.cost)
+        # Share the rules list when declaration order is already the cheapest-first order
+        self.plan = self.rules if plan == self.rules else plan
+        # [evaluations, passes] per rule, only tracked for adaptive plans
+        self._outcomes = {id(rule): [0, 0] for rule in self.rules} if adaptive else {}
+        self._since_replan = 0
+        self._compiled: Predicate | None = None
+
+    def _rank(self, rule: Rule) -> float:
+        """Expected cost per rejection; lower ranks run first."""
+        evaluations, passes = self._outcomes.get(id(rule), (0, 0))
+        pass_rate = (passes + 1) / (evaluations + 2)
+        return rule.cost / (1 - pass_rate)
+
+    def replan(self):
+        """Re-orders the plan from the outcomes observed so far."""
+        self.plan = sorted(self.rules, key=self._rank)
+        self._since_replan = 0
+
+    def _evaluate_adaptive(self, request_data: dict, context: ExtractionContext) -> bool:
+        outcomes = self._outcomes
+        result = True
+        for rule in self.plan:
+            counters = outcomes.setdefault(id(rule), [0, 0])
+            counters[0] += 1
+            if not rule.evaluate(request_data, context):
+                result = False
+                break
+            counters[1] += 1
+        self._count_pass()
+        return result
+
+    def _count_pass(self):
+        """Counts one adaptive evaluation, re-planning every ``REPLAN_INTERVAL`` of them."""
+        self._since_replan += 1
+        if self._since_replan >= self.REPLAN_INTERVAL:
+            self.replan()
+
+    @property
+    def label(self) -> str:
+        """The metrics label: the name, or a digest of the definitions for an unnamed collection."""
+        if self.name is not None:
+            return self.name
+        return f"rules@{hashlib.sha1(repr(self.to_list()).encode(), usedforsecurity=False).hexdigest()[:12]}"
+
+    def to_list(self) -> list[dict]:
+        """Returns the rule definitions accepted by ``Rules(definitions)``."""
+        return [rule.to_dict() for rule in self.rules]
+
+    def compile(self) -> Predicate:
+        """Returns a cached predicate equivalent to ``evaluate``, built from specialised closures.
+
+        Rules reading the same (target, prop) share a single extractor, so each path is read
+        once per call. The predicate follows the plan order at the time of the first call.
+        """
+        if self._compiled is None:
+            self._compiled = self._compile()
+        return self._compiled
+
+    def _compile(self) -> Predicate:
+        groups: dict[tuple, list[Rule]] = {}
+        for rule in self.plan:
+            groups.setdefault((rule.target, rule.prop), []).append(rule)
+
+        checks: list[Predicate] = []
+        for rules in groups.values():
+            if len(rules) == 1:
+                # A lone rule needs no shared extraction, and may stream its matches
+                checks.append(rules[0].compile())
+            else:
+                checks.append(_chain_all(rules[0].compile_extractor(), tuple(rule.compile_test() for rule in rules)))
+
+        if not checks:
+            return lambda _request_data: True
+        if len(checks) == 1:
+            return checks[0]
+        checks_tuple = tuple(checks)
+
+        def evaluate_compiled(request_data: dict) -> bool:
+            for check in checks_tuple:
+                if not check(request_data):
+                    return False
+            return True
+
+        return evaluate_compiled
+
+    def evaluate(self, request_data: dict, context: ExtractionContext | None = None) -> bool:
+        """Evaluates all rules in this collection.
+
+        Rules reading the same (target, prop) share one extraction through context; pass a
+        context to share it with other rule sets evaluated against the same request.
+        """
+        if context is None:
+            context = {}
+        tracer = TRACING.tracer
+        registry = METRICS.registry
+        if registry is not None and not registry.sample("rule_set"):
+            registry = None
+        if tracer is not None or registry is not None:
+            return self._evaluate_instrumented(request_data, context, tracer, registry)
+        if self.adaptive:
+            return self._evaluate_adaptive(request_data, context)
+        return all(rule.evaluate(request_data, context) for rule in self.plan)
+
+    def _evaluate_instrumented(
+        self,
+        request_data: dict,
+        context: ExtractionContext,
+        tracer: Tracer | None,
+        registry: MetricsRegistry | None,
+    ) -> bool:
+        """Evaluates the plan while recording which rule decided the outcome and/or sampled metrics."""
+        outcomes = self._outcomes if self.adaptive else None
+        start = time.perf_counter_ns()
+        deciding_rule = None
+        result = True
+        for rule in self.plan:
+            deciding_rule = rule
+            passed = rule.evaluate(request_data, context)
+            if outcomes is not None:
+                counters = outcomes.setdefault(id(rule), [0, 0])
+                counters[0] += 1
+                counters[1] += bool(passed)
+            if not passed:
+                result = False
+                break
+        elapsed_ns = time.perf_counter_ns() - start
+        if registry is not None:
+            registry.observe_rule_set(self.label, result, elapsed_ns)
+        if tracer is not None:
+            tracer.record(TraceEvent("rules", deciding_rule, None, result, elapsed_ns))
+        if outcomes is not None:
+            self._count_pass()
+        return result
+
+    async def aevaluate(
+        self,
+        request_data: dict,
+        executor: Executor | None = None,
+        cost_threshold: int = DEFAULT_ASYNC_COST_THRESHOLD,
+        context: ExtractionContext | None = None,
+    ) -> bool:
+        """Evaluates all rules without blocking the event loop on expensive ones.
+
+        Rules cheaper than cost_threshold run inline; if they all pass, the remaining rules
+        run together in executor (the loop's default executor when None). Cancelling the
+        caller abandons the executor result without touching shared state.
+        """
+        if context is None:
+            context = {}
+        expensive = []
+        for rule in self.plan:
+            if rule.cost >= cost_threshold:
+                expensive.append(rule)
+            elif not rule.evaluate(request_data, context):
+                return False
+        if not expensive:
+            return True
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, lambda: all(rule.evaluate(request_data, context) for rule in expensive)
+        )
 
-    def __init__(self, rules: list[dict]):
-        self.rules = [Rule(**rule) for rule in rules]
+    def evaluate_many(self, records: Iterable[dict]) -> array:
+        """Evaluates all rules against every record and returns a boolean mask.
 
-    def evaluate(self, request_data: dict) -> bool:
-        """Evaluates all rules in this collection."""
-        return all(rule.evaluate(request_data) for rule in self.rules)
+        Each rule, in plan order, only sees the records that every earlier rule accepted.
+        """
+        records = as_sequence(records)
+        mask = new_mask(len(records))
+        active = list(range(len(records)))
+        for rule in self.plan:
+            if not active:
+                break
+            rule_mask = rule.evaluate_many([records[position] for position in active])
+            survivors = []
+            for position, matched in zip(active, rule_mask, strict=True):
+                if matched:
+                    survivors.append(position)
+                else:
+                    mask[position] = 0
+            active = survivors
+        return mask
@@ -1,17 +1,56 @@
+from array import array
+from collections.abc import Iterable
+from concurrent.futures import Executor
+
+from ruleenginex.constants import DEFAULT_ASYNC_COST_THRESHOLD
+from ruleenginex.rule import ExtractionContext, Predicate
 from ruleenginex.rules import Rules
 
 
 class Scenario:
     """Represents a scenario containing rules and a response."""
 
+    __slots__ = ("response", "rules", "scenario_name")
+
     def __init__(self, scenario_name: str, rules: list[dict], response: dict):
         self.scenario_name = scenario_name
-        self.rules = Rules(rules)
+        self.rules = Rules(rules, name=scenario_name)
         self.response = response
 
-    def evaluate(self, request_data: dict) -> bool:
+    @classmethod
+    def from_rules(cls, scenario_name: str, rules: Rules, response: dict) -> "Scenario":
+        """Builds a scenario around an already constructed Rules collection."""
+        scenario = cls.__new__(cls)
+        scenario.scenario_name = scenario_name
+        scenario.rules = rules
+        scenario.response = response
+        return scenario
+
+    def to_dict(self) -> dict:
+        """Returns the scenario definition accepted by ``Scenario(**definition)``."""
+        return {"scenario_name": self.scenario_name, "rules": self.rules.to_list(), "response": self.response}
+
+    def compile(self) -> Predicate:
+        """Returns a cached predicate equivalent to ``evaluate``; see ``Rules.compile``."""
+        return self.rules.compile()
+
+    def evaluate(self, request_data: dict, context: ExtractionContext | None = None) -> bool:
         """Evaluates whether this scenario should be used based on request data."""
-        return self.rules.evaluate(request_data)
+        return self.rules.evaluate(request_data, context)
+
+    async def aevaluate(
+        self,
+        request_data: dict,
+        executor: Executor | None = None,
+        cost_threshold: int = DEFAULT_ASYNC_COST_THRESHOLD,
+        context: ExtractionContext | None = None,
+    ) -> bool:
+        """Evaluates this scenario, running expensive rules in an executor."""
+        return await self.rules.aevaluate(request_data, executor, cost_threshold, context)
+
+    def evaluate_many(self, records: Iterable[dict]) -> array:
+        """Evaluates this scenario against every record and returns a boolean mask."""
+        return self.rules.evaluate_many(records)
 
     def get_response(self) -> dict:
         """Returns the response associated with this scenario."""
@@ -0,0 +1,134 @@
+import gc
+import hashlib
+import marshal
+import mmap
+import os
+import struct
+from collections.abc import Hashable, Iterable
+from pathlib import Path
+
+from ruleenginex.constants import OperatorEnum
+from ruleenginex.exceptions import SnapshotError
+from ruleenginex.interning import FreezeError
+from ruleenginex.interning import freeze as freeze_value
+from ruleenginex.operatorx import OperatorEvaluator
+from ruleenginex.rule import Rule
+from ruleenginex.rules import Rules
+from ruleenginex.scenario import Scenario
+
+SNAPSHOT_MAGIC = b"RXSNAP"
+SNAPSHOT_FORMAT_VERSION = 2
+
+# Pinned so a snapshot written by one interpreter stays readable by the workers of another.
+MARSHAL_VERSION = 4
+
+# magic, format version, marshal version, sha256 of the payload, payload length
+_HEADER = struct.Struct("<6sHH32sQ")
+
+
+def _encode(scenarios: Iterable[Scenario]) -> bytes:
+    records = [
+        (
+            scenario.scenario_name,
+            scenario.response,
+            [
+                (rule.target, rule.prop, rule.operator.operator.name, rule.operator.expected_value, rule.invert)
+                for rule in scenario.rules.rules
+            ],
+            scenario.rules.adaptive,
+        )
+        for scenario in scenarios
+    ]
+    try:
+        return marshal.dumps(records, MARSHAL_VERSION)
+    except ValueError as e:
+        msg = f"Rulebook contains values that cannot be snapshotted: {e}"
+        raise SnapshotError(msg) from e
+
+
+def _decode(payload: bytes | memoryview) -> list[Scenario]:
+    # Rulebooks repeat the same operators and paths many times over; build each distinct one once
+    evaluators: dict[Hashable, OperatorEvaluator] = {}
+    templates: dict[tuple[str, str], Rule] = {}
+    scenarios = []
+    # The payload passed its content hash check, and marshal cannot execute code while loading
+    for scenario_name, response, rule_records, adaptive in marshal.loads(payload):  # noqa: S302
+        rules = []
+        for target, prop, op, value, invert in rule_records:
+            try:
+                # Typed, so values that are equal but evaluate differently (1 and True) stay apart
+                key: Hashable | None = (op, freeze_value(value)[0])
+                evaluator = evaluators.get(key)
+            except FreezeError:
+                key, evaluator = None, None
+            if evaluator is None:
+                evaluator = OperatorEvaluator(OperatorEnum[op], value)
+                if key is not None:
+                    evaluators[key] = evaluator
+            rule = Rule.from_validated(target, prop, evaluator, invert, templates.get((prop, op)))
+            templates.setdefault((prop, op), rule)
+            rules.append(rule)
+        scenarios.append(Scenario.from_rules(scenario_name, Rules.from_rules(rules, adaptive, scenario_name), response))
+    return scenarios
+
+
+def save_snapshot(scenarios: Iterable[Scenario], path: str | Path) -> str:
+    """Writes validated scenarios to a versioned binary snapshot and returns its content hash.
+
+    The file is written next to path and renamed into place, so readers never see a partial snapshot.
+    """
+    payload = _encode(scenarios)
+    digest = hashlib.sha256(payload).digest()
+    header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, MARSHAL_VERSION, digest, len(payload))
+    path = Path(path)
+    partial = path.with_name(f"{path.name}.partial")
+    with partial.open("wb") as file:
+        file.write(header)
+        file.write(payload)
+    os.replace(partial, path)
+    return digest.hex()
+
+
+def load_snapshot(path: str | Path, *, freeze: bool = False) -> list[Scenario]:
+    """Loads scenarios written by ``save_snapshot``.
+
+    The file is memory-mapped read-only and its content hash checked against the header;
+    a matching hash means the rules were validated when saved, so validation is skipped.
+    With freeze=True the loaded objects are moved out of reach of the garbage collector
+    (``gc.freeze``), so workers forked afterwards keep sharing their pages with the parent.
+    """
+    with Path(path).open("rb") as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:
+            msg = f"Snapshot {path} is empty"
+            raise SnapshotError(msg) from e
+    with mapped:
+        if len(mapped) < _HEADER.size:
+            msg = f"Snapshot {path} is truncated"
+            raise SnapshotError(msg)
+        magic, format_version, marshal_version, digest, length = _HEADER.unpack_from(mapped)
+        if magic != SNAPSHOT_MAGIC:
+            msg = f"{path} is not a rulebook snapshot"
+            raise SnapshotError(msg)
+        if format_version != SNAPSHOT_FORMAT_VERSION or marshal_version != MARSHAL_VERSION:
+            msg = f"Unsupported snapshot version {format_version}.{marshal_version} in {path}"
+            raise SnapshotError(msg)
+        if len(mapped) != _HEADER.size + length:
+            msg = f"Snapshot {path} is truncated"
+            raise SnapshotError(msg)
+        with memoryview(mapped)[_HEADER.size :] as payload:
+            if hashlib.sha256(payload).digest() != digest:
+                msg = f"Snapshot {path} failed its content hash check"
+                raise SnapshotError(msg)
+            # Loading only allocates, so collection passes would find nothing to free
+            collecting = gc.isenabled()
+            gc.disable()
+            try:
+                scenarios = _decode(payload)
+            finally:
+                if collecting:
+                    gc.enable()
+    if freeze:
+        gc.freeze()
+    return scenarios
@@ -0,0 +1,145 @@
+import gzip
+import json
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from typing import IO, Any
+
+from ruleenginex.rules import Rules
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+DEFAULT_BATCH_SIZE = 1024
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+BinarySource = IO[bytes] | gzip.GzipFile
+
+
+class FilterStats:
+    """Counters collected while filtering a stream of records."""
+
+    def __init__(self):
+        self.records = 0
+        self.matched = 0
+        self.errors = 0
+        self.started = time.perf_counter()
+        self.finished: float | None = None
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds spent filtering so far."""
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return end - self.started
+
+    @property
+    def records_per_sec(self) -> float:
+        """Throughput in records per second."""
+        elapsed = self.elapsed
+        return self.records / elapsed if elapsed > 0 else 0.0
+
+    def __str__(self):
+        return (
+            f"records={self.records} matched={self.matched} errors={self.errors} "
+            f"elapsed={self.elapsed:.3f}s records/sec={self.records_per_sec:,.0f}"
+        )
+
+
+def open_input(path: str | None) -> BinarySource:
+    """Opens path for binary reading; "-" or None is stdin, gzip input is detected by its magic bytes."""
+    if path is None or path == "-":
+        stream = sys.stdin.buffer
+        if stream.peek(2)[:2] == GZIP_MAGIC:  # type: ignore[union-attr]
+            return gzip.GzipFile(fileobj=stream)
+        return stream
+    with open(path, "rb") as fp:
+        magic = fp.read(2)
+    if magic == GZIP_MAGIC:
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def iter_lines(stream: BinarySource, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yields newline-delimited lines, without the newline, reading the stream in fixed-size chunks."""
+    # Pieces of a line spanning chunks, joined once its newline arrives so long lines are copied once
+    pending: list[bytes] = []
+    while chunk := stream.read(chunk_size):
+        lines = chunk.split(b"\n")
+        tail = lines.pop()
+        if lines:
+            if pending:
+                pending.append(lines[0])
+                lines[0] = b"".join(pending)
+                pending.clear()
+            yield from lines
+        if tail:
+            pending.append(tail)
+    if pending:
+        yield b"".join(pending)
+
+
+def _to_request(record: Any, target: str | None) -> dict:
+    return record if target is None else {target: record}
+
+
+def filter_lines(
+    rules: Rules,
+    lines: Iterable[bytes],
+    target: str | None = "body",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    stats: FilterStats | None = None,
+) -> Iterator[bytes]:
+    """Yields the raw lines whose decoded record satisfies every rule.
+
+    Each line is decoded as JSON and evaluated as ``{target: record}``, or as the full request
+    data when target is None. Blank lines are skipped; undecodable lines, and lines that are not
+    JSON objects when target is None, are counted as errors.
+    """
+    stats = stats if stats is not None else FilterStats()
+    batch_lines: list[bytes] = []
+    batch_records: list[dict] = []
+
+    def flush() -> Iterator[bytes]:
+        mask = rules.evaluate_many(batch_records)
+        for line, matched in zip(batch_lines, mask, strict=True):
+            if matched:
+                stats.matched += 1
+                yield line
+        batch_lines.clear()
+        batch_records.clear()
+
+    for line in lines:
+        if not line.strip():
+            continue
+        stats.records += 1
+        try:
+            record = json.loads(line)
+        except ValueError:
+            stats.errors += 1
+            continue
+        if target is None and not isinstance(record, dict):
+            stats.errors += 1
+            continue
+        batch_lines.append(line)
+        batch_records.append(_to_request(record, target))
+        if len(batch_records) >= batch_size:
+            yield from flush()
+    if batch_records:
+        yield from flush()
+    stats.finished = time.perf_counter()
+
+
+def filter_stream(
+    rules: Rules,
+    source: BinarySource,
+    sink: IO[bytes],
+    target: str | None = "body",
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> FilterStats:
+    """Copies the matching lines of an NDJSON source to sink byte-for-byte and returns the stats."""
+    stats = FilterStats()
+    for line in filter_lines(rules, iter_lines(source, chunk_size), target, batch_size, stats):
+        sink.write(line)
+        sink.write(b"\n")
+    return stats
@@ -0,0 +1,110 @@
+import hashlib
+import json
+import reprlib
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, NamedTuple
+
+VALUE_MODES = ("repr", "hash", "none")
+
+
+class TraceEvent(NamedTuple):
+    """One traced evaluation.
+
+    ``scope`` is "rule" for a single rule, or "rules" for a rule set, in which case ``rule`` is
+    the rule that decided the outcome (the first failing rule, else the last one evaluated).
+    """
+
+    scope: str
+    rule: Any
+    value: str | None
+    result: bool
+    elapsed_ns: int
+
+
+class Tracer:
+    """Collects trace events into a bounded ring buffer and/or forwards them to a sink callback.
+
+    Extracted values are summarised as a size-limited repr, a SHA-1 of their JSON form, or
+    dropped, depending on value_mode.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        sink: Callable[[TraceEvent], None] | None = None,
+        value_mode: str = "repr",
+        max_value_length: int = 80,
+    ):
+        if value_mode not in VALUE_MODES:
+            msg = f"value_mode must be one of: {', '.join(VALUE_MODES)}"
+            raise ValueError(msg)
+        self.events: deque[TraceEvent] = deque(maxlen=capacity)
+        self.sink = sink
+        self.value_mode = value_mode
+        self._repr = reprlib.Repr()
+        self._repr.maxlevel = 3
+        self._repr.maxstring = max_value_length
+        self._repr.maxother = max_value_length
+
+    def summarize(self, value: Any) -> str | None:
+        """Returns the bounded summary of an extracted value stored in trace events."""
+        if self.value_mode == "repr":
+            return self._repr.repr(value)
+        if self.value_mode == "hash":
+            try:
+                encoded = json.dumps(value, sort_keys=True, default=repr).encode()
+            except (TypeError, ValueError):
+                # Keys that cannot be sorted against each other, or a circular reference
+                encoded = repr(value).encode()
+            return hashlib.sha1(encoded, usedforsecurity=False).hexdigest()
+        return None
+
+    def record(self, event: TraceEvent):
+        """Stores an event in the ring buffer and forwards it to the sink."""
+        self.events.append(event)
+        if self.sink is not None:
+            self.sink(event)
+
+    def clear(self):
+        """Drops every buffered event."""
+        self.events.clear()
+
+
+class _TracingState:
+    __slots__ = ("tracer",)
+
+    def __init__(self):
+        self.tracer: Tracer | None = None
+
+
+# The active tracer; evaluation only pays an attribute check while this is None.
+STATE = _TracingState()
+
+
+def enable_tracing(tracer: Tracer | None = None) -> Tracer:
+    """Activates tracing process-wide and returns the active tracer."""
+    STATE.tracer = tracer if tracer is not None else Tracer()
+    return STATE.tracer
+
+
+def disable_tracing():
+    """Deactivates tracing."""
+    STATE.tracer = None
+
+
+def active_tracer() -> Tracer | None:
+    """Returns the active tracer, or None when tracing is off."""
+    return STATE.tracer
+
+
+@contextmanager
+def tracing(tracer: Tracer | None = None) -> Iterator[Tracer]:
+    """Traces every evaluation inside the block, restoring the previous tracer afterwards."""
+    previous = STATE.tracer
+    active = enable_tracing(tracer)
+    try:
+        yield active
+    finally:
+        STATE.tracer = previous
@@ -0,0 +1,23 @@
+import unittest
+from array import array
+
+from ruleenginex.batch import as_sequence, new_mask, to_mask
+
+
+class TestBatchHelpers(unittest.TestCase):
+    def test_as_sequence_keeps_lists(self):
+        records = [{"a": 1}]
+        self.assertIs(as_sequence(records), records)
+        self.assertEqual(as_sequence(iter(records)), records)
+
+    def test_new_mask(self):
+        self.assertEqual(new_mask(3), array("b", [1, 1, 1]))
+        self.assertEqual(new_mask(2, fill=False), array("b", [0, 0]))
+
+    def test_to_mask(self):
+        self.assertEqual(to_mask([True, 0, "x"]), array("b", [1, 0, 1]))
+        self.assertEqual(to_mask([True, False], invert=True), array("b", [0, 1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
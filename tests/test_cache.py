@@ -0,0 +1,70 @@
+import unittest
+
+from ruleenginex.cache import CacheInfo, LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_get_or_create_counts_hits_and_misses(self):
+        cache = LRUCache(maxsize=2)
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return "value"
+
+        self.assertEqual(cache.get_or_create("key", factory), "value")
+        self.assertEqual(cache.get_or_create("key", factory), "value")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.info(), CacheInfo(hits=1, misses=1, maxsize=2, currsize=1))
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.get_or_create("a", lambda: 1)
+        cache.get_or_create("b", lambda: 2)
+        cache.get_or_create("a", lambda: 1)  # "a" is now most recently used
+        cache.get_or_create("c", lambda: 3)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+
+    def test_factory_errors_are_not_cached(self):
+        cache = LRUCache(maxsize=2)
+
+        def factory():
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            cache.get_or_create("bad", factory)
+        self.assertNotIn("bad", cache)
+
+    def test_clear_resets_counters(self):
+        cache = LRUCache(maxsize=2)
+        cache.get_or_create("a", lambda: 1)
+        cache.clear()
+        self.assertEqual(cache.info(), CacheInfo(hits=0, misses=0, maxsize=2, currsize=0))
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            LRUCache(maxsize=0)
+
+    def test_entries_expire_after_ttl(self):
+        now = [0.0]
+        cache = LRUCache(maxsize=2, ttl=10, clock=lambda: now[0])
+        cache.get_or_create("a", lambda: 1)
+        now[0] = 9.9
+        self.assertEqual(cache.get_or_create("a", lambda: 2), 1)
+        self.assertIn("a", cache)
+        now[0] = 10.0
+        self.assertNotIn("a", cache)
+        self.assertEqual(cache.get_or_create("a", lambda: 3), 3)
+        self.assertEqual(cache.info(), CacheInfo(hits=1, misses=2, maxsize=2, currsize=1))
+        now[0] = 19.9
+        self.assertEqual(cache.get_or_create("a", lambda: 4), 3)
+
+    def test_invalid_ttl(self):
+        with self.assertRaises(ValueError):
+            LRUCache(ttl=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
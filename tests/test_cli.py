@@ -0,0 +1,64 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from ruleenginex.cli import main
+
+
+class TestCli(unittest.TestCase):
+    def test_filter_command(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            rules_path = os.path.join(tmp, "rules.yaml")
+            input_path = os.path.join(tmp, "events.ndjson")
+            output_path = os.path.join(tmp, "out.ndjson")
+            with open(rules_path, "w", encoding="utf-8") as fp:
+                fp.write("- {target: body, prop: type, op: EQUALS, value: purchase}\n")
+            with open(input_path, "w", encoding="utf-8") as fp:
+                fp.write(json.dumps({"type": "purchase"}) + "\n" + json.dumps({"type": "refund"}) + "\n")
+
+            self.assertEqual(main(["filter", rules_path, input_path, "-o", output_path]), 0)
+
+            with open(output_path, encoding="utf-8") as fp:
+                self.assertEqual(fp.read(), '{"type": "purchase"}\n')
+
+    def test_profile_command(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            scenarios_path = os.path.join(tmp, "scenarios.json")
+            requests_path = os.path.join(tmp, "requests.ndjson")
+            with open(scenarios_path, "w", encoding="utf-8") as fp:
+                scenario = {
+                    "scenario_name": "get",
+                    "rules": [{"target": "method", "prop": "", "op": "EQUALS", "value": "GET"}],
+                    "response": {},
+                }
+                json.dump([scenario], fp)
+            with open(requests_path, "w", encoding="utf-8") as fp:
+                fp.write('{"method": "GET"}\n{"method": "POST"}\n')
+
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                self.assertEqual(main(["profile", scenarios_path, requests_path, "--top", "5"]), 0)
+
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn("EQUALS", lines[1])
+
+    def test_dedupe_command(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            scenarios_path = os.path.join(tmp, "scenarios.json")
+            with open(scenarios_path, "w", encoding="utf-8") as fp:
+                rule = {"target": "method", "prop": "", "op": "EQUALS", "value": "POST"}
+                json.dump([{"scenario_name": f"s{i}", "rules": [rule], "response": {}} for i in range(3)], fp)
+
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                self.assertEqual(main(["dedupe", scenarios_path]), 0)
+
+        self.assertIn("rules=3 unique=1 deduplicated=2", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+
+from ruleenginex.rule import Rule
+from ruleenginex.rules import Rules
+from ruleenginex.scenario import Scenario
+
+RULE_DEFINITIONS = [
+    {"target": "method", "prop": "", "op": "EQUALS", "value": "POST"},
+    {"target": "body", "prop": "user.id", "op": "EQUALS", "value": 7},
+    {"target": "body", "prop": "user.id", "op": "NULL", "value": None, "invert": True},
+    {"target": "body", "prop": "user", "op": "VALID_JSON_SCHEMA", "value": {"required": ["id"]}},
+    {"target": "body", "prop": "tags", "op": "EMPTY_ARRAY", "value": None, "invert": True},
+    {"target": "body", "prop": "$.items[*].sku", "op": "ARRAY_INCLUDES", "value": "A"},
+    {"target": "headers", "prop": "Authorization", "op": "REGEX_CASE_INSENSITIVE", "value": "^bearer "},
+    {"target": "headers", "prop": "X-Trace", "op": "REGEX", "value": r"^\d+$"},
+]
+
+REQUESTS = [
+    {
+        "method": "POST",
+        "headers": {"Authorization": "Bearer abc", "X-Trace": "42"},
+        "body": {"user": {"id": 7}, "tags": ["x"], "items": [{"sku": "A"}, {"sku": "B"}]},
+    },
+    {"method": "POST", "headers": {"Authorization": "Basic"}, "body": {"user": {"id": 7}, "tags": []}},
+    {"method": "GET", "body": {"user": "not a dict", "items": [{"sku": "A"}]}},
+    {"body": []},
+    {},
+]
+
+
+class TestCompiledRules(unittest.TestCase):
+    def test_compiled_rule_matches_interpreted_rule(self):
+        for definition in RULE_DEFINITIONS:
+            rule = Rule(**definition)
+            predicate = rule.compile()
+            for request_data in REQUESTS:
+                with self.subTest(rule=definition, request_data=request_data):
+                    self.assertEqual(bool(predicate(request_data)), rule.evaluate(request_data))
+
+    def test_compiled_rules_match_interpreted_rules(self):
+        for size in range(len(RULE_DEFINITIONS) + 1):
+            rules = Rules(RULE_DEFINITIONS[:size])
+            predicate = rules.compile()
+            for request_data in REQUESTS:
+                with self.subTest(size=size, request_data=request_data):
+                    self.assertEqual(bool(predicate(request_data)), rules.evaluate(request_data))
+
+    def test_compiled_predicate_is_cached(self):
+        scenario = Scenario("s", RULE_DEFINITIONS, {})
+        self.assertIs(scenario.compile(), scenario.compile())
+        self.assertTrue(scenario.compile()(REQUESTS[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
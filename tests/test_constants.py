@@ -13,6 +13,15 @@ class TestConstants(unittest.TestCase):
             "REGEX",
             "REGEX_CASE_INSENSITIVE",
             "VALID_JSON_SCHEMA",
+            "IN",
+            "ANY_OF",
+            "ALL_OF",
+            "INTERSECTS",
+            "GT",
+            "GTE",
+            "LT",
+            "LTE",
+            "BETWEEN",
         }
         actual_members = set(OperatorEnum.__members__.keys())
         self.assertEqual(expected_members, actual_members)
@@ -25,6 +34,7 @@ class TestConstants(unittest.TestCase):
         self.assertEqual(str(OperatorEnum.REGEX), "regex")
         self.assertEqual(str(OperatorEnum.REGEX_CASE_INSENSITIVE), "regex case insensitive")
         self.assertEqual(str(OperatorEnum.VALID_JSON_SCHEMA), "valid json schema")
+        self.assertEqual(str(OperatorEnum.ANY_OF), "any of")
 
     def test_target_operator_map_keys(self):
         expected_keys = {
@@ -45,6 +55,10 @@ class TestConstants(unittest.TestCase):
         self.assertIn(OperatorEnum.EQUALS, TARGET_OPERATOR_MAP["body"])
         self.assertIn(OperatorEnum.REGEX, TARGET_OPERATOR_MAP["params"])
         self.assertNotIn(OperatorEnum.EMPTY_ARRAY, TARGET_OPERATOR_MAP["path"])
+        self.assertIn(OperatorEnum.IN, TARGET_OPERATOR_MAP["method"])
+        self.assertNotIn(OperatorEnum.ALL_OF, TARGET_OPERATOR_MAP["route_params"])
+        self.assertIn(OperatorEnum.BETWEEN, TARGET_OPERATOR_MAP["number"])
+        self.assertNotIn(OperatorEnum.GT, TARGET_OPERATOR_MAP["path"])
         # Add more assertions as needed
 
 
@@ -0,0 +1,109 @@
+import random
+import unittest
+
+from ruleenginex.decisions import DecisionCache, DecisionCacheInfo
+from ruleenginex.dispatcher import Dispatcher
+from ruleenginex.rulebook import Rulebook
+from ruleenginex.scenario import Scenario
+
+
+def _scenarios():
+    return [
+        Scenario(
+            "create admin",
+            [
+                {"target": "method", "prop": "", "op": "EQUALS", "value": "POST"},
+                {"target": "body", "prop": "$.user.roles[*]", "op": "ARRAY_INCLUDES", "value": "admin"},
+            ],
+            {"status": 201},
+        ),
+        Scenario(
+            "numbered",
+            [{"target": "params", "prop": "id", "op": "REGEX", "value": r"^1(\.0)?$"}],
+            {"status": 200},
+        ),
+        Scenario("flag", [{"target": "params", "prop": "flag", "op": "EQUALS", "value": True}], {"status": 202}),
+        Scenario("fallback", [], {"status": 404}),
+    ]
+
+
+class TestDecisionCache(unittest.TestCase):
+    def setUp(self):
+        self.scenarios = _scenarios()
+        self.dispatcher = Dispatcher(self.scenarios)
+        self.cache = DecisionCache(self.dispatcher, maxsize=64)
+
+    def test_agrees_with_dispatcher(self):
+        rng = random.Random(7)  # noqa: S311
+        values = [None, 0, 1, 1.0, -0.0, 0.0, True, False, "1", "admin", ["admin"], {"a": 1}, {"a": True}]
+        for _ in range(300):
+            request_data = {
+                "method": rng.choice(["GET", "POST"]),
+                "body": {"user": {"roles": rng.choice([["admin"], ["guest"], ["guest", "admin"], []])}},
+                "params": {"id": rng.choice(values), "flag": rng.choice(values)},
+                "headers": {"X-Request-Id": str(rng.random())},
+            }
+            with self.subTest(request_data=request_data):
+                self.assertIs(self.cache.match(request_data), self.dispatcher.match(request_data))
+                self.assertEqual(self.cache.match_all(request_data), self.dispatcher.match_all(request_data))
+        self.assertGreater(self.cache.info().hits, 0)
+
+    def test_fields_no_rule_reads_are_ignored(self):
+        first = {"method": "POST", "body": {"user": {"roles": ["admin", "x"], "name": "a"}}, "headers": {"X-Id": "1"}}
+        second = {"method": "POST", "body": {"user": {"roles": ["admin", "x"], "name": "b"}}, "headers": {"X-Id": "2"}}
+        self.assertEqual(self.cache.fingerprint(first), self.cache.fingerprint(second))
+        self.assertIs(self.cache.match(first), self.scenarios[0])
+        self.assertIs(self.cache.match(second), self.scenarios[0])
+        self.assertEqual(self.cache.info(), DecisionCacheInfo(1, 1, 0, 0, 64, 1))
+        self.assertEqual(self.cache.info().hit_ratio, 0.5)
+
+    def test_values_that_evaluate_differently_have_different_fingerprints(self):
+        fingerprints = {
+            self.cache.fingerprint({"params": {"id": value}}) for value in (1, 1.0, True, "1", 0.0, -0.0, [1], (1,))
+        }
+        self.assertEqual(len(fingerprints), 8)
+
+    def test_unhashable_and_huge_values_bypass(self):
+        cache = DecisionCache(self.dispatcher, max_fingerprint_size=100)
+        for request_data in (
+            {"params": {"id": object()}},
+            {"params": {"id": "x" * 1000}},
+            {"params": {"id": [0] * 200}},
+        ):
+            with self.subTest(request_data=request_data):
+                self.assertIsNone(cache.fingerprint(request_data))
+                self.assertIs(cache.match(request_data), self.dispatcher.match(request_data))
+        self.assertEqual(cache.info().bypassed, 3)
+        self.assertEqual(cache.info().currsize, 0)
+
+    def test_ttl(self):
+        now = [0.0]
+        cache = DecisionCache(self.dispatcher, ttl=5, clock=lambda: now[0])
+        request_data = {"method": "GET"}
+        cache.match(request_data)
+        cache.match(request_data)
+        now[0] = 6
+        cache.match(request_data)
+        self.assertEqual((cache.info().hits, cache.info().misses), (1, 2))
+
+    def test_rulebook_changes_invalidate(self):
+        rulebook = Rulebook(self.scenarios)
+        cache = DecisionCache(rulebook)
+        request_data = {"method": "GET", "params": {"id": "1"}}
+        self.assertEqual(cache.match(request_data).scenario_name, "numbered")
+        rulebook.remove("numbered")
+        self.assertEqual(cache.match(request_data).scenario_name, "fallback")
+        rulebook.add(Scenario("get", [{"target": "method", "prop": "", "op": "EQUALS", "value": "GET"}], {}))
+        self.assertEqual(cache.match(request_data).scenario_name, "fallback")
+        self.assertEqual(cache.match_all(request_data)[-1].scenario_name, "get")
+        self.assertEqual(cache.info().invalidations, 2)
+
+    def test_invalidate(self):
+        self.cache.match({"method": "GET"})
+        self.cache.invalidate()
+        self.cache.match({"method": "GET"})
+        self.assertEqual(self.cache.info(), DecisionCacheInfo(0, 2, 0, 1, 64, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
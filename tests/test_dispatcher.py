@@ -0,0 +1,273 @@
+import unittest
+from unittest import mock
+
+from ruleenginex.dispatcher import Dispatcher
+from ruleenginex.exceptions import JsonPathParsingError
+from ruleenginex.rule import Rule
+from ruleenginex.scenario import Scenario
+
+
+def linear_match_all(scenarios, request_data):
+    return [scenario for scenario in scenarios if scenario.evaluate(request_data)]
+
+
+class TestDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.scenarios = [
+            Scenario(
+                "get user",
+                [
+                    {"target": "method", "prop": "", "op": "EQUALS", "value": "GET"},
+                    {"target": "path", "prop": "", "op": "EQUALS", "value": "/users"},
+                ],
+                {"status": 200},
+            ),
+            Scenario(
+                "create user",
+                [
+                    {"target": "method", "prop": "", "op": "EQUALS", "value": "POST"},
+                    {"target": "path", "prop": "", "op": "EQUALS", "value": "/users"},
+                    {"target": "headers", "prop": "X-Tenant", "op": "EQUALS", "value": "acme"},
+                ],
+                {"status": 201},
+            ),
+            Scenario(
+                "any users path",
+                [{"target": "path", "prop": "", "op": "REGEX", "value": "^/users"}],
+                {"status": 202},
+            ),
+            Scenario(
+                "not a get",
+                [{"target": "method", "prop": "", "op": "EQUALS", "value": "GET", "invert": True}],
+                {"status": 405},
+            ),
+            Scenario(
+                "list body",
+                [{"target": "body", "prop": "tags", "op": "EQUALS", "value": ["a"]}],
+                {"status": 206},
+            ),
+            Scenario("fallback", [], {"status": 404}),
+        ]
+        self.dispatcher = Dispatcher(self.scenarios)
+        self.requests = [
+            {"method": "GET", "path": "/users"},
+            {"method": "POST", "path": "/users", "headers": {"X-Tenant": "acme"}},
+            {"method": "POST", "path": "/users", "headers": {"X-Tenant": "other"}},
+            {"method": "DELETE", "path": "/orders"},
+            {"method": ["GET"], "path": {"unhashable": True}},
+            {"body": {"tags": ["a"]}},
+            {},
+        ]
+
+    def test_match_all_agrees_with_linear_scan(self):
+        for request_data in self.requests:
+            with self.subTest(request_data=request_data):
+                self.assertEqual(
+                    self.dispatcher.match_all(request_data), linear_match_all(self.scenarios, request_data)
+                )
+
+    def test_match_returns_first_linear_match(self):
+        for request_data in self.requests:
+            with self.subTest(request_data=request_data):
+                expected = linear_match_all(self.scenarios, request_data)
+                self.assertIs(self.dispatcher.match(request_data), expected[0] if expected else None)
+
+    def test_candidates_skip_non_matching_equality_buckets(self):
+        names = [scenario.scenario_name for scenario in self.dispatcher.candidates({"method": "PUT", "path": "/x"})]
+        self.assertNotIn("get user", names)
+        self.assertNotIn("create user", names)
+        self.assertIn("fallback", names)
+
+    def test_replace_agrees_with_rebuild_and_leaves_original_untouched(self):
+        put_users = Scenario(
+            "put user",
+            [
+                {"target": "method", "prop": "", "op": "EQUALS", "value": "PUT"},
+                {"target": "path", "prop": "", "op": "EQUALS", "value": "/users"},
+            ],
+            {"status": 200},
+        )
+        replaced = self.dispatcher.replace(self.scenarios[0], put_users)
+        removed = replaced.replace(self.scenarios[1], None)
+        appended = removed.replace(None, self.scenarios[0])
+        expected = [put_users, *self.scenarios[2:], self.scenarios[0]]
+
+        self.assertEqual(appended.scenarios, expected)
+        requests = [*self.requests, {"method": "PUT", "path": "/users"}]
+        for request_data in requests:
+            with self.subTest(request_data=request_data):
+                self.assertEqual(appended.match_all(request_data), Dispatcher(expected).match_all(request_data))
+                self.assertEqual(
+                    self.dispatcher.match_all(request_data), linear_match_all(self.scenarios, request_data)
+                )
+
+    def test_replace_unknown_scenario(self):
+        with self.assertRaises(ValueError):
+            self.dispatcher.replace(Scenario("stranger", [], {}), None)
+
+    def test_extraction_errors_are_left_to_scenario_evaluation(self):
+        get = Scenario("get", [{"target": "method", "prop": "", "op": "EQUALS", "value": "GET"}], {})
+        scenarios = [
+            get,
+            Scenario("equals", [{"target": "body", "prop": "$.a[0]", "op": "EQUALS", "value": 1}], {}),
+            Scenario("prefix", [{"target": "body", "prop": "$.a[0]", "op": "REGEX", "value": "^ab"}], {}),
+            Scenario("range", [{"target": "body", "prop": "$.a[0]", "op": "GT", "value": 1}], {}),
+        ]
+        request_data = {"method": "GET", "body": {"a": True}}
+        dispatcher = Dispatcher(scenarios)
+        self.assertIs(dispatcher.match(request_data), get)
+        self.assertEqual(dispatcher.candidates(request_data), scenarios)
+        with self.assertRaises(JsonPathParsingError):
+            dispatcher.match_all(request_data)
+
+    def test_empty_dispatcher(self):
+        self.assertIsNone(Dispatcher([]).match({"method": "GET"}))
+
+
+class TestDispatcherRoutes(unittest.TestCase):
+    def setUp(self):
+        self.scenarios = [
+            Scenario(
+                f"get resource {i}",
+                [
+                    {"target": "method", "prop": "", "op": "EQUALS", "value": "GET"},
+                    {"target": "path", "prop": "", "op": "REGEX", "value": rf"^/api/v1/resources/{i}/items/\d+$"},
+                ],
+                {"status": 200},
+            )
+            for i in range(50)
+        ]
+        self.scenarios += [
+            Scenario("users", [{"target": "path", "prop": "", "op": "REGEX_CASE_INSENSITIVE", "value": "/Users"}], {}),
+            Scenario("kelvin", [{"target": "path", "prop": "", "op": "REGEX", "value": "(?i)/k/"}], {}),
+            Scenario("not api", [{"target": "path", "prop": "", "op": "REGEX", "value": "/api", "invert": True}], {}),
+            Scenario("any", [{"target": "path", "prop": "", "op": "REGEX", "value": ".*"}], {}),
+            Scenario("tenant", [{"target": "headers", "prop": "X-Tenant", "op": "REGEX", "value": "^acme-"}], {}),
+        ]
+        self.dispatcher = Dispatcher(self.scenarios)
+        self.requests = [
+            {"method": "GET", "path": "/api/v1/resources/7/items/3"},
+            {"method": "GET", "path": "/api/v1/resources/7/items/x"},
+            {"method": "GET", "path": "/api/v1/resources/17/items/3"},
+            {"method": "POST", "path": "/api/v1/resources/7/items/3"},
+            {"path": "/USERS/1"},
+            {"path": "/u\u017fers"},
+            {"path": "/\u212a/"},
+            {"path": "/K/"},
+            {"path": ["/users"]},
+            {"headers": {"X-Tenant": "acme-1"}},
+            {},
+        ]
+
+    def test_match_all_agrees_with_linear_scan(self):
+        for request_data in self.requests:
+            with self.subTest(request_data=request_data):
+                self.assertEqual(
+                    self.dispatcher.match_all(request_data), linear_match_all(self.scenarios, request_data)
+                )
+
+    def test_candidates_only_include_matching_prefixes(self):
+        names = {scenario.scenario_name for scenario in self.dispatcher.candidates(self.requests[0])}
+        self.assertEqual(names, {"get resource 7", "not api", "any"})
+
+    def test_replace_refiles_route_scenarios(self):
+        moved = Scenario("moved", [{"target": "path", "prop": "", "op": "REGEX", "value": "^/v2/resources/"}], {})
+        replaced = self.dispatcher.replace(self.scenarios[7], moved)
+        expected = [*self.scenarios[:7], moved, *self.scenarios[8:]]
+        for request_data in [*self.requests, {"path": "/v2/resources/1"}]:
+            with self.subTest(request_data=request_data):
+                self.assertEqual(replaced.match_all(request_data), linear_match_all(expected, request_data))
+                self.assertEqual(
+                    self.dispatcher.match_all(request_data), linear_match_all(self.scenarios, request_data)
+                )
+
+
+class TestDispatcherRanges(unittest.TestCase):
+    def setUp(self):
+        # Pricing tiers of 100 units each, plus overlapping, half-bounded and excluded ranges
+        self.scenarios = [
+            Scenario(
+                f"tier {i}",
+                [
+                    {"target": "path", "prop": "", "op": "EQUALS", "value": "/price"},
+                    {"target": "body", "prop": "quantity", "op": "BETWEEN", "value": [i * 100, i * 100 + 99]},
+                ],
+                {"tier": i},
+            )
+            for i in range(40)
+        ]
+        self.scenarios += [
+            Scenario("bulk", [{"target": "body", "prop": "quantity", "op": "GTE", "value": 1000}], {}),
+            Scenario("huge", [{"target": "body", "prop": "quantity", "op": "GT", "value": "3999.5"}], {}),
+            Scenario("small", [{"target": "body", "prop": "quantity", "op": "LT", "value": 10}], {}),
+            Scenario("at most", [{"target": "body", "prop": "quantity", "op": "LTE", "value": 150}], {}),
+            Scenario(
+                "not small", [{"target": "body", "prop": "quantity", "op": "LT", "value": 10, "invert": True}], {}
+            ),
+            Scenario("errors", [{"target": "number", "prop": "", "op": "BETWEEN", "value": [500, 599]}], {}),
+            Scenario("retry", [{"target": "headers", "prop": "Retry-After", "op": "GT", "value": 0}], {}),
+        ]
+        self.dispatcher = Dispatcher(self.scenarios)
+        self.requests = [
+            {"path": "/price", "body": {"quantity": quantity}}
+            for quantity in (-1, 0, 9, 10, 99, 99.5, 100, 150, 150.5, 999, 1000, "1234", 3999, 3999.5, 4000, True)
+        ]
+        self.requests += [
+            {"path": "/price", "body": {"quantity": "many"}},
+            {"path": "/price", "body": {"quantity": [5, 6]}},
+            {"path": "/price"},
+            {"number": 503},
+            {"number": "600"},
+            {"headers": {"Retry-After": "30"}},
+            {"headers": {"Retry-After": "0"}},
+        ]
+
+    def test_match_all_agrees_with_linear_scan(self):
+        for request_data in self.requests:
+            with self.subTest(request_data=request_data):
+                self.assertEqual(
+                    self.dispatcher.match_all(request_data), linear_match_all(self.scenarios, request_data)
+                )
+
+    def test_candidates_only_include_containing_ranges(self):
+        names = {scenario.scenario_name for scenario in self.dispatcher.candidates(self.requests[7])}
+        self.assertEqual(names, {"tier 1", "at most", "not small"})
+
+    def test_replace_refiles_range_scenarios(self):
+        moved = Scenario("moved", [{"target": "body", "prop": "quantity", "op": "BETWEEN", "value": [5, 5000]}], {})
+        replaced = self.dispatcher.replace(self.scenarios[3], moved).replace(self.scenarios[-1], None)
+        expected = [*self.scenarios[:3], moved, *self.scenarios[4:-1]]
+        for request_data in self.requests:
+            with self.subTest(request_data=request_data):
+                self.assertEqual(replaced.match_all(request_data), linear_match_all(expected, request_data))
+                self.assertEqual(
+                    self.dispatcher.match_all(request_data), linear_match_all(self.scenarios, request_data)
+                )
+
+
+class TestDispatcherAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_amatch_agrees_with_match(self):
+        scenarios = [
+            Scenario(
+                "schema", [{"target": "body", "prop": "", "op": "VALID_JSON_SCHEMA", "value": {"required": ["a"]}}], {}
+            ),
+            Scenario("post", [{"target": "method", "prop": "", "op": "EQUALS", "value": "POST"}], {}),
+            Scenario("any", [], {}),
+        ]
+        dispatcher = Dispatcher(scenarios)
+        for request_data in ({"body": {"a": 1}}, {"method": "POST", "body": {}}, {}):
+            with self.subTest(request_data=request_data):
+                self.assertIs(await dispatcher.amatch(request_data, cost_threshold=1), dispatcher.match(request_data))
+                self.assertEqual(await dispatcher.amatch_all(request_data), dispatcher.match_all(request_data))
+
+    async def test_amatch_stops_at_the_first_match(self):
+        schema = {"target": "body", "prop": "", "op": "VALID_JSON_SCHEMA", "value": {"required": ["a"]}}
+        scenarios = [Scenario(f"schema {i}", [schema], {}) for i in range(50)]
+        dispatcher = Dispatcher(scenarios)
+        with mock.patch.object(Rule, "_apply", autospec=True, side_effect=Rule._apply) as apply:
+            self.assertIs(await dispatcher.amatch({"body": {"a": 1}}, cost_threshold=1), scenarios[0])
+        self.assertEqual(apply.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
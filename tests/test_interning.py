@@ -0,0 +1,119 @@
+import unittest
+from unittest import mock
+
+from ruleenginex.dispatcher import Dispatcher
+from ruleenginex.interning import RulePool
+from ruleenginex.rule import Rule
+from ruleenginex.rulebook import Rulebook
+from ruleenginex.scenario import Scenario
+
+AUTHORIZED = {"target": "headers", "prop": "Authorization", "op": "REGEX", "value": "^Bearer "}
+POST = {"target": "method", "prop": "", "op": "EQUALS", "value": "POST"}
+
+
+def _scenarios(count):
+    return [
+        Scenario(
+            f"tag {i}",
+            [POST, AUTHORIZED, {"target": "body", "prop": "tags", "op": "ANY_OF", "value": [f"tag-{i}", "all"]}],
+            {"id": i},
+        )
+        for i in range(count)
+    ]
+
+
+class TestRulePool(unittest.TestCase):
+    def setUp(self):
+        self.pool = RulePool()
+
+    def test_identical_rules_become_one_shared_rule(self):
+        scenarios = [self.pool.intern_scenario(scenario) for scenario in _scenarios(3)]
+        first, second = scenarios[0].rules.rules, scenarios[1].rules.rules
+        self.assertIs(first[0], second[0])
+        self.assertIs(first[1], second[1])
+        self.assertIsNot(first[2], second[2])
+        self.assertTrue(first[0].shared)
+        self.assertFalse(first[2].shared)
+        self.assertEqual(first[0].cost, second[0].cost)
+
+        info = self.pool.info()
+        self.assertEqual((info.references, info.unique, info.deduplicated), (9, 5, 4))
+        self.assertGreater(info.bytes_saved, 0)
+        self.assertIn("deduplicated=4", str(info))
+
+    def test_values_must_match_in_type_and_rules_in_invert(self):
+        rules = [
+            Rule("number", "", "EQUALS", 1),
+            Rule("number", "", "EQUALS", 1.0),
+            Rule("number", "", "EQUALS", True),
+            Rule("number", "", "EQUALS", 1, invert=True),
+            Rule("number", "", "EQUALS", 1),
+        ]
+        pooled = [self.pool.intern(rule) for rule in rules]
+        self.assertEqual(len(self.pool), 4)
+        self.assertIs(pooled[4], rules[0])
+        self.assertEqual(len({id(rule) for rule in pooled[:4]}), 4)
+
+    def test_unfreezable_values_are_left_alone(self):
+        first, second = Rule("body", "tag", "IN", {"a", "b"}), Rule("body", "tag", "IN", {"a", "b"})
+        self.assertIs(self.pool.intern(first), first)
+        self.assertIs(self.pool.intern(second), second)
+        self.assertEqual(len(self.pool), 0)
+
+    def test_release_drops_unreferenced_rules(self):
+        first, second = (self.pool.intern_scenario(scenario) for scenario in _scenarios(2))
+        self.pool.release(first)
+        self.assertEqual(self.pool.info()[:2], (3, 3))
+        self.pool.release(second)
+        self.assertEqual(self.pool.info(), (0, 0, 0))
+        # A scenario the pool never interned leaves it untouched
+        self.pool.intern_scenario(_scenarios(1)[0])
+        self.pool.release(_scenarios(1)[0])
+        self.assertEqual(self.pool.info()[:2], (3, 3))
+
+    def test_shared_rules_are_evaluated_once_per_request(self):
+        scenarios = [self.pool.intern_scenario(scenario) for scenario in _scenarios(20)]
+        shared = scenarios[0].rules.rules[1]
+        dispatcher = Dispatcher(scenarios)
+        request_data = {"method": "POST", "headers": {"Authorization": "Bearer x"}, "body": {"tags": ["all"]}}
+        with mock.patch.object(Rule, "_apply", autospec=True, side_effect=Rule._apply) as apply:
+            matched = dispatcher.match_all(request_data)
+        self.assertEqual(matched, scenarios)
+        self.assertEqual(sum(call.args[0] is shared for call in apply.call_args_list), 1)
+
+    def test_results_agree_with_unpooled_scenarios(self):
+        pooled = Dispatcher([self.pool.intern_scenario(scenario) for scenario in _scenarios(10)])
+        plain = Dispatcher(_scenarios(10))
+        for request_data in (
+            {"method": "POST", "headers": {"Authorization": "Bearer x"}, "body": {"tags": ["tag-3"]}},
+            {"method": "POST", "headers": {"Authorization": "Basic x"}, "body": {"tags": ["all"]}},
+            {"method": "GET", "body": {"tags": ["all"]}},
+            {},
+        ):
+            with self.subTest(request_data=request_data):
+                self.assertEqual(
+                    [scenario.response for scenario in pooled.match_all(request_data)],
+                    [scenario.response for scenario in plain.match_all(request_data)],
+                )
+
+
+class TestRulebookPool(unittest.TestCase):
+    def test_rulebook_interns_and_releases_scenarios(self):
+        pool = RulePool()
+        scenarios = _scenarios(3)
+        rulebook = Rulebook(scenarios, pool=pool)
+        self.assertIs(rulebook.get("tag 1"), scenarios[1])
+        self.assertIs(scenarios[1].rules.rules[0], scenarios[0].rules.rules[0])
+        self.assertEqual(pool.info()[:2], (9, 5))
+
+        added = Scenario("other", [POST], {})
+        rulebook.add(added)
+        self.assertIs(added.rules.rules[0], scenarios[0].rules.rules[0])
+        rulebook.update(rulebook.get("tag 0"))
+        rulebook.remove("tag 2")
+        self.assertEqual(pool.info()[:2], (7, 4))
+        self.assertEqual(rulebook.match({"method": "POST", "headers": {"Authorization": "Bearer x"}}), added)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import math
+import random
+import unittest
+
+from ruleenginex.intervals import IntervalTree
+from ruleenginex.operatorx import NumericRange
+
+
+class TestIntervalTree(unittest.TestCase):
+    def test_stab_agrees_with_a_scan(self):
+        rng = random.Random(7)  # noqa: S311
+        entries = []
+        for i in range(300):
+            low = rng.randint(-50, 50)
+            high = rng.choice([low, low + rng.randint(0, 30), math.inf])
+            low = -math.inf if i % 17 == 0 else low
+            entries.append((NumericRange(low, high, rng.random() < 0.5, rng.random() < 0.5), i))
+        tree = IntervalTree(entries)
+        self.assertEqual(len(tree), len(entries))
+        for number in [*range(-60, 90), -10.5, 0.25, math.inf, -math.inf]:
+            with self.subTest(number=number):
+                expected = sorted(value for numeric_range, value in entries if numeric_range.contains(number))
+                self.assertEqual(sorted(tree.stab(number)), expected)
+
+    def test_open_bounds_and_nan(self):
+        tree = IntervalTree([(NumericRange(1, 2, low_inclusive=False, high_inclusive=False), "open")])
+        self.assertEqual(tree.stab(1.5), ["open"])
+        self.assertEqual(tree.stab(1), [])
+        self.assertEqual(tree.stab(2), [])
+        self.assertEqual(tree.stab(math.nan), [])
+
+    def test_empty_tree(self):
+        self.assertEqual(IntervalTree().stab(0), [])
+        self.assertEqual(len(IntervalTree()), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+
+from ruleenginex.loader import load_rules, load_scenarios
+
+
+class TestLoader(unittest.TestCase):
+    def _write(self, tmp, name, content):
+        path = os.path.join(tmp, name)
+        with open(path, "w", encoding="utf-8") as fp:
+            fp.write(content)
+        return path
+
+    def test_load_rules_from_json_list(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self._write(tmp, "rules.json", '[{"target": "method", "prop": "", "op": "EQUALS", "value": "GET"}]')
+            rules = load_rules(path)
+        self.assertTrue(rules.evaluate({"method": "GET"}))
+
+    def test_load_rules_from_scenario_document(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self._write(tmp, "scenario.yaml", "rules:\n  - {target: method, prop: '', op: EQUALS, value: GET}\n")
+            rules = load_rules(path)
+        self.assertFalse(rules.evaluate({"method": "POST"}))
+
+    def test_load_rules_rejects_other_documents(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self._write(tmp, "bad.yaml", "just a string\n")
+            with self.assertRaises(ValueError):
+                load_rules(path)
+
+    def test_load_scenarios(self):
+        scenario = "scenario_name: s\nrules: []\nresponse: {status: 200}\n"
+        with tempfile.TemporaryDirectory() as tmp:
+            single = load_scenarios(self._write(tmp, "one.yaml", scenario))
+            listed = load_scenarios(
+                self._write(tmp, "many.yaml", "scenarios:\n  - " + scenario.replace("\n", "\n    "))
+            )
+        self.assertEqual([s.scenario_name for s in single], ["s"])
+        self.assertEqual(listed[0].get_response(), {"status": 200})
+
+
+if __name__ == "__main__":
+    unittest.main()
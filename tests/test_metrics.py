@@ -0,0 +1,79 @@
+import json
+import unittest
+
+from ruleenginex.metrics import MetricsRegistry, active_registry, collecting_metrics
+from ruleenginex.rule import Rule
+from ruleenginex.rules import Rules
+from ruleenginex.scenario import Scenario
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.scenario = Scenario(
+            "Create order",
+            [
+                {"target": "method", "prop": "", "op": "EQUALS", "value": "POST"},
+                {"target": "body", "prop": "", "op": "VALID_JSON_SCHEMA", "value": {"required": ["id"]}},
+            ],
+            {"status": 201},
+        )
+
+    def test_metrics_are_off_by_default(self):
+        self.assertIsNone(active_registry())
+
+    def test_records_rule_and_scenario_metrics(self):
+        with collecting_metrics() as registry:
+            self.scenario.evaluate({"method": "POST", "body": {"id": 1}})
+            self.scenario.evaluate({"method": "GET", "body": {"id": 1}})
+        snapshot = registry.snapshot()
+
+        (scenario_stats,) = snapshot["rule_sets"]
+        self.assertEqual(scenario_stats["label"], "Create order")
+        self.assertEqual((scenario_stats["count"], scenario_stats["matches"]), (2, 1))
+
+        equals, schema = sorted(snapshot["rules"], key=lambda stats: "VALID_JSON_SCHEMA" in stats["label"])
+        self.assertEqual((equals["count"], equals["match_rate"]), (2, 0.5))
+        self.assertEqual(schema["count"], 1)  # the plan stops at the failing EQUALS
+        for stats in snapshot["rules"]:
+            self.assertEqual(stats["total_ns"], stats["extract_ns"] + stats["operator_ns"])
+            self.assertEqual(sum(stats["histogram"].values()), stats["count"])
+
+    def test_sampling(self):
+        with collecting_metrics(MetricsRegistry(sample_rate=0.25)) as registry:
+            for _ in range(8):
+                self.scenario.evaluate({"method": "GET"})
+        self.assertEqual(registry.snapshot()["rule_sets"][0]["count"], 2)
+        with self.assertRaises(ValueError):
+            MetricsRegistry(sample_rate=0)
+
+    def test_exporters(self):
+        with collecting_metrics() as registry:
+            self.scenario.evaluate({"method": "POST", "body": {}})
+        self.assertEqual(json.loads(registry.to_json()), registry.snapshot())
+        text = registry.to_prometheus()
+        self.assertIn('ruleenginex_rule_set_evaluations_total{rule_set="Create order"} 1', text)
+        self.assertIn('ruleenginex_rule_set_duration_seconds_bucket{rule_set="Create order",le="+Inf"} 1', text)
+        self.assertIn("# TYPE ruleenginex_rule_duration_seconds histogram", text)
+        self.assertEqual(len(registry.top_rules(1)), 1)
+
+    def test_series_are_labelled_by_scenario_and_rule_index(self):
+        method = {"target": "method", "prop": "", "op": "EQUALS", "value": "POST"}
+        scenarios = [Scenario("first", [method], {}), Scenario("second", [method], {})]
+        with collecting_metrics() as registry:
+            for scenario in [*scenarios, Scenario("first", [method], {})]:  # a reloaded "first" too
+                scenario.evaluate({"method": "POST"})
+            for _ in range(2):
+                Rules([method]).evaluate({"method": "GET"})
+        snapshot = registry.snapshot()
+        counts = {stats["label"]: stats["count"] for stats in snapshot["rules"]}
+        self.assertEqual(counts, {"first[0]": 2, "second[0]": 1, repr(Rule(**method)): 2})
+        self.assertIn("EQUALS", snapshot["rules"][0]["description"])
+        (unnamed,) = (stats for stats in snapshot["rule_sets"] if stats["label"].startswith("rules@"))
+        self.assertEqual(unnamed["count"], 2)
+
+        series = [line for line in registry.to_prometheus().splitlines() if not line.startswith("#")]
+        self.assertEqual(len(series), len({line.rsplit(" ", 1)[0] for line in series}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,25 @@
+import math
+import re
+import sys
 import unittest
 
 from ruleenginex.constants import OperatorEnum
-from ruleenginex.exceptions import UnsupportedOperatorError
-from ruleenginex.operatorx import OperatorEvaluator
+from ruleenginex.exceptions import (
+    InvalidExpectedValueError,
+    InvalidJsonSchemaError,
+    InvalidRegexError,
+    RuleValidationError,
+    UnsupportedOperatorError,
+)
+from ruleenginex.operatorx import (
+    REGEX_CACHE,
+    SCHEMA_CACHE,
+    OperatorEvaluator,
+    fold_case,
+    literal_prefix,
+    regex_cache_info,
+    schema_cache_info,
+)
 
 
 class TestOperatorEvaluator(unittest.TestCase):
@@ -31,6 +48,22 @@ class TestOperatorEvaluator(unittest.TestCase):
         self.assertTrue(evaluator.apply("Hello World"))
         self.assertFalse(evaluator.apply("Hi World"))
 
+    def test_invalid_regex_fails_at_construction(self):
+        with self.assertRaises(InvalidRegexError):
+            OperatorEvaluator(OperatorEnum.REGEX, r"([a-z")
+        with self.assertRaises(RuleValidationError):
+            OperatorEvaluator(OperatorEnum.REGEX_CASE_INSENSITIVE, None)
+
+    def test_identical_patterns_share_compiled_regex(self):
+        REGEX_CACHE.clear()
+        first = OperatorEvaluator(OperatorEnum.REGEX, r"^Bearer ")
+        second = OperatorEvaluator(OperatorEnum.REGEX, r"^Bearer ")
+        insensitive = OperatorEvaluator(OperatorEnum.REGEX_CASE_INSENSITIVE, r"^Bearer ")
+        self.assertIs(first._pattern, second._pattern)
+        self.assertIsNot(first._pattern, insensitive._pattern)
+        info = regex_cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 2))
+
     def test_null_operator(self):
         evaluator = OperatorEvaluator(OperatorEnum.NULL, None)
         self.assertTrue(evaluator.apply(None))
@@ -51,11 +84,185 @@ class TestOperatorEvaluator(unittest.TestCase):
         self.assertTrue(evaluator.apply(valid_data))
         self.assertFalse(evaluator.apply(invalid_data))
 
+    def test_invalid_json_schema_fails_at_construction(self):
+        with self.assertRaises(InvalidJsonSchemaError):
+            OperatorEvaluator(OperatorEnum.VALID_JSON_SCHEMA, {"type": "not-a-type"})
+
+    def test_identical_schemas_share_validator(self):
+        SCHEMA_CACHE.clear()
+        first = OperatorEvaluator(OperatorEnum.VALID_JSON_SCHEMA, {"type": "object", "required": ["id"]})
+        second = OperatorEvaluator(OperatorEnum.VALID_JSON_SCHEMA, {"required": ["id"], "type": "object"})
+        self.assertIs(first._validator, second._validator)
+        self.assertEqual(schema_cache_info().hits, 1)
+        self.assertTrue(second.apply({"id": 1}))
+        self.assertFalse(second.apply({}))
+
+    def test_membership_operators(self):
+        members = ["a", "b", ["nested"]]
+        in_op = OperatorEvaluator(OperatorEnum.IN, members)
+        self.assertTrue(in_op.apply("a"))
+        self.assertTrue(in_op.apply(["nested"]))
+        self.assertFalse(in_op.apply("c"))
+        self.assertIsInstance(in_op._members.hashable, frozenset)
+
+        any_of = OperatorEvaluator(OperatorEnum.ANY_OF, members)
+        self.assertTrue(any_of.apply(["x", "b"]))
+        self.assertFalse(any_of.apply(["x"]))
+        self.assertFalse(any_of.apply("a"))
+
+        all_of = OperatorEvaluator(OperatorEnum.ALL_OF, members)
+        self.assertTrue(all_of.apply(["b", ["nested"], "x", "a"]))
+        self.assertFalse(all_of.apply(["a", "b"]))
+        self.assertTrue(OperatorEvaluator(OperatorEnum.ALL_OF, []).apply([]))
+
+        intersects = OperatorEvaluator(OperatorEnum.INTERSECTS, members)
+        self.assertTrue(intersects.apply("a"))
+        self.assertTrue(intersects.apply(["x", "a"]))
+        self.assertFalse(intersects.apply({"a": 1}))
+
+        for evaluator in (in_op, any_of, all_of, intersects):
+            compiled = evaluator.compile()
+            for value in ("a", "c", ["a", "b", ["nested"]], ["x"], {"a": 1}):
+                with self.subTest(operator=evaluator.operator, value=value):
+                    self.assertEqual(compiled(value), evaluator.apply(value))
+                    self.assertEqual(evaluator.apply_many([value]), [evaluator.apply(value)])
+
+    def test_membership_operators_require_a_collection(self):
+        for value in ("abc", 5, {"a": 1}):
+            with self.subTest(value=value), self.assertRaises(InvalidExpectedValueError):
+                OperatorEvaluator(OperatorEnum.ANY_OF, value)
+
+    def test_range_operators(self):
+        cases = {
+            OperatorEnum.GT: (1000, [(999, False), (1000, False), (1000.5, True), ("1001", True), ("1e9", True)]),
+            OperatorEnum.GTE: ("1000", [(999, False), (1000, True), ("1e3", True), ("1000.0", True)]),
+            OperatorEnum.LT: (0.5, [(0, True), (0.5, False), ("-3", True), (1, False)]),
+            OperatorEnum.LTE: (0, [(0, True), (-0.0, True), (0.1, False)]),
+            OperatorEnum.BETWEEN: (
+                [500, "599"],
+                [(499, False), (500, True), ("503", True), (599, True), (599.5, False)],
+            ),
+        }
+        not_numbers = [
+            (True, False),
+            (None, False),
+            ("abc", False),
+            ("nan", False),
+            (math.inf, False),
+            (-math.inf, False),
+        ]
+        not_numbers += [
+            (text, False) for text in ("1_000", " 42 ", "+1", "1.", ".5", "inf", "-Infinity", "1e999", "١٢")
+        ]
+        for operator, (expected_value, outcomes) in cases.items():
+            evaluator = OperatorEvaluator(operator, expected_value)
+            compiled = evaluator.compile()
+            self.assertEqual(evaluator.expected_value, expected_value)
+            for actual_value, expected in [*outcomes, *not_numbers]:
+                with self.subTest(operator=operator, actual_value=actual_value):
+                    self.assertEqual(evaluator.apply(actual_value), expected)
+                    self.assertEqual(compiled(actual_value), expected)
+                    self.assertEqual(evaluator.apply_many([actual_value]), [expected])
+        self.assertIsNone(OperatorEvaluator(OperatorEnum.EQUALS, 1).numeric_range)
+
+    def test_range_operators_coerce_expected_values_at_construction(self):
+        self.assertEqual(OperatorEvaluator(OperatorEnum.GT, "10").numeric_range.low, 10)
+        self.assertEqual(OperatorEvaluator(OperatorEnum.BETWEEN, (1, 2.5)).numeric_range[:2], (1, 2.5))
+        for operator, value in (
+            (OperatorEnum.GT, "ten"),
+            (OperatorEnum.LT, True),
+            (OperatorEnum.LTE, math.nan),
+            (OperatorEnum.GTE, [1]),
+            (OperatorEnum.BETWEEN, 5),
+            (OperatorEnum.BETWEEN, "12"),
+            (OperatorEnum.BETWEEN, [1, 2, 3]),
+            (OperatorEnum.BETWEEN, [2, 1]),
+            (OperatorEnum.BETWEEN, [1, None]),
+        ):
+            with self.subTest(operator=operator, value=value), self.assertRaises(InvalidExpectedValueError):
+                OperatorEvaluator(operator, value)
+
+    def test_apply_matches_agrees_with_apply_and_stops_early(self):
+        evaluators = [
+            OperatorEvaluator(OperatorEnum.ARRAY_INCLUDES, 2),
+            OperatorEvaluator(OperatorEnum.ANY_OF, [2, 9]),
+            OperatorEvaluator(OperatorEnum.ALL_OF, [1, 2]),
+            OperatorEvaluator(OperatorEnum.INTERSECTS, [2]),
+            OperatorEvaluator(OperatorEnum.EQUALS, [1, 2]),
+            OperatorEvaluator(OperatorEnum.EQUALS, [1, 2, 3]),
+            OperatorEvaluator(OperatorEnum.EQUALS, 2),
+            OperatorEvaluator(OperatorEnum.EMPTY_ARRAY, None),
+            OperatorEvaluator(OperatorEnum.NULL, None),
+            OperatorEvaluator(OperatorEnum.REGEX, r"\[3"),
+            OperatorEvaluator(OperatorEnum.GT, 1),
+        ]
+        for matches in ([], [2], [[2]], [None], [1, 2], [1, 2, 3], [3, 4, 5]):
+            for evaluator in evaluators:
+                extracted = matches[0] if len(matches) == 1 else matches
+                with self.subTest(operator=evaluator.operator, matches=matches):
+                    self.assertEqual(evaluator.apply_matches(iter(matches)), evaluator.apply(extracted))
+
+        stream = iter([1, 2, 3, 4])
+        self.assertTrue(OperatorEvaluator(OperatorEnum.ANY_OF, [2]).apply_matches(stream))
+        self.assertEqual(list(stream), [3, 4])
+        stream = iter([1, 2, 3, 4])
+        self.assertFalse(OperatorEvaluator(OperatorEnum.NULL, None).apply_matches(stream))
+        self.assertEqual(list(stream), [3, 4])
+
     def test_unsupported_operator(self):
         with self.assertRaises(UnsupportedOperatorError):
             evaluator = OperatorEvaluator("UNSUPPORTED_OPERATOR", None)
             evaluator.apply("test")
 
 
+class TestLiteralPrefix(unittest.TestCase):
+    def test_literal_prefix(self):
+        cases = [
+            (r"^/api/v1/users/\d+$", 0, ("/api/v1/users/", False)),
+            (r"\A/orders", 0, ("/orders", False)),
+            (r"/a\.b(c)", 0, ("/a.b", False)),
+            ("/ab*", 0, ("/a", False)),
+            ("/a|/b", 0, ("", False)),
+            (r"^/api/(users|orders)/", 0, ("/api/", False)),
+            (r"[|(]|x", 0, ("", False)),
+            (r"^/a[|]b", 0, ("/a", False)),
+            ("[/]x", 0, ("", False)),
+            (".*/users", 0, ("", False)),
+            (r"\/a\-b\d", 0, ("/a-b", False)),
+            ("/ab?", 0, ("/a", False)),
+            ("/x{2}", 0, ("/", False)),
+            ("/x+", 0, ("/x", False)),
+            ("/a b", re.VERBOSE, ("", False)),
+            ("(?x)/a b", 0, ("", False)),
+            ("/Users", re.IGNORECASE, ("/users", True)),
+            ("(?i)/Users", 0, ("/users", True)),
+            ("/Stra\u00dfe", re.IGNORECASE, ("/stra", True)),
+        ]
+        for pattern, flags, expected in cases:
+            with self.subTest(pattern=pattern, flags=flags):
+                self.assertEqual(literal_prefix(pattern, flags), expected)
+
+    def test_prefix_is_necessary_for_a_match(self):
+        patterns = [r"^/api/v\d+/users", "/Users/[0-9]+", "(?i)/KELVIN/x", r"/a\.b", "/s+x", "/ssx?", "/x|/ss"]
+        texts = ["/api/v2/users", "/users/12", "/Users/12", "/\u212aelvin/x", "/kelvin/x", "/a.b", "/ssx", "/x"]
+        for pattern in patterns:
+            for flags in (0, re.IGNORECASE):
+                prefix, ignore_case = literal_prefix(pattern, flags)
+                compiled = re.compile(pattern, flags)
+                for text in texts:
+                    if compiled.match(text):
+                        with self.subTest(pattern=pattern, flags=flags, text=text):
+                            self.assertTrue((fold_case(text) if ignore_case else text).startswith(prefix))
+
+    def test_fold_case_covers_every_ignorecase_letter_match(self):
+        letter = re.compile("[a-z]", re.IGNORECASE)
+        for code_point in range(sys.maxunicode + 1):
+            character = chr(code_point)
+            if letter.fullmatch(character):
+                folded = fold_case(character)
+                self.assertTrue(folded.isascii() and folded.islower(), character)
+                self.assertTrue(re.fullmatch(folded, character, re.IGNORECASE), character)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from ruleenginex.parallel import ParallelEvaluator
+from ruleenginex.rules import Rules
+from ruleenginex.scenario import Scenario
+
+
+def make_records(count):
+    return [
+        {"method": "POST" if i % 3 else "GET", "body": {"id": i, "tags": ["x"] if i % 2 else []}} for i in range(count)
+    ]
+
+
+class TestParallelEvaluator(unittest.TestCase):
+    def setUp(self):
+        self.rules = Rules(
+            [
+                {"target": "method", "prop": "", "op": "EQUALS", "value": "POST"},
+                {"target": "body", "prop": "tags", "op": "EMPTY_ARRAY", "value": None},
+            ]
+        )
+        self.scenarios = [
+            Scenario("get", [{"target": "method", "prop": "", "op": "EQUALS", "value": "GET"}], {"status": 200}),
+            Scenario("tagged", [{"target": "body", "prop": "$.tags[0]", "op": "EQUALS", "value": "x"}], {}),
+        ]
+        self.records = make_records(50)
+
+    def test_process_pool_matches_serial_evaluation(self):
+        with ParallelEvaluator(self.rules, max_workers=2, chunk_size=7, serial_threshold=0) as evaluator:
+            self.assertEqual(evaluator.evaluate(self.records), self.rules.evaluate_many(self.records))
+
+    def test_process_pool_matches_scenarios_in_order(self):
+        expected = [next((s for s in self.scenarios if s.evaluate(r)), None) for r in self.records]
+        with ParallelEvaluator(self.scenarios, max_workers=2, chunk_size=7, serial_threshold=0) as evaluator:
+            self.assertEqual(evaluator.match(self.records), expected)
+
+    def test_small_inputs_run_serially(self):
+        evaluator = ParallelEvaluator(self.rules, max_workers=2)
+        self.assertEqual(list(evaluator.evaluate(self.records[:3])), [0, 0, 1])
+        self.assertIsNone(evaluator._pool)
+
+    def test_wrong_mode_raises(self):
+        with self.assertRaises(TypeError):
+            ParallelEvaluator(self.rules).match(self.records)
+        with self.assertRaises(TypeError):
+            ParallelEvaluator(self.scenarios).evaluate(self.records)
+
+
+if __name__ == "__main__":
+    unittest.main()
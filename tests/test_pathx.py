@@ -0,0 +1,115 @@
+import unittest
+
+from ruleenginex.exceptions import JsonPathParsingError
+from ruleenginex.pathx import (
+    JSONPATH_CACHE,
+    compile_jsonpath,
+    compile_jsonpath_walker,
+    iter_jsonpath,
+    jsonpath_cache_info,
+)
+
+
+class TestCompileJsonPath(unittest.TestCase):
+    def setUp(self):
+        JSONPATH_CACHE.clear()
+
+    def test_shared_paths_are_parsed_once(self):
+        first = compile_jsonpath("$.user.id")
+        second = compile_jsonpath("$.user.id")
+        self.assertIs(first, second)
+        info = jsonpath_cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
+    def test_invalid_syntax_raises(self):
+        with self.assertRaises(JsonPathParsingError):
+            compile_jsonpath("$.user[")
+        self.assertEqual(jsonpath_cache_info().currsize, 0)
+
+
+class TestIterJsonPath(unittest.TestCase):
+    def setUp(self):
+        self.data = {
+            "users": [{"id": 1, "tags": ["a"]}, {"id": 2}, {"name": "x"}, {"id": 3, "tags": ["b", "c"]}],
+            "meta": {"id": 9},
+        }
+
+    def test_matches_find(self):
+        for path in (
+            "$.users[*].id",
+            "$.users[1:3]",
+            "$.users[::2].id",
+            "$.meta[*]",
+            "$..id",
+            "$.users[*].tags[*]",
+            "$.meta",
+            "$.missing[*]",
+        ):
+            expression = compile_jsonpath(path)
+            with self.subTest(path=path):
+                self.assertEqual(
+                    list(iter_jsonpath(expression, self.data)), [match.value for match in expression.find(self.data)]
+                )
+
+    def test_is_lazy(self):
+        visited = []
+
+        class Recording(dict):
+            def get(self, key, default=None):
+                visited.append(self["id"])
+                return super().get(key, default)
+
+        data = {"users": [Recording(id=i) for i in range(100)]}
+        matches = iter_jsonpath(compile_jsonpath("$.users[*].id"), data)
+        self.assertEqual(next(matches), 0)
+        self.assertEqual(next(matches), 1)
+        self.assertEqual(visited, [0, 1])
+
+        visited.clear()
+        values = compile_jsonpath_walker("$..id")(data)
+        self.assertEqual([next(values), next(values)], [0, 1])
+        self.assertEqual(visited, [0, 1])
+
+
+class TestJsonPathWalker(unittest.TestCase):
+    def test_matches_find(self):
+        data = {
+            "a": {"b": [1, {"c": 2, "id": 5}, [3, {"id": 6}]], "id": 1, "s": "str"},
+            "users": [{"id": 1, "tags": ["x"]}, {"id": None}, {"x": 1}],
+            "n": None,
+            "e": [],
+        }
+        paths = [
+            "$",
+            "$.a.b",
+            "$..id",
+            "$.a.b[-1][1].id",
+            "$.users[*].id",
+            "$.*",
+            "$['a','users']",
+            "$.a.b[0,1]",
+            "$.a.s[0]",
+            "$.a.s[*]",
+            "$.n[*]",
+            "$.e[*]",
+            "$.users[::2]",
+            "$.a..c",
+            "$..*",
+            "$.a.id[*]",
+            "$.users[5]",
+            "$.users[?(@.id)]",  # filters fall back to jsonpath_ng
+        ]
+        for path in paths:
+            with self.subTest(path=path):
+                self.assertEqual(
+                    list(compile_jsonpath_walker(path)(data)),
+                    [match.value for match in compile_jsonpath(path).find(data)],
+                )
+
+    def test_walkers_are_shared(self):
+        self.assertIs(compile_jsonpath_walker("$.a[*]"), compile_jsonpath_walker("$.a[*]"))
+
+
+if __name__ == "__main__":
+    unittest.main()
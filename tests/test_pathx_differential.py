@@ -0,0 +1,112 @@
+import random
+import unittest
+
+from ruleenginex.pathx import compile_jsonpath, compile_jsonpath_getter, compile_jsonpath_walker, is_simple_jsonpath
+
+KEYS = ["a", "b", "id", "items"]
+
+
+def reference(path, data):
+    """What Rule extracted through jsonpath_ng: the single match, else a list of all matches."""
+    results = [match.value for match in compile_jsonpath(path).find(data)]
+    return results[0] if len(results) == 1 else results
+
+
+def outcome(function, *args):
+    try:
+        return ("value", function(*args))
+    except Exception as e:
+        return ("error", type(e))
+
+
+def random_value(rng, depth):
+    roll = rng.random()
+    if depth <= 0 or roll < 0.3:
+        return rng.choice([None, 0, 1, -3, 2.5, True, False, "", "xyz", [], {}])
+    if roll < 0.65:
+        return {key: random_value(rng, depth - 1) for key in rng.sample(KEYS, rng.randint(0, len(KEYS)))}
+    return [random_value(rng, depth - 1) for _ in range(rng.randint(0, 4))]
+
+
+def random_path(rng):
+    steps = []
+    for _ in range(rng.randint(0, 4)):
+        roll = rng.random()
+        if roll < 0.55:
+            steps.append("." + rng.choice(KEYS))
+        elif roll < 0.8:
+            steps.append(f"[{rng.randint(-3, 3)}]")
+        else:
+            steps.append("[*]")
+    return "$" + "".join(steps)
+
+
+class TestSimpleJsonPathDifferential(unittest.TestCase):
+    """The native getter must agree with jsonpath_ng on every document, including errors."""
+
+    def assert_agrees(self, path, data):
+        expected = outcome(reference, path, data)
+        self.assertEqual(outcome(compile_jsonpath_getter(path), data), expected)
+        if expected[0] == "value":
+            walked = list(compile_jsonpath_walker(path)(data))
+            self.assertEqual(walked[0] if len(walked) == 1 else walked, expected[1])
+
+    def test_recognises_the_simple_subset(self):
+        for path in ("$", "$.a.b", "$.items[0].id", "$.items[*].id", "$[*][*]", "$.a[-1]"):
+            with self.subTest(path=path):
+                self.assertTrue(is_simple_jsonpath(path))
+        for path in ("$..id", "$.items[?(@.id > 1)]", "$.a[0,1]", "$['a','b']", "$.*", "$.a[1:2]", "$.a.`len`"):
+            with self.subTest(path=path):
+                self.assertFalse(is_simple_jsonpath(path))
+
+    def test_edge_cases(self):
+        documents = [
+            {},
+            {"a": None},
+            {"a": {"b": None}},
+            {"a": "text"},
+            {"a": 5},
+            {"a": [1]},
+            {"a": [[1, 2], {"b": 3}]},
+            {"items": [{"id": 1}, {"id": 2}, {"name": "x"}]},
+            {"items": [{"id": [7]}]},
+            {"items": {"id": 1}},
+            {"items": "ab"},
+            {"items": None},
+            [{"a": 1}, {"a": 2}],
+        ]
+        paths = [
+            "$",
+            "$.a",
+            "$.a.b",
+            "$.a[0]",
+            "$.a[-1]",
+            "$.a[5]",
+            "$.a[*]",
+            "$.a[*][*]",
+            "$.a[*].b",
+            "$.a[0][1]",
+            "$.items[*].id",
+            "$.items[0].id",
+            "$.items[*]",
+            "$.items[0]",
+            "$[*].a",
+            "$[0].a",
+        ]
+        for data in documents:
+            for path in paths:
+                with self.subTest(path=path, data=data):
+                    self.assert_agrees(path, data)
+
+    def test_random_documents(self):
+        rng = random.Random(20240101)  # noqa: S311
+        for _ in range(300):
+            data = random_value(rng, 4)
+            for _ in range(5):
+                path = random_path(rng)
+                with self.subTest(path=path, data=data):
+                    self.assert_agrees(path, data)
+
+
+if __name__ == "__main__":
+    unittest.main()
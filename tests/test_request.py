@@ -0,0 +1,140 @@
+import json
+import pickle
+import unittest
+
+from ruleenginex.dispatcher import Dispatcher
+from ruleenginex.request import Headers, RequestView, decode_query
+from ruleenginex.rule import Rule
+from ruleenginex.rules import Rules
+from ruleenginex.scenario import Scenario
+
+
+class TestHeaders(unittest.TestCase):
+    def setUp(self):
+        self.headers = Headers([(b"Content-Type", b"application/json"), (b"accept", b"a"), (b"Accept", b"b")])
+
+    def test_case_insensitive_lookup(self):
+        self.assertEqual(self.headers["content-type"], "application/json")
+        self.assertEqual(self.headers.get("CONTENT-TYPE"), "application/json")
+        self.assertIn("Content-type", self.headers)
+        self.assertIsNone(self.headers.get("missing"))
+        with self.assertRaises(KeyError):
+            self.headers["missing"]
+
+    def test_first_casing_is_kept_and_repeats_are_combined(self):
+        self.assertEqual(dict(self.headers), {"Content-Type": "application/json", "accept": "a, b"})
+
+    def test_accepts_a_mapping(self):
+        self.assertEqual(Headers({"X-Tenant": "acme"})["x-tenant"], "acme")
+
+
+class TestRequestView(unittest.TestCase):
+    def setUp(self):
+        self.view = self.make_view()
+        self.eager = {
+            "method": "POST",
+            "path": "/users",
+            "body": {"user": {"id": 7, "tags": ["admin"]}},
+            "headers": {"X-Tenant": "acme"},
+            "params": {"page": "2", "tag": ["a", "b"]},
+            "route_params": {"id": "7"},
+        }
+
+    def make_view(self):
+        return RequestView(
+            "POST",
+            b"/users",
+            body=b'{"user": {"id": 7, "tags": ["admin"]}}',
+            headers=[(b"X-Tenant", b"acme")],
+            params=b"page=2&tag=a&tag=b",
+            route_params={"id": "7"},
+        )
+
+    def test_targets_are_decoded_on_first_access(self):
+        self.assertFalse(self.view.is_decoded("body"))
+        self.assertEqual(self.view["body"], self.eager["body"])
+        self.assertTrue(self.view.is_decoded("body"))
+        self.assertIs(self.view["body"], self.view.get("body"))
+
+    def test_body_is_not_parsed_when_no_rule_reads_it(self):
+        rules = Rules(
+            [
+                {"target": "method", "prop": "", "op": "EQUALS", "value": "POST"},
+                {"target": "path", "prop": "", "op": "REGEX", "value": "^/users"},
+            ]
+        )
+        self.assertTrue(rules.evaluate(self.view))
+        self.assertTrue(rules.compile()(self.view))
+        self.assertFalse(self.view.is_decoded("body"))
+        self.assertFalse(self.view.is_decoded("headers"))
+
+    def test_rules_agree_with_eager_request_data(self):
+        definitions = [
+            {"target": "body", "prop": "user.id", "op": "EQUALS", "value": 7},
+            {"target": "body", "prop": "$.user.tags", "op": "ARRAY_INCLUDES", "value": "admin"},
+            {"target": "headers", "prop": "X-Tenant", "op": "EQUALS", "value": "acme"},
+            {"target": "params", "prop": "tag", "op": "ALL_OF", "value": ["a", "b"]},
+            {"target": "route_params", "prop": "id", "op": "EQUALS", "value": "7"},
+            {"target": "body", "prop": "user.name", "op": "NULL", "value": None},
+        ]
+        for definition in definitions:
+            rule = Rule(**definition)
+            with self.subTest(definition=definition):
+                self.assertEqual(rule.evaluate(self.make_view()), rule.evaluate(self.eager))
+        self.assertTrue(Rules(definitions).evaluate(self.view))
+
+    def test_header_rules_are_case_insensitive(self):
+        for prop in ("x-tenant", "X-TENANT", "$.x-tenant"):
+            with self.subTest(prop=prop):
+                self.assertTrue(Rule("headers", prop, "EQUALS", "acme").evaluate(self.view))
+
+    def test_dispatcher_accepts_views(self):
+        scenarios = [
+            Scenario("get", [{"target": "method", "prop": "", "op": "EQUALS", "value": "GET"}], {}),
+            Scenario(
+                "create",
+                [
+                    {"target": "method", "prop": "", "op": "EQUALS", "value": "POST"},
+                    {"target": "body", "prop": "user.id", "op": "EQUALS", "value": 7},
+                ],
+                {},
+            ),
+        ]
+        self.assertIs(Dispatcher(scenarios).match(self.view), scenarios[1])
+
+    def test_missing_and_empty_targets(self):
+        view = RequestView("GET", "/", body=b"")
+        self.assertNotIn("body", view)
+        self.assertEqual(view.get("body", {}), {})
+        self.assertTrue(Rule("body", "user", "NULL", None).evaluate(view))
+
+    def test_falsy_decoded_bodies_are_kept(self):
+        self.assertNotIn("body", RequestView(body=""))
+        self.assertTrue(Rule("body", "", "EMPTY_ARRAY", None).evaluate(RequestView(body=[])))
+        for body in ([], {}, False, 0):
+            with self.subTest(body=body):
+                self.assertIs(RequestView(body=body)["body"], body)
+
+    def test_non_json_body_decodes_to_text(self):
+        view = RequestView(body=b"plain \xff text")
+        self.assertEqual(view["body"], "plain � text")
+        self.assertTrue(Rule("body", "", "REGEX", "^plain").evaluate(view))
+
+    def test_behaves_like_the_decoded_dict(self):
+        self.assertTrue(self.view)
+        self.assertFalse(RequestView())
+        self.assertEqual(self.view, self.eager)
+        self.assertEqual(dict(self.view), self.eager)
+        self.assertEqual(len(self.view), len(self.eager))
+        self.assertEqual(json.loads(json.dumps(self.view)), self.eager)
+        self.assertEqual(pickle.loads(pickle.dumps(self.view)), self.eager)  # noqa: S301
+
+
+class TestDecodeQuery(unittest.TestCase):
+    def test_decode_query(self):
+        self.assertEqual(decode_query("?a=1&b=&a=2&a=3&c=%20x"), {"a": ["1", "2", "3"], "b": "", "c": " x"})
+        self.assertEqual(decode_query({"a": "1"}), {"a": "1"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,11 @@
 import unittest
 
-from ruleenginex.exceptions import InvalidTargetError, UnsupportedOperatorError
+from ruleenginex.exceptions import (
+    InvalidTargetError,
+    JsonPathParsingError,
+    RuleValidationError,
+    UnsupportedOperatorError,
+)
 from ruleenginex.rule import Rule
 
 
@@ -33,6 +38,52 @@ class TestRule(unittest.TestCase):
         with self.assertRaises(InvalidTargetError):
             Rule(target="invalid_target", prop="username", op="equals", value="admin")
 
+    def test_rule_extract(self):
+        request_data = {"body": {"user": {"id": 7}}, "method": "GET"}
+        self.assertEqual(Rule(target="body", prop="user.id", op="equals", value=7).extract(request_data), 7)
+        self.assertEqual(Rule(target="body", prop="$.user.id", op="equals", value=7).extract(request_data), 7)
+        self.assertEqual(Rule(target="method", prop="", op="equals", value="GET").extract(request_data), "GET")
+        self.assertEqual(Rule(target="path", prop="", op="equals", value="/").extract(request_data), {})
+
+    def test_rule_cost_estimate(self):
+        cheap = Rule(target="method", prop="", op="equals", value="GET")
+        dot_path = Rule(target="body", prop="user.id", op="equals", value=1)
+        regex = Rule(target="body", prop="user.id", op="regex", value=r"\d+")
+        deep = Rule(target="body", prop="$..id", op="equals", value=1)
+        schema = Rule(target="body", prop="", op="VALID_JSON_SCHEMA", value={"type": "object"})
+        self.assertLess(cheap.cost, dot_path.cost)
+        self.assertLess(dot_path.cost, regex.cost)
+        self.assertLess(regex.cost, deep.cost)
+        self.assertLess(regex.cost, schema.cost)
+
+    def test_rule_invalid_jsonpath_fails_at_construction(self):
+        with self.assertRaises(JsonPathParsingError):
+            Rule(target="body", prop="$.users[", op="equals", value="admin")
+
+    def test_rule_membership_with_jsonpath_agrees_with_extracted_value(self):
+        bodies = [
+            {"users": [{"id": 1}, {"id": 2}, {"id": 3}]},
+            {"users": [{"id": [2]}]},  # a single match is unwrapped
+            {"users": [{"id": 2}]},
+            {"users": []},
+        ]
+        rules = [
+            Rule(target="body", prop="$.users[*].id", op="ARRAY_INCLUDES", value=2),
+            Rule(target="body", prop="$.users[*].id", op="ANY_OF", value=[2, 7]),
+            Rule(target="body", prop="$.users[*].id", op="ALL_OF", value=[1, 3]),
+            Rule(target="body", prop="$.users[*].id", op="INTERSECTS", value=[2], invert=True),
+        ]
+        for body in bodies:
+            for rule in rules:
+                expected = rule.operator.apply(rule.extract({"body": body})) != rule.invert
+                with self.subTest(body=body, op=rule.operator.operator):
+                    self.assertEqual(rule.evaluate({"body": body}), expected)
+                    self.assertEqual(rule.compile()({"body": body}), expected)
+
+    def test_rule_membership_rejects_scalar_expected_value(self):
+        with self.assertRaises(RuleValidationError):
+            Rule(target="method", prop="", op="IN", value="GET")
+
 
 if __name__ == "__main__":
     unittest.main()
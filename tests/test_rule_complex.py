@@ -58,6 +58,37 @@ class TestRuleComplex(unittest.TestCase):
         request_data = {"body": {"user": "Alice", "age": 30}}
         assert rule.evaluate(request_data) is True  # The entire body should match schema
 
+    def test_rule_evaluate_many_matches_evaluate(self):
+        records = [
+            {"body": {"user": {"id": 1}, "tags": [], "users": [{"id": 1}, {"id": 2}]}},
+            {"body": {"user": {"id": 2}, "tags": ["x"], "users": [{"id": 3}]}},
+            {"body": {"user": None}},
+            {"body": "not a dict"},
+            {},
+        ]
+        rules = [
+            Rule(target="body", prop="user.id", op="equals", value=1),
+            Rule(target="body", prop="user.id", op="equals", value=1, invert=True),
+            Rule(target="body", prop="user", op="NULL", value=None),
+            Rule(target="body", prop="tags", op="EMPTY_ARRAY", value=None),
+            Rule(target="body", prop="$.users[*].id", op="ARRAY_INCLUDES", value=2),
+            Rule(target="body", prop="", op="VALID_JSON_SCHEMA", value={"type": "object"}),
+        ]
+        for rule in rules:
+            expected = [rule.evaluate(record) for record in records]
+            self.assertEqual([bool(result) for result in rule.evaluate_many(iter(records))], expected)
+
+    def test_rules_share_interned_strings_and_have_no_instance_dict(self):
+        first = Rule(
+            target="".join(["bo", "dy"]), prop="".join(["user.", "id"]), op="equals", value="".join(["ad", "min"])
+        )
+        second = Rule(target="body", prop="user.id", op="equals", value="admin")
+        self.assertIs(first.target, second.target)
+        self.assertIs(first.prop, second.prop)
+        self.assertIs(first.operator.expected_value, second.operator.expected_value)
+        self.assertFalse(hasattr(first, "__dict__"))
+        self.assertFalse(hasattr(first.operator, "__dict__"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,163 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from ruleenginex.rulebook import DirectoryWatcher, Rulebook
+from ruleenginex.scenario import Scenario
+
+
+def _definition(name, method, status=200):
+    return {
+        "scenario_name": name,
+        "rules": [{"target": "method", "prop": "", "op": "EQUALS", "value": method}],
+        "response": {"status": status},
+    }
+
+
+def _scenario(name, method, status=200):
+    return Scenario(**_definition(name, method, status))
+
+
+class TestRulebook(unittest.TestCase):
+    def setUp(self):
+        self.rulebook = Rulebook([_scenario("get", "GET"), _scenario("post", "POST")])
+
+    def test_add_update_remove(self):
+        self.rulebook.add(_scenario("put", "PUT"))
+        self.assertEqual(self.rulebook.match({"method": "PUT"}).scenario_name, "put")
+
+        self.rulebook.update(_scenario("get", "DELETE", 204))
+        self.assertIsNone(self.rulebook.match({"method": "GET"}))
+        self.assertEqual(self.rulebook.match({"method": "DELETE"}).get_response(), {"status": 204})
+        self.assertEqual([scenario.scenario_name for scenario in self.rulebook], ["get", "post", "put"])
+
+        self.rulebook.remove("post")
+        self.assertIsNone(self.rulebook.match({"method": "POST"}))
+        self.assertNotIn("post", self.rulebook)
+        self.assertEqual(self.rulebook.version, 3)
+
+    def test_invalid_changes(self):
+        with self.assertRaises(ValueError):
+            self.rulebook.add(_scenario("get", "GET"))
+        with self.assertRaises(KeyError):
+            self.rulebook.update(_scenario("missing", "GET"))
+        with self.assertRaises(KeyError):
+            self.rulebook.apply(upserts=[_scenario("put", "PUT")], removals=["missing"])
+        self.assertEqual(self.rulebook.version, 0)
+        with self.assertRaises(ValueError):
+            Rulebook([_scenario("dup", "GET"), _scenario("dup", "POST")])
+
+    def test_readers_keep_their_version(self):
+        version = self.rulebook.current
+        self.rulebook.remove("get")
+        self.assertEqual(version.match({"method": "GET"}).scenario_name, "get")
+        self.assertIsNone(self.rulebook.match({"method": "GET"}))
+
+    def test_unchanged_scenarios_are_shared(self):
+        post = self.rulebook.get("post")
+        self.rulebook.update(_scenario("get", "HEAD"))
+        self.assertIs(self.rulebook.get("post"), post)
+
+    def test_concurrent_readers_see_consistent_versions(self):
+        errors = []
+        stop = threading.Event()
+
+        def read():
+            while not stop.is_set():
+                version = self.rulebook.current
+                # "get" and "post" are always updated together, so a version has both or neither
+                if (version.match({"method": "GET"}) is None) != (version.match({"method": "POST"}) is None):
+                    errors.append(version.number)
+
+        readers = [threading.Thread(target=read) for _ in range(2)]
+        for reader in readers:
+            reader.start()
+        for i in range(200):
+            if i % 2:
+                self.rulebook.apply(upserts=[_scenario("get", "GET"), _scenario("post", "POST")])
+            else:
+                self.rulebook.apply(removals=["get", "post"])
+        stop.set()
+        for reader in readers:
+            reader.join()
+        self.assertEqual(errors, [])
+
+
+class TestDirectoryWatcher(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.directory = self._tmp.name
+        self.rulebook = Rulebook()
+        self.watcher = DirectoryWatcher(self.rulebook, self.directory)
+
+    def _write(self, name, definitions, mtime_ns):
+        path = os.path.join(self.directory, name)
+        with open(path, "w", encoding="utf-8") as fp:
+            json.dump(definitions, fp)
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        return path
+
+    def test_sync_applies_only_changed_files(self):
+        self._write("a.json", [_definition("a1", "GET"), _definition("a2", "POST")], 1)
+        self._write("b.yaml", _definition("b", "PUT"), 1)
+        self.assertEqual(self.watcher.sync().number, 1)
+        self.assertIsNone(self.watcher.sync())
+        b = self.rulebook.get("b")
+        a2 = self.rulebook.get("a2")
+
+        self._write("a.json", [_definition("a1", "HEAD"), _definition("a2", "POST")], 2)
+        self.watcher.sync()
+        self.assertEqual(self.rulebook.match({"method": "HEAD"}).scenario_name, "a1")
+        self.assertIs(self.rulebook.get("b"), b)
+        self.assertIs(self.rulebook.get("a2"), a2)
+
+        self._write("a.json", [_definition("a1", "HEAD")], 3)
+        os.remove(os.path.join(self.directory, "b.yaml"))
+        self.watcher.sync()
+        self.assertEqual([scenario.scenario_name for scenario in self.rulebook], ["a1"])
+
+    def test_sync_tells_equal_values_of_different_types_apart(self):
+        definition = {
+            "scenario_name": "flag",
+            "rules": [{"op": "EQUALS", "prop": "flag", "target": "body", "value": 1}],
+            "response": {"ok": 1},
+        }
+        self._write("a.json", [definition], 1)
+        self.watcher.sync()
+        scenario = self.rulebook.get("flag")
+
+        self._write("a.json", [definition], 2)  # touched, and rule keys in another order than to_dict
+        self.watcher.sync()
+        self.assertIs(self.rulebook.get("flag"), scenario)
+
+        for version, edit in enumerate(
+            ({"rules": [{**definition["rules"][0], "value": True}]}, {"response": {"ok": True}})
+        ):
+            definition = {**definition, **edit}
+            self._write("a.json", [definition], 3 + version)
+            self.watcher.sync()
+            self.assertIsNot(self.rulebook.get("flag"), scenario)
+            scenario = self.rulebook.get("flag")
+        self.assertIs(scenario.rules.rules[0].operator.expected_value, True)
+        self.assertIs(scenario.response["ok"], True)
+
+    def test_broken_file_leaves_rulebook_untouched(self):
+        self._write("a.json", [_definition("a", "GET")], 1)
+        self.watcher.sync()
+        path = os.path.join(self.directory, "a.json")
+        with open(path, "w", encoding="utf-8") as fp:
+            fp.write("[{not valid")
+        os.utime(path, ns=(2, 2))
+        with self.assertRaises(Exception):  # noqa: B017
+            self.watcher.sync()
+        self.assertEqual(self.rulebook.match({"method": "GET"}).scenario_name, "a")
+
+    def test_duplicate_names_across_files(self):
+        self._write("a.json", [_definition("same", "GET")], 1)
+        self._write("b.json", [_definition("same", "POST")], 1)
+        with self.assertRaises(ValueError):
+            self.watcher.sync()
+        self.assertEqual(len(self.rulebook), 0)
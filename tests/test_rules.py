@@ -1,5 +1,8 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
+from ruleenginex.rule import Rule
 from ruleenginex.rules import Rules
 
 
@@ -22,11 +25,47 @@ class TestRules(unittest.TestCase):
         request_data = {"body": {"username": "admin", "age": 25}}  # Age does not match
         self.assertFalse(rules.evaluate(request_data))
 
+    def test_shared_paths_are_extracted_once_per_evaluation(self):
+        rules = Rules(
+            [
+                {"target": "body", "prop": "user.id", "op": "EQUALS", "value": 7},
+                {"target": "body", "prop": "user.id", "op": "REGEX", "value": "^7$"},
+                {"target": "body", "prop": "user.id", "op": "NULL", "value": None, "invert": True},
+            ]
+        )
+        request_data = {"body": {"user": {"id": 7}}}
+        with mock.patch.object(
+            Rule, "_extract_from_target", autospec=True, side_effect=lambda _, data: data["user"]["id"]
+        ) as extract:
+            self.assertTrue(rules.evaluate(request_data))
+            self.assertEqual(extract.call_count, 1)
+            context = {}
+            self.assertTrue(rules.evaluate(request_data, context))
+            self.assertEqual(context, {("body", "user.id"): 7})
+
     def test_empty_rules_list(self):
         rules = Rules([])
         request_data = {"body": {"username": "admin"}}
         self.assertTrue(rules.evaluate(request_data))  # No rules means always True
 
 
+class TestRulesAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_aevaluate_offloads_expensive_rules(self):
+        rules = Rules(
+            [
+                {"target": "method", "prop": "", "op": "EQUALS", "value": "POST"},
+                {"target": "body", "prop": "", "op": "VALID_JSON_SCHEMA", "value": {"required": ["id"]}},
+            ]
+        )
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertTrue(await rules.aevaluate({"method": "POST", "body": {"id": 1}}, executor))
+            self.assertFalse(await rules.aevaluate({"method": "POST", "body": {}}, executor))
+            self.assertFalse(await rules.aevaluate({"method": "GET", "body": {"id": 1}}, executor))
+
+    async def test_aevaluate_inline_only(self):
+        rules = Rules([{"target": "method", "prop": "", "op": "EQUALS", "value": "POST"}])
+        self.assertTrue(await rules.aevaluate({"method": "POST"}, cost_threshold=100))
+
+
 if __name__ == "__main__":
     unittest.main()
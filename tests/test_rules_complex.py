@@ -1,5 +1,6 @@
 import unittest
 
+from ruleenginex.metrics import MetricsRegistry, collecting_metrics
 from ruleenginex.rules import Rules
 
 
@@ -32,6 +33,61 @@ class TestRulesComplex(unittest.TestCase):
         request_data = {"body": {"status": "active"}}
         self.assertFalse(rules.evaluate(request_data))  # Conflicting rules
 
+    def test_rules_evaluate_many_matches_evaluate(self):
+        rules = Rules(
+            [
+                {"target": "method", "prop": "", "op": "EQUALS", "value": "POST"},
+                {"target": "body", "prop": "$.items[*].sku", "op": "ARRAY_INCLUDES", "value": "ABC-123"},
+            ]
+        )
+        records = [
+            {"method": "POST", "body": {"items": [{"sku": "ABC-123"}, {"sku": "XYZ"}]}},
+            {"method": "GET", "body": {"items": [{"sku": "ABC-123"}, {"sku": "XYZ"}]}},
+            {"method": "POST", "body": {"items": []}},
+        ]
+        self.assertEqual(list(rules.evaluate_many(records)), [1, 0, 0])
+        self.assertEqual(list(Rules([]).evaluate_many(records)), [1, 1, 1])
+        self.assertEqual(len(rules.evaluate_many([])), 0)
+
+    def test_plan_runs_cheap_rules_first(self):
+        rules = Rules(
+            [
+                {"target": "body", "prop": "", "op": "VALID_JSON_SCHEMA", "value": {"type": "object"}},
+                {"target": "body", "prop": "$..id", "op": "ARRAY_INCLUDES", "value": 1},
+                {"target": "body", "prop": "name", "op": "REGEX", "value": "^a"},
+                {"target": "method", "prop": "", "op": "EQUALS", "value": "GET"},
+            ]
+        )
+        self.assertEqual([rule.operator.operator.name for rule in rules.plan][:2], ["EQUALS", "REGEX"])
+        self.assertEqual([rule.target for rule in rules.rules][-1], "method")  # declaration order is kept
+
+    def test_adaptive_plan_promotes_selective_rules(self):
+        definitions = [
+            {"target": "body", "prop": "kind", "op": "EQUALS", "value": "a"},  # usually passes
+            {"target": "body", "prop": "flag", "op": "EQUALS", "value": True},  # usually fails
+        ]
+        adaptive = Rules(definitions, adaptive=True)
+        static = Rules(definitions)
+        records = [{"body": {"kind": "a", "flag": i % 10 == 0}} for i in range(50)]
+        for record in records:
+            self.assertEqual(adaptive.evaluate(record), static.evaluate(record))
+        adaptive.replan()
+        self.assertEqual(adaptive.plan[0].prop, "flag")
+        for record in records:
+            self.assertEqual(adaptive.evaluate(record), static.evaluate(record))
+
+    def test_adaptive_plan_keeps_learning_while_metrics_are_collected(self):
+        definitions = [
+            {"target": "body", "prop": "kind", "op": "EQUALS", "value": "a"},
+            {"target": "body", "prop": "flag", "op": "EQUALS", "value": True},
+        ]
+        adaptive = Rules(definitions, adaptive=True)
+        records = [{"body": {"kind": "a", "flag": i % 10 == 0}} for i in range(Rules.REPLAN_INTERVAL)]
+        with collecting_metrics(MetricsRegistry(sample_rate=0.01)):
+            for record in records:
+                adaptive.evaluate(record)
+        self.assertEqual(adaptive.plan[0].prop, "flag")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -31,6 +31,23 @@ class TestScenario(unittest.TestCase):
         )
         self.assertEqual(scenario.get_response(), expected_response)
 
+    def test_scenario_to_dict_round_trips(self):
+        definition = {
+            "scenario_name": "Valid Login",
+            "rules": [{"target": "body", "prop": "username", "op": "EQUALS", "value": "admin", "invert": False}],
+            "response": {"status": 200},
+        }
+        self.assertEqual(Scenario(**definition).to_dict(), definition)
+
+    def test_scenario_evaluate_many(self):
+        scenario = Scenario(
+            scenario_name="Valid Login",
+            rules=[{"target": "body", "prop": "username", "op": "EQUALS", "value": "admin"}],
+            response={"status": 200},
+        )
+        records = [{"body": {"username": "admin"}}, {"body": {"username": "user"}}]
+        self.assertEqual(list(scenario.evaluate_many(records)), [1, 0])
+
 
 if __name__ == "__main__":
     unittest.main()
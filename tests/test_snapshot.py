@@ -0,0 +1,98 @@
+import gc
+import os
+import tempfile
+import unittest
+
+from ruleenginex.exceptions import SnapshotError
+from ruleenginex.rules import Rules
+from ruleenginex.scenario import Scenario
+from ruleenginex.snapshot import load_snapshot, save_snapshot
+
+
+def _scenarios():
+    return [
+        Scenario(
+            "get_user",
+            [
+                {"target": "method", "prop": "", "op": "EQUALS", "value": "GET"},
+                {"target": "path", "prop": "", "op": "REGEX", "value": r"^/users/\d+$"},
+                {"target": "body", "prop": "$.user.tags", "op": "ARRAY_INCLUDES", "value": "admin", "invert": True},
+            ],
+            {"status": 200, "body": {"id": 1}},
+        ),
+        Scenario("fallback", [], {"status": 404}),
+    ]
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = os.path.join(self._tmp.name, "rulebook.snap")
+
+    def test_round_trip(self):
+        scenarios = _scenarios()
+        digest = save_snapshot(scenarios, self.path)
+        loaded = load_snapshot(self.path)
+
+        self.assertEqual(len(digest), 64)
+        self.assertEqual([s.to_dict() for s in loaded], [s.to_dict() for s in scenarios])
+        request = {"method": "GET", "path": "/users/7", "body": {"user": {"tags": ["guest"]}}}
+        self.assertTrue(loaded[0].evaluate(request))
+        self.assertFalse(loaded[0].evaluate({**request, "path": "/users/x"}))
+        self.assertEqual([rule.cost for rule in loaded[0].rules.plan], [rule.cost for rule in scenarios[0].rules.plan])
+
+    def test_round_trip_keeps_value_types_and_adaptive_plans(self):
+        scenarios = [
+            Scenario(f"s{i}", [{"target": "body", "prop": "x", "op": "EQUALS", "value": value}], {})
+            for i, value in enumerate([(1,), (True,), 0.0, -0.0, [1], [1.0]])
+        ]
+        scenarios.append(Scenario.from_rules("adaptive", Rules([], adaptive=True), {}))
+        save_snapshot(scenarios, self.path)
+        loaded = load_snapshot(self.path)
+
+        self.assertEqual(
+            [repr(scenario.to_dict()) for scenario in loaded], [repr(scenario.to_dict()) for scenario in scenarios]
+        )
+        self.assertEqual([scenario.rules.adaptive for scenario in loaded], [False] * 6 + [True])
+
+    def test_rejects_corrupt_payload(self):
+        save_snapshot(_scenarios(), self.path)
+        with open(self.path, "r+b") as fp:
+            fp.seek(-1, os.SEEK_END)
+            last = fp.read(1)
+            fp.seek(-1, os.SEEK_END)
+            fp.write(bytes([last[0] ^ 0xFF]))
+        with self.assertRaisesRegex(SnapshotError, "hash"):
+            load_snapshot(self.path)
+
+    def test_rejects_truncated_and_foreign_files(self):
+        save_snapshot(_scenarios(), self.path)
+        with open(self.path, "r+b") as fp:
+            fp.truncate(os.path.getsize(self.path) - 4)
+        with self.assertRaisesRegex(SnapshotError, "truncated"):
+            load_snapshot(self.path)
+
+        with open(self.path, "wb") as fp:
+            fp.write(b"not a snapshot at all, but long enough to hold a header")
+        with self.assertRaisesRegex(SnapshotError, "not a rulebook snapshot"):
+            load_snapshot(self.path)
+
+        with open(self.path, "wb"):
+            pass
+        with self.assertRaises(SnapshotError):
+            load_snapshot(self.path)
+
+    def test_rejects_values_marshal_cannot_store(self):
+        scenario = Scenario("s", [], {"status": 200, "body": object()})
+        with self.assertRaises(SnapshotError):
+            save_snapshot([scenario], self.path)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_freeze_keeps_collector_state(self):
+        save_snapshot(_scenarios(), self.path)
+        self.addCleanup(gc.unfreeze)
+        loaded = load_snapshot(self.path, freeze=True)
+        self.assertTrue(gc.isenabled())
+        self.assertGreater(gc.get_freeze_count(), 0)
+        self.assertEqual(len(loaded), 2)
@@ -0,0 +1,60 @@
+import gzip
+import io
+import os
+import tempfile
+import unittest
+
+from ruleenginex.rules import Rules
+from ruleenginex.stream import FilterStats, filter_lines, filter_stream, iter_lines, open_input
+
+LINES = [
+    b'{"type": "purchase", "amount": 10}',
+    b'{"type":"refund","amount":5}',
+    b"",
+    b"not json",
+    b'{"type": "purchase",   "amount": 99}',
+]
+
+
+class TestStream(unittest.TestCase):
+    def setUp(self):
+        self.rules = Rules([{"target": "body", "prop": "type", "op": "EQUALS", "value": "purchase"}])
+
+    def test_iter_lines_handles_small_chunks(self):
+        data = b"\n".join(LINES)
+        self.assertEqual(list(iter_lines(io.BytesIO(data), chunk_size=3)), LINES)
+        self.assertEqual(list(iter_lines(io.BytesIO(data + b"\n"), chunk_size=3)), LINES)
+        self.assertEqual(list(iter_lines(io.BytesIO(b"x" * 1000), chunk_size=7)), [b"x" * 1000])
+        self.assertEqual(list(iter_lines(io.BytesIO(b"ab\n\ncd\n"), chunk_size=2)), [b"ab", b"", b"cd"])
+
+    def test_filter_lines_yields_original_bytes(self):
+        stats = FilterStats()
+        matched = list(filter_lines(self.rules, LINES, batch_size=2, stats=stats))
+        self.assertEqual(matched, [LINES[0], LINES[4]])
+        self.assertEqual((stats.records, stats.matched, stats.errors), (4, 2, 1))
+        self.assertGreater(stats.records_per_sec, 0)
+
+    def test_filter_lines_full_request_records(self):
+        lines = [b'{"method": "GET"}', b'{"method": "POST"}']
+        rules = Rules([{"target": "method", "prop": "", "op": "EQUALS", "value": "POST"}])
+        self.assertEqual(list(filter_lines(rules, lines, target=None)), [lines[1]])
+
+        stats = FilterStats()
+        lines = [b"[1, 2]", b'{"method": "POST"}', b'"POST"', b"null"]
+        self.assertEqual(list(filter_lines(rules, lines, target=None, stats=stats)), [lines[1]])
+        self.assertEqual((stats.records, stats.matched, stats.errors), (4, 1, 3))
+
+    def test_filter_stream_reads_gzip_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "events.ndjson.gz")
+            with gzip.open(path, "wb") as fp:
+                fp.write(b"\n".join(LINES))
+            sink = io.BytesIO()
+            with open_input(path) as source:
+                stats = filter_stream(self.rules, source, sink)
+        self.assertEqual(sink.getvalue(), LINES[0] + b"\n" + LINES[4] + b"\n")
+        self.assertEqual(stats.matched, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
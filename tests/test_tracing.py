@@ -0,0 +1,60 @@
+import unittest
+
+from ruleenginex.rule import Rule
+from ruleenginex.rules import Rules
+from ruleenginex.tracing import Tracer, active_tracer, tracing
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.rules = Rules(
+            [
+                {"target": "method", "prop": "", "op": "EQUALS", "value": "POST"},
+                {"target": "body", "prop": "user.name", "op": "REGEX", "value": "^A"},
+            ]
+        )
+
+    def test_tracing_is_off_by_default(self):
+        self.assertIsNone(active_tracer())
+        self.assertTrue(self.rules.evaluate({"method": "POST", "body": {"user": {"name": "Alice"}}}))
+
+    def test_records_deciding_rule(self):
+        with tracing(Tracer(capacity=10)) as tracer:
+            self.assertFalse(self.rules.evaluate({"method": "POST", "body": {"user": {"name": "Bob"}}}))
+        self.assertIsNone(active_tracer())
+
+        rule_events = [event for event in tracer.events if event.scope == "rule"]
+        (decision,) = [event for event in tracer.events if event.scope == "rules"]
+        self.assertEqual([event.value for event in rule_events], ["'POST'", "'Bob'"])
+        self.assertFalse(decision.result)
+        self.assertEqual(decision.rule.prop, "user.name")
+        self.assertGreaterEqual(decision.elapsed_ns, 0)
+
+    def test_ring_buffer_and_sink(self):
+        received = []
+        rule = Rule(target="body", prop="", op="NULL", value=None)
+        with tracing(Tracer(capacity=2, sink=received.append)) as tracer:
+            for _ in range(5):
+                rule.evaluate({"body": None})
+        self.assertEqual(len(tracer.events), 2)
+        self.assertEqual(len(received), 5)
+
+    def test_value_summaries_are_bounded(self):
+        body = {"items": list(range(100_000))}
+        self.assertLess(len(Tracer(max_value_length=20).summarize(body)), 100)
+        self.assertEqual(len(Tracer(value_mode="hash").summarize(body)), 40)
+
+    def test_hashing_unsortable_values_does_not_change_results(self):
+        body = {1: "a", "b": 2}
+        rule = Rule(target="body", prop="", op="EQUALS", value=dict(body))
+        with tracing(Tracer(value_mode="hash")) as tracer:
+            self.assertTrue(rule.evaluate({"body": body}))
+        self.assertEqual(len(tracer.events[0].value), 40)
+        self.assertNotEqual(tracer.summarize(body), tracer.summarize({1: "a", "b": 3}))
+        self.assertIsNone(Tracer(value_mode="none").summarize(body))
+        with self.assertRaises(ValueError):
+            Tracer(value_mode="full")
+
+
+if __name__ == "__main__":
+    unittest.main()